@@ -7,10 +7,22 @@ from .components import (
     Counter,
     ProgramCounter,
     Memory,
+    Tracer,
     Controller,
     ALU,
 )
 from .computer import Computer
 from .instructions import Instruction, Instructions, Step
 from .programs import Statement, Program, operands, references
-from . import components, instructions, programs
+from .engines import (
+    Engine,
+    Profiler,
+    Interpreter,
+    Codegen,
+    Batch,
+    Runner,
+    run_many,
+    Trace,
+    Netlist,
+)
+from . import components, engines, instructions, programs, workloads
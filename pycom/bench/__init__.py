@@ -0,0 +1 @@
+from .bench import Bench
@@ -0,0 +1,51 @@
+import argparse
+import pathlib
+import sys
+from pycom.bench import bench
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m pycom.bench",
+        description="measure simulator throughput and compare against a baseline",
+    )
+    parser.add_argument(
+        "--engine", choices=sorted(bench.Bench.ENGINES), default="computer"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1024, 8192, 65536]
+    )
+    parser.add_argument("--ticks", type=int, default=20000)
+    parser.add_argument("--instructions", type=int, default=500)
+    parser.add_argument(
+        "--output", type=pathlib.Path, default=pathlib.Path("bench.json")
+    )
+    parser.add_argument("--baseline", type=pathlib.Path)
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    results = bench.Bench(
+        engine=args.engine,
+        repeat=args.repeat,
+        sizes=args.sizes,
+        ticks=args.ticks,
+        instructions=args.instructions,
+    ).run()
+    for result in results:
+        print(f"{result.name:<64} {result.value:>14.6g} {result.unit}")
+    bench.Bench.save(results, args.output)
+    if args.baseline is not None:
+        regressions = bench.Bench.compare(
+            results, bench.Bench.load(args.baseline), args.threshold
+        )
+        for regression in regressions:
+            print(
+                f"regression {regression.name}: {regression.baseline:.6g} -> {regression.value:.6g} ({regression.change:+.1%})"
+            )
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
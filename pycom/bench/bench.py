@@ -0,0 +1,261 @@
+import dataclasses
+import json
+import pathlib
+import time
+import typing
+from pycom import computer
+from pycom.components import errorable
+from pycom.engines import codegen, engine as engine_lib, interpreter, netlist
+from pycom.instructions import instructions
+from pycom.programs import operands, program
+from pycom.workloads import workload, workloads as workloads_lib
+
+
+class Bench(errorable.Errorable):
+    VERSION = 1
+
+    Factory: typing.TypeAlias = typing.Callable[..., engine_lib.Engine]
+
+    ENGINES: typing.ClassVar[typing.Mapping[str, Factory]] = {
+        "computer": computer.Computer,
+        "interpreter": interpreter.Interpreter,
+        "codegen": codegen.Codegen,
+        "netlist": netlist.Netlist,
+    }
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Result:
+        name: str
+        value: float
+        unit: str
+        higher_is_better: bool = False
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Regression:
+        name: str
+        baseline: float
+        value: float
+
+        @property
+        def change(self) -> float:
+            return self.value / self.baseline - 1 if self.baseline else 0.0
+
+    def __init__(
+        self,
+        *,
+        engine: str = "computer",
+        repeat: int = 3,
+        sizes: typing.Sequence[int] = (100, 1024, 8192, 65536),
+        ticks: int = 20000,
+        instructions: int = 500,
+        workloads: typing.Optional[typing.Sequence[workload.Workload]] = None,
+    ) -> None:
+        if engine not in self.ENGINES:
+            raise self.Error(
+                f"unknown engine {engine}: engines are {sorted(self.ENGINES)}"
+            )
+        if repeat <= 0:
+            raise self.Error(f"invalid repeat {repeat}")
+        self.engine = engine
+        self.repeat = repeat
+        self.sizes = sizes
+        self.ticks = ticks
+        self.instructions = instructions
+        self.workloads = workloads if workloads is not None else workloads_lib.corpus()
+
+    def time(self, func: typing.Callable[[], typing.Any]) -> float:
+        best = float("inf")
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def build(self, program: program.Program) -> engine_lib.Engine:
+        return self.ENGINES[self.engine](data=program.output().data)
+
+    def rate(
+        self,
+        program: program.Program,
+        run: typing.Callable[[engine_lib.Engine], int],
+    ) -> float:
+        best = 0.0
+        for _ in range(self.repeat):
+            engine = self.build(program)
+            start = time.perf_counter()
+            count = run(engine)
+            best = max(best, count / (time.perf_counter() - start))
+        return best
+
+    def bench_construction(self) -> typing.Iterator[Result]:
+        yield self.Result(
+            name="computer.construct",
+            value=self.time(computer.Computer),
+            unit="s",
+        )
+        source = computer.Computer()
+        source.fork()
+        snapshot = source.snapshot()
+        yield self.Result(name="computer.fork", value=self.time(source.fork), unit="s")
+        yield self.Result(
+            name="computer.restore",
+            value=self.time(lambda: source.restore(snapshot)),
+            unit="s",
+        )
+
+        def entries() -> None:
+            instructions.Instructions.invalidate()
+            instructions.Instructions.entries()
+
+        yield self.Result(
+            name="instructions.entries", value=self.time(entries), unit="s"
+        )
+
+    def bench_programs(self) -> typing.Iterator[Result]:
+        for size in self.sizes:
+            values = [instructions.Instructions.NOP.value.opcodes[0]] * size
+            built = program.Program.build(*values)
+            yield self.Result(
+                name=f"program.build.{size}",
+                value=self.time(lambda: program.Program.build(*values)),
+                unit="s",
+            )
+            yield self.Result(
+                name=f"program.output.{size}",
+                value=self.time(built.output),
+                unit="s",
+            )
+
+    def bench_ticks(self) -> typing.Iterator[Result]:
+        count = workloads_lib.count()
+
+        def run(engine: engine_lib.Engine) -> int:
+            ticks = 0
+            while not engine.halted and ticks < self.ticks:
+                ticks += engine.run_instruction()
+            return ticks
+
+        yield self.Result(
+            name=f"{self.engine}.ticks_per_second",
+            value=self.rate(count.program, run),
+            unit="ticks/s",
+            higher_is_better=True,
+        )
+
+    @staticmethod
+    def operand(
+        operand_type: typing.Type[operands.Operand], index: int
+    ) -> operands.Operand:
+        match operand_type:
+            case operands.None_:
+                return operands.None_()
+            case operands.Immediate:
+                return operands.Immediate(index % 0x100)
+            case operands.Absolute:
+                return operands.Absolute(0x8000 + index % 0x100)
+            case operands.Relative:
+                return operands.Relative(f"l{index + 1}")
+            case _:
+                raise Bench.Error(f"unsupported operand type {operand_type.__name__}")
+
+    def opcode_program(
+        self,
+        instruction: instructions.Instructions,
+        operand_type: typing.Type[operands.Operand],
+    ) -> program.Program:
+        if instruction is instructions.Instructions.JMP:
+            return program.Program.build("loop", instruction(operands.Absolute("loop")))
+        return program.Program.build(
+            *[
+                entry
+                for index in range(self.instructions)
+                for entry in (
+                    f"l{index}",
+                    instruction(self.operand(operand_type, index)),
+                )
+            ],
+            f"l{self.instructions}",
+        )
+
+    def run_instructions(self, engine: engine_lib.Engine) -> int:
+        engine.run_instructions(self.instructions)
+        return self.instructions
+
+    def bench_opcodes(self) -> typing.Iterator[Result]:
+        for instruction in instructions.Instructions:
+            for operand_type in instruction.value.operand_instances:
+                yield self.Result(
+                    name=f"{self.engine}.instructions_per_second.{instruction.name}.{operand_type.__name__}",
+                    value=self.rate(
+                        self.opcode_program(instruction, operand_type),
+                        self.run_instructions,
+                    ),
+                    unit="instructions/s",
+                    higher_is_better=True,
+                )
+
+    def bench_workloads(self) -> typing.Iterator[Result]:
+        for workload in self.workloads:
+            engine = self.build(workload.program)
+            workload.run(engine)
+            yield self.Result(
+                name=f"{self.engine}.workload.{workload.name}",
+                value=self.time(lambda: workload.run(self.build(workload.program))),
+                unit="s",
+            )
+
+    def run(self) -> typing.Sequence[Result]:
+        return [
+            *self.bench_construction(),
+            *self.bench_programs(),
+            *self.bench_ticks(),
+            *self.bench_opcodes(),
+            *self.bench_workloads(),
+        ]
+
+    @classmethod
+    def save(cls, results: typing.Sequence[Result], path: pathlib.Path) -> None:
+        path.write_text(
+            json.dumps(
+                {
+                    "version": cls.VERSION,
+                    "results": [dataclasses.asdict(result) for result in results],
+                },
+                indent=2,
+            )
+        )
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> typing.Sequence[Result]:
+        data = json.loads(path.read_text())
+        if data.get("version") != cls.VERSION:
+            raise cls.Error(
+                f"unsupported bench version {data.get('version')} in {path}"
+            )
+        return [cls.Result(**result) for result in data["results"]]
+
+    @classmethod
+    def compare(
+        cls,
+        results: typing.Sequence[Result],
+        baseline: typing.Sequence[Result],
+        threshold: float = 0.1,
+    ) -> typing.Sequence[Regression]:
+        baseline_by_name = {result.name: result for result in baseline}
+        regressions: list[Bench.Regression] = []
+        for result in results:
+            if (previous := baseline_by_name.get(result.name)) is None:
+                continue
+            if (
+                result.value < previous.value * (1 - threshold)
+                if result.higher_is_better
+                else result.value > previous.value * (1 + threshold)
+            ):
+                regressions.append(
+                    cls.Regression(
+                        name=result.name,
+                        baseline=previous.value,
+                        value=result.value,
+                    )
+                )
+        return regressions
@@ -0,0 +1,90 @@
+import pathlib
+import tempfile
+import unittest
+import pycom
+from pycom import bench
+
+
+class BenchTest(unittest.TestCase):
+    def test_invalid_engine(self) -> None:
+        with self.assertRaises(bench.Bench.Error):
+            bench.Bench(engine="invalid")
+
+    def test_invalid_repeat(self) -> None:
+        with self.assertRaises(bench.Bench.Error):
+            bench.Bench(repeat=0)
+
+    def test_run(self) -> None:
+        for engine in ["computer", "interpreter"]:
+            with self.subTest(engine=engine):
+                results = bench.Bench(
+                    engine=engine,
+                    repeat=1,
+                    sizes=[10],
+                    ticks=100,
+                    instructions=3,
+                    workloads=[pycom.workloads.count(3)],
+                ).run()
+                names = {result.name for result in results}
+                self.assertIn("computer.construct", names)
+                self.assertIn("computer.fork", names)
+                self.assertIn("computer.restore", names)
+                self.assertIn("instructions.entries", names)
+                self.assertIn("program.build.10", names)
+                self.assertIn("program.output.10", names)
+                self.assertIn(f"{engine}.ticks_per_second", names)
+                self.assertIn(f"{engine}.instructions_per_second.BNE.Relative", names)
+                self.assertIn(f"{engine}.workload.count_3", names)
+                self.assertTrue(all(result.value > 0 for result in results))
+
+    def test_save_load(self) -> None:
+        path = (
+            pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+            / "bench.json"
+        )
+        results = [
+            bench.Bench.Result(name="a", value=1.5, unit="s"),
+            bench.Bench.Result(
+                name="b", value=2.0, unit="ticks/s", higher_is_better=True
+            ),
+        ]
+        bench.Bench.save(results, path)
+        self.assertEqual(bench.Bench.load(path), results)
+        path.write_text('{"version": 0, "results": []}')
+        with self.assertRaises(bench.Bench.Error):
+            bench.Bench.load(path)
+
+    def test_compare(self) -> None:
+        baseline = [
+            bench.Bench.Result(name="time", value=1.0, unit="s"),
+            bench.Bench.Result(
+                name="rate", value=100.0, unit="ticks/s", higher_is_better=True
+            ),
+        ]
+        self.assertEqual(
+            bench.Bench.compare(
+                [
+                    bench.Bench.Result(name="time", value=1.05, unit="s"),
+                    bench.Bench.Result(
+                        name="rate", value=95.0, unit="ticks/s", higher_is_better=True
+                    ),
+                    bench.Bench.Result(name="new", value=1.0, unit="s"),
+                ],
+                baseline,
+            ),
+            [],
+        )
+        regressions = bench.Bench.compare(
+            [
+                bench.Bench.Result(name="time", value=1.5, unit="s"),
+                bench.Bench.Result(
+                    name="rate", value=50.0, unit="ticks/s", higher_is_better=True
+                ),
+            ],
+            baseline,
+            threshold=0.2,
+        )
+        self.assertEqual(
+            [regression.name for regression in regressions], ["time", "rate"]
+        )
+        self.assertAlmostEqual(regressions[0].change, 0.5)
@@ -6,5 +6,6 @@ from .register import Register
 from .counter import Counter
 from .program_counter import ProgramCounter
 from .memory import Memory
+from .tracer import Tracer
 from .controller import Controller
 from .alu import ALU
@@ -119,8 +119,14 @@ class ALU(component.Component):
             self.status &= ~self.ZERO
 
     @typing.override
-    def tick(self) -> None:
-        super().tick()
+    def phases(
+        self,
+    ) -> typing.Mapping[
+        component.Component.Phase, typing.Sequence[component.Component.Step]
+    ]:
+        return {self.Phase.UPDATE: [self._update]}
+
+    def _update(self) -> None:
         if self.__carry_set.value:
             self.carry = True
         elif self.__carry_clear.value:
@@ -3,16 +3,22 @@ from . import byte
 
 
 class Bus:
+    __slots__ = ("__value",)
+
     def __init__(self, value: int = 0) -> None:
-        self.__value = byte.Byte(value)
+        self.__value = value % byte.MAX
 
     def __str__(self) -> str:
         return f"Bus({self.value})"
 
     @property
     def value(self) -> int:
-        return self.__value.value
+        return self.__value
 
     @value.setter
     def value(self, value: int) -> None:
-        self.__value = byte.Byte(value)
+        self.__value = value % byte.MAX
+
+    @property
+    def byte(self) -> byte.Byte:
+        return byte.Byte(self.__value)
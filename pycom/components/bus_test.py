@@ -9,3 +9,14 @@ class BusTest(unittest.TestCase):
         self.assertEqual(0, bus.value)
         bus.value = 1
         self.assertEqual(1, bus.value)
+
+    def test_wrap(self) -> None:
+        bus = pycom.Bus(0x101)
+        self.assertEqual(bus.value, 1)
+        bus.value = -1
+        self.assertEqual(bus.value, 0xFF)
+        self.assertEqual(bus.byte, pycom.Byte(0xFF))
+
+    def test_slots(self) -> None:
+        self.assertFalse(hasattr(pycom.Bus(), "__dict__"))
+        self.assertFalse(hasattr(pycom.Byte(), "__dict__"))
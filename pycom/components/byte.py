@@ -1,15 +1,20 @@
 import typing
 from pycom.components import errorable
 
+SIZE = 8
+MAX = 1 << SIZE
+
 
 class Byte(
     errorable.Errorable,
     typing.Sized,
     typing.Iterable[bool],
 ):
+    __slots__ = ("_value",)
+
     @classmethod
     def size(cls) -> int:
-        return 8
+        return SIZE
 
     @classmethod
     def max(cls) -> int:
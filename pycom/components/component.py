@@ -1,3 +1,5 @@
+import enum
+import types
 import typing
 from pycom.components import errorable, validatable
 
@@ -7,6 +9,36 @@ class Component(validatable.Validatable):
 
     class ControlNotFoundError(errorable.Errorable.Error, KeyError): ...
 
+    class EventDrivenError(errorable.Errorable.Error, ValueError): ...
+
+    class Phase(enum.IntEnum):
+        DRIVE = 0
+        COUNT = 1
+        LATCH = 2
+        UPDATE = 3
+
+    Step: typing.TypeAlias = typing.Callable[[], None]
+
+    __slots__ = (
+        "__name",
+        "__parent",
+        "__children",
+        "__controls",
+        "__children_by_name",
+        "__controls_by_name",
+        "__all_controls",
+        "__control_paths",
+        "__path",
+        "__root",
+        "__schedule",
+        "__steps",
+        "__order",
+        "__event_driven",
+        "__worklist",
+        "__control_changes",
+        "__cycle",
+    )
+
     def __init__(
         self,
         name: str,
@@ -20,6 +52,21 @@ class Component(validatable.Validatable):
         self.__parent = None
         self.__children: frozenset[Component] = frozenset()
         self.__controls: frozenset["control_lib.Control"] = frozenset()
+        self.__children_by_name: dict[str, Component] = {}
+        self.__controls_by_name: dict[str, control_lib.Control] = {}
+        self.__all_controls: typing.Optional[frozenset[control_lib.Control]] = None
+        self.__control_paths: typing.Optional[dict[str, control_lib.Control]] = None
+        self.__path: typing.Optional[str] = None
+        self.__root: typing.Optional[Component] = None
+        self.__schedule: typing.Optional[typing.Sequence[Component.Step]] = None
+        self.__steps: typing.Optional[
+            dict[Component, tuple[tuple[Component.Step, ...], ...]]
+        ] = None
+        self.__order: dict[Component, int] = {}
+        self.__event_driven = False
+        self.__worklist: typing.Optional[set[Component]] = None
+        self.__control_changes = 0
+        self.__cycle = 0
         with self._pause_validation():
             if parent is not None:
                 self.parent = parent
@@ -52,13 +99,25 @@ class Component(validatable.Validatable):
 
     @property
     def root(self) -> "Component":
-        return self.parent.root if self.parent is not None else self
+        if self.__root is None:
+            self.__root = self.parent.root if self.parent is not None else self
+        return self.__root
 
     @property
     def path(self) -> str:
-        return (
-            f"{self.parent.path}.{self.name}" if self.parent is not None else self.name
-        )
+        if self.__path is None:
+            self.__path = (
+                f"{self.parent.path}.{self.name}"
+                if self.parent is not None
+                else self.name
+            )
+        return self.__path
+
+    def _invalidate_path(self) -> None:
+        self.__path = None
+        self.__root = None
+        for child in self.children:
+            child._invalidate_path()
 
     @property
     def parent(self) -> typing.Optional["Component"]:
@@ -67,10 +126,14 @@ class Component(validatable.Validatable):
     @parent.setter
     def parent(self, parent: typing.Optional["Component"]) -> None:
         if parent is not self.__parent:
+            self._check_not_frozen()
+            if parent is not None:
+                self.__check_not_event_driven()
             with self._pause_validation():
                 if self.__parent is not None:
                     self.__parent.remove_child(self)
                 self.__parent = parent
+                self._invalidate_path()
                 if self.__parent is not None:
                     self.__parent.add_child(self)
 
@@ -80,26 +143,33 @@ class Component(validatable.Validatable):
 
     def add_child(self, child: "Component") -> None:
         if child not in self.__children:
+            self._check_not_frozen()
+            child.__check_not_event_driven()
             self.__children |= frozenset({child})
+            self.__children_by_name[child.name] = child
+            self._invalidate_indexes()
             child.parent = self
 
     def remove_child(self, child: "Component") -> None:
         if child in self.__children:
+            self._check_not_frozen()
             self.__children -= frozenset({child})
+            self.__children_by_name = {child.name: child for child in self.__children}
+            self._invalidate_indexes()
             child.parent = None
 
     @property
     def children_by_name(self) -> typing.Mapping[str, "Component"]:
-        return {child.name: child for child in self.children}
+        return types.MappingProxyType(self.__children_by_name)
 
     def child(self, name: str) -> "Component":
         match (dot_pos := name.find(".")):
             case -1:
-                if name not in self.children_by_name:
+                if name not in self.__children_by_name:
                     raise self.ChildNotFoundError(
-                        f"unknown child {name}: children are {list(self.children_by_name.keys())} at {self.path}"
+                        f"unknown child {name}: children are {list(self.__children_by_name.keys())} at {self.path}"
                     )
-                return self.children_by_name[name]
+                return self.__children_by_name[name]
             case _:
                 return self.child(name[:dot_pos]).child(name[dot_pos + 1 :])
 
@@ -109,10 +179,25 @@ class Component(validatable.Validatable):
 
     @property
     def all_controls(self) -> frozenset["control_lib.Control"]:
-        controls: set[control_lib.Control] = set(self.controls)
-        for child in self.children:
-            controls |= child.all_controls
-        return frozenset(controls)
+        if self.__all_controls is None:
+            self.__all_controls = self.__controls.union(
+                *[child.all_controls for child in self.children]
+            )
+        return self.__all_controls
+
+    @property
+    def control_paths(self) -> typing.Mapping[str, "control_lib.Control"]:
+        return types.MappingProxyType(self.__control_path_index())
+
+    def __control_path_index(self) -> dict[str, "control_lib.Control"]:
+        if self.__control_paths is None:
+            self.__control_paths = {
+                f"{child.name}.{path}": control
+                for child in self.children
+                for path, control in child.__control_path_index().items()
+            }
+            self.__control_paths.update(self.__controls_by_name)
+        return self.__control_paths
 
     def set_control(self, name: str, value: bool) -> None:
         self.control(name).value = value
@@ -125,32 +210,42 @@ class Component(validatable.Validatable):
 
     @property
     def controls_by_name(self) -> typing.Mapping[str, "control_lib.Control"]:
-        return {control.name: control for control in self.controls}
+        return types.MappingProxyType(self.__controls_by_name)
 
     def control(self, name: str) -> "control_lib.Control":
+        if (control := self.__control_path_index().get(name)) is not None:
+            return control
         match (dot_pos := name.find(".")):
             case -1:
-                if name not in self.controls_by_name:
+                if name not in self.__controls_by_name:
                     raise self.ControlNotFoundError(f"unknown control {name}")
-                return self.controls_by_name[name]
+                return self.__controls_by_name[name]
             case _:
                 return self.child(name[:dot_pos]).control(name[dot_pos + 1 :])
 
     def add_control(self, control: "control_lib.Control") -> None:
         if control not in self.controls:
+            self._check_not_frozen()
             with self._pause_validation():
                 self.__controls |= frozenset({control})
+                self.__controls_by_name[control.name] = control
+                self._invalidate_indexes()
                 control.component = self
 
     def remove_control(self, control: "control_lib.Control") -> None:
         if control in self.controls:
+            self._check_not_frozen()
             with self._pause_validation():
                 self.__controls -= frozenset({control})
+                self.__controls_by_name = {
+                    control.name: control for control in self.__controls
+                }
+                self._invalidate_indexes()
                 control.component = None
 
     @typing.override
     def validate(self) -> None:
-        if len(self.children_by_name) != len(self.children):
+        if len(self.__children_by_name) != len(self.children):
             raise self.ValidationError(f"duplicate child names")
         for child in self.children:
             if child.parent is not self:
@@ -159,7 +254,7 @@ class Component(validatable.Validatable):
                 )
         if self.parent is not None and self not in self.parent.children:
             raise self.ValidationError(f"component {self} not in parent {self.parent}")
-        if len(self.controls_by_name) != len(self.controls):
+        if len(self.__controls_by_name) != len(self.controls):
             raise self.ValidationError(f"duplicate control names")
         for control in self.controls:
             if self is not control.component:
@@ -168,9 +263,124 @@ class Component(validatable.Validatable):
         for child in self.children:
             child.validate()
 
+    def freeze(self) -> None:
+        self.validate()
+        for component in self.components():
+            component._freeze()
+            for control in component.controls:
+                control._freeze()
+
+    def components(self) -> typing.Sequence["Component"]:
+        return [self] + [
+            component
+            for child in sorted(self.children, key=lambda child: child.name)
+            for component in child.components()
+        ]
+
+    def phases(self) -> typing.Mapping["Component.Phase", typing.Sequence[Step]]:
+        return {}
+
+    def _invalidate_indexes(self) -> None:
+        self.__all_controls = None
+        self.__control_paths = None
+        self.__schedule = None
+        self.__steps = None
+        self.__worklist = None
+        if self.parent is not None:
+            self.parent._invalidate_indexes()
+
+    @property
+    def steps(self) -> typing.Mapping["Component", tuple[tuple[Step, ...], ...]]:
+        if self.__steps is None:
+            self.__steps = {}
+            self.__order = {}
+            for component in self.components():
+                self.__order[component] = len(self.__order)
+                phases = component.phases()
+                self.__steps[component] = tuple(
+                    tuple(phases.get(phase, ())) for phase in self.Phase
+                )
+        return self.__steps
+
+    @property
+    def schedule(self) -> typing.Sequence[Step]:
+        if self.__schedule is None:
+            steps = self.steps
+            self.__schedule = tuple(
+                step
+                for phase in self.Phase
+                for component_steps in steps.values()
+                for step in component_steps[phase]
+            )
+        return self.__schedule
+
+    @property
+    def active(self) -> bool:
+        return any(control.value for control in self.controls)
+
+    @property
+    def event_driven(self) -> bool:
+        return self.__event_driven
+
+    @event_driven.setter
+    def event_driven(self, event_driven: bool) -> None:
+        if event_driven and self.parent is not None:
+            raise self.EventDrivenError(
+                f"{self.path} isn't a root and can't be event driven"
+            )
+        self.__event_driven = event_driven
+        self.__worklist = None
+
+    def __check_not_event_driven(self) -> None:
+        if self.__event_driven:
+            raise self.EventDrivenError(
+                f"{self.path} is event driven and can't be attached to a parent"
+            )
+
+    @property
+    def worklist(self) -> typing.AbstractSet["Component"]:
+        if self.__worklist is None:
+            self.__worklist = {
+                component for component in self.components() if component.active
+            }
+        return self.__worklist
+
+    @property
+    def control_changes(self) -> int:
+        return self.__control_changes
+
+    def _control_changed(self) -> None:
+        root = self.root
+        root.__control_changes += 1
+        if root.__worklist is not None:
+            if self.active:
+                root.__worklist.add(self)
+            else:
+                root.__worklist.discard(self)
+
+    @property
+    def cycle(self) -> int:
+        return self.__cycle
+
+    @cycle.setter
+    def cycle(self, cycle: int) -> None:
+        self.__cycle = cycle
+
     def tick(self) -> None:
-        for child in self.children:
-            child.tick()
+        if self.__event_driven:
+            self._tick_worklist()
+        else:
+            for step in self.schedule:
+                step()
+        self.__cycle += 1
+
+    def _tick_worklist(self) -> None:
+        steps = self.steps
+        components = sorted(self.worklist, key=self.__order.__getitem__)
+        for phase in self.Phase:
+            for component in components:
+                for step in steps[component][phase]:
+                    step()
 
 
 from . import control as control_lib
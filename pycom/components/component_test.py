@@ -1,4 +1,5 @@
 from stringprep import c22_specials
+import typing
 import unittest
 import pycom
 
@@ -46,7 +47,21 @@ class ComponentTest(unittest.TestCase):
     def test_children_by_name(self) -> None:
         child = pycom.Component("child")
         parent = pycom.Component("parent", children=frozenset({child}))
-        self.assertDictEqual(parent.children_by_name, {"child": child})
+        self.assertDictEqual(dict(parent.children_by_name), {"child": child})
+
+    def test_indexes_read_only(self) -> None:
+        c = pycom.Control("c")
+        child = pycom.Component("child", controls=[c])
+        parent = pycom.Component("parent", children=[child])
+        for index in [
+            parent.children_by_name,
+            child.controls_by_name,
+            parent.control_paths,
+        ]:
+            with self.assertRaises(TypeError):
+                typing.cast(dict[str, typing.Any], index)["other"] = None
+        self.assertDictEqual(dict(parent.children_by_name), {"child": child})
+        self.assertDictEqual(dict(parent.control_paths), {"child.c": c})
 
     def test_duplicate_child_name(self) -> None:
         child1 = pycom.Component("child")
@@ -91,7 +106,7 @@ class ComponentTest(unittest.TestCase):
         c = pycom.Control("c")
         a = pycom.Component("a", controls=(c,))
         self.assertSetEqual(a.controls, frozenset({c}))
-        self.assertDictEqual(a.controls_by_name, {"c": c})
+        self.assertDictEqual(dict(a.controls_by_name), {"c": c})
         self.assertIs(a.control("c"), c)
 
     def test_add_control(self) -> None:
@@ -147,3 +162,123 @@ class ComponentTest(unittest.TestCase):
         b.set_controls("a.c2")
         self.assertFalse(c1.value)
         self.assertTrue(c2.value)
+
+    def test_components(self) -> None:
+        c = pycom.Component("c")
+        b = pycom.Component("b")
+        a = pycom.Component("a", children=[c, b])
+        self.assertSequenceEqual(a.components(), [a, b, c])
+
+    def test_schedule(self) -> None:
+        log: list[str] = []
+
+        class Logged(pycom.Component):
+            def phases(
+                self,
+            ) -> typing.Mapping[
+                pycom.Component.Phase, typing.Sequence[pycom.Component.Step]
+            ]:
+                return {
+                    self.Phase.LATCH: [lambda: log.append(f"{self.name}.latch")],
+                    self.Phase.DRIVE: [lambda: log.append(f"{self.name}.drive")],
+                }
+
+        root = pycom.Component("root", children=[Logged("b"), Logged("a")])
+        root.tick()
+        self.assertListEqual(log, ["a.drive", "b.drive", "a.latch", "b.latch"])
+
+    def test_schedule_invalidated(self) -> None:
+        root = pycom.Component("root")
+        self.assertSequenceEqual(root.schedule, [])
+        register = pycom.Register(pycom.Bus(), "r")
+        root.add_child(register)
+        self.assertEqual(len(root.schedule), 2)
+        root.remove_child(register)
+        self.assertSequenceEqual(root.schedule, [])
+
+    def test_event_driven_root_only(self) -> None:
+        child = pycom.Component("child")
+        parent = pycom.Component("parent", children=[child])
+        with self.assertRaises(pycom.Component.EventDrivenError):
+            child.event_driven = True
+        self.assertFalse(child.event_driven)
+        child.event_driven = False
+        other = pycom.Component("other")
+        other.event_driven = True
+        for attach in list[typing.Callable[[], None]](
+            [
+                lambda: setattr(other, "parent", parent),
+                lambda: parent.add_child(other),
+            ]
+        ):
+            with self.assertRaises(pycom.Component.EventDrivenError):
+                attach()
+        self.assertIsNone(other.parent)
+        self.assertSetEqual(parent.children, frozenset({child}))
+
+    def test_freeze(self) -> None:
+        c = pycom.Control("c")
+        child = pycom.Component("child", controls=[c])
+        parent = pycom.Component("parent", children=[child])
+        parent.freeze()
+        self.assertTrue(parent.frozen)
+        self.assertTrue(child.frozen)
+        self.assertTrue(c.frozen)
+        for mutation in list[typing.Callable[[], None]](
+            [
+                lambda: parent.add_child(pycom.Component("other")),
+                lambda: parent.remove_child(child),
+                lambda: setattr(child, "parent", None),
+                lambda: child.add_control(pycom.Control("d")),
+                lambda: child.remove_control(c),
+                lambda: setattr(c, "component", None),
+            ]
+        ):
+            with self.assertRaises(pycom.Component.FrozenError):
+                mutation()
+        parent.set_control("child.c", True)
+        self.assertTrue(c.value)
+
+    def test_freeze_invalid(self) -> None:
+        with pycom.Component.deferred_validation():
+            parent = pycom.Component(
+                "parent",
+                children=[pycom.Component("child"), pycom.Component("child")],
+            )
+        with self.assertRaises(pycom.Component.ValidationError):
+            parent.freeze()
+        self.assertFalse(parent.frozen)
+
+    def test_path_updated(self) -> None:
+        c = pycom.Component("c")
+        b = pycom.Component("b", children=[c])
+        a = pycom.Component("a")
+        self.assertEqual(c.path, "b.c")
+        self.assertIs(c.root, b)
+        b.parent = a
+        self.assertEqual(c.path, "a.b.c")
+        self.assertIs(c.root, a)
+        b.parent = None
+        self.assertEqual(c.path, "b.c")
+        self.assertIs(c.root, b)
+
+    def test_control_paths_updated(self) -> None:
+        c1 = pycom.Control("c1")
+        a = pycom.Component("a", controls=[c1])
+        b = pycom.Component("b")
+        root = pycom.Component("root", children=[b])
+        self.assertDictEqual(dict(root.control_paths), {})
+        a.parent = b
+        self.assertDictEqual(dict(root.control_paths), {"b.a.c1": c1})
+        self.assertSetEqual(root.all_controls, frozenset({c1}))
+        c2 = pycom.Control("c2", component=a)
+        self.assertIs(root.control("b.a.c2"), c2)
+        self.assertSetEqual(root.all_controls, frozenset({c1, c2}))
+        a.remove_control(c1)
+        self.assertDictEqual(dict(root.control_paths), {"b.a.c2": c2})
+        self.assertDictEqual(dict(a.controls_by_name), {"c2": c2})
+        b.remove_child(a)
+        self.assertDictEqual(dict(root.control_paths), {})
+        self.assertDictEqual(dict(b.children_by_name), {})
+        with self.assertRaises(pycom.Component.ChildNotFoundError):
+            root.control("b.a.c2")
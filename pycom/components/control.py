@@ -3,6 +3,8 @@ from pycom.components import validatable
 
 
 class Control(validatable.Validatable):
+    __slots__ = ("__name", "__value", "__on_change", "__component")
+
     def __init__(
         self,
         name: str,
@@ -14,7 +16,6 @@ class Control(validatable.Validatable):
         self.__name = name
         self.__value = False
         self.__on_change = on_change
-        self.__pause_validation_count = 0
         self.__component = None
         if component is not None:
             self.component = component
@@ -33,6 +34,7 @@ class Control(validatable.Validatable):
     @component.setter
     def component(self, component: typing.Optional["component_lib.Component"]) -> None:
         if component is not self.__component:
+            self._check_not_frozen()
             with self._pause_validation():
                 if self.__component is not None:
                     self.__component.remove_control(self)
@@ -58,9 +60,12 @@ class Control(validatable.Validatable):
 
     @value.setter
     def value(self, value: bool) -> None:
+        changed = value != self.__value
         self.__value = value
         if self.__on_change is not None:
             self.__on_change(self.__value)
+        if changed and self.__component is not None:
+            self.__component._control_changed()
 
     @staticmethod
     def disjoint(*controls: "Control") -> bool:
@@ -1,6 +1,16 @@
+import array
 import dataclasses
 import typing
-from pycom.components import bus, byte, component, counter, errorable, register
+from pycom.components import (
+    bus,
+    byte,
+    component,
+    control,
+    counter,
+    errorable,
+    register,
+    tracer as tracer_lib,
+)
 
 
 class Controller(component.Component):
@@ -42,17 +52,339 @@ class Controller(component.Component):
                 )
             )
 
+    class Rom:
+        _cache: typing.ClassVar[
+            dict[
+                tuple[frozenset["Controller.Entry"], str, str],
+                "Controller.Rom",
+            ]
+        ] = {}
+
+        def __init__(
+            self,
+            entries: typing.Iterable["Controller.Entry"],
+            *,
+            increment_control: str = "controller.instruction_counter.increment",
+            reset_control: str = "controller.instruction_counter.reset",
+        ) -> None:
+            self.__entries = tuple(sorted(frozenset(entries), key=self.sort_key))
+            self.__status_mask = 0
+            for entry in self.__entries:
+                self.__status_mask |= entry.status_mask
+            status_bits = [
+                bit
+                for bit in range(self.__status_mask.bit_length())
+                if self.__status_mask & (1 << bit)
+            ]
+            self.__statuses = [
+                sum(1 << bit for i, bit in enumerate(status_bits) if index & (1 << i))
+                for index in range(1 << len(status_bits))
+            ]
+            status_indices = [0] * (self.__status_mask + 1)
+            for index, status in enumerate(self.__statuses):
+                status_indices[status] = index
+            self.__status_indices = tuple(status_indices)
+            self.__num_counters = (
+                max(
+                    (
+                        entry.instruction_counter
+                        for entry in self.__entries
+                        if entry.instruction_counter is not None
+                    ),
+                    default=0,
+                )
+                + 1
+            )
+            self.__table = array.array(
+                "i",
+                [-1] * (byte.Byte.max() * self.__num_counters * len(self.__statuses)),
+            )
+            for entry_index, entry in enumerate(self.__entries):
+                for instruction in (
+                    range(byte.Byte.max())
+                    if entry.instruction is None
+                    else [entry.instruction]
+                ):
+                    for instruction_counter in (
+                        range(self.__num_counters)
+                        if entry.instruction_counter is None
+                        else [entry.instruction_counter]
+                    ):
+                        for status in self.__statuses:
+                            if status & entry.status_mask != entry.status_value:
+                                continue
+                            index = self.index(instruction, instruction_counter, status)
+                            if self.__table[index] != -1:
+                                raise Controller.EntryError(
+                                    f"ambiguous entries {self.__entries[self.__table[index]]} and {entry} for state {self.state(index)}"
+                                )
+                            self.__table[index] = entry_index
+            self.__increment_control = increment_control
+            self.__reset_control = reset_control
+            self.__missing = self.__find_missing()
+            self.__control_words: dict[tuple[str, ...], tuple[int, ...]] = {}
+
+        @classmethod
+        def for_entries(
+            cls,
+            entries: typing.Iterable["Controller.Entry"],
+            *,
+            increment_control: str = "controller.instruction_counter.increment",
+            reset_control: str = "controller.instruction_counter.reset",
+        ) -> "Controller.Rom":
+            key = (frozenset(entries), increment_control, reset_control)
+            if key not in cls._cache:
+                cls._cache[key] = cls(
+                    key[0],
+                    increment_control=increment_control,
+                    reset_control=reset_control,
+                )
+            return cls._cache[key]
+
+        @classmethod
+        def clear_cache(cls) -> None:
+            cls._cache.clear()
+
+        @staticmethod
+        def sort_key(
+            entry: "Controller.Entry",
+        ) -> tuple[int, int, int, int, list[str]]:
+            return (
+                entry.instruction if entry.instruction is not None else -1,
+                (
+                    entry.instruction_counter
+                    if entry.instruction_counter is not None
+                    else -1
+                ),
+                entry.status_mask,
+                entry.status_value,
+                sorted(entry.controls),
+            )
+
+        def __find_missing(self) -> frozenset["Controller.State"]:
+            missing: set[Controller.State] = set()
+            for instruction in frozenset(
+                entry.instruction
+                for entry in self.__entries
+                if entry.instruction is not None
+            ):
+                for status in self.__statuses:
+                    for instruction_counter in range(self.__num_counters + 1):
+                        entry_index = self.__lookup(
+                            instruction, instruction_counter, status
+                        )
+                        if entry_index == -1:
+                            missing.add(
+                                Controller.State(
+                                    instruction=instruction,
+                                    instruction_counter=instruction_counter,
+                                    status=status,
+                                )
+                            )
+                            break
+                        if self.__ends_instruction(self.__entries[entry_index]):
+                            break
+            return frozenset(missing)
+
+        def control_words(self, controls: tuple[str, ...]) -> tuple[int, ...]:
+            if controls not in self.__control_words:
+                bits = {control: 1 << i for i, control in enumerate(controls)}
+                unknown_controls = (
+                    frozenset[str]().union(
+                        *[entry.controls for entry in self.__entries]
+                    )
+                    - bits.keys()
+                )
+                if unknown_controls:
+                    raise component.Component.ControlNotFoundError(
+                        f"unknown controls {sorted(unknown_controls)}"
+                    )
+                self.__control_words[controls] = tuple(
+                    sum(bits[control] for control in entry.controls)
+                    for entry in self.__entries
+                )
+            return self.__control_words[controls]
+
+        def __ends_instruction(self, entry: "Controller.Entry") -> bool:
+            return (
+                self.__reset_control in entry.controls
+                or self.__increment_control not in entry.controls
+            )
+
+        @property
+        def entries(self) -> typing.Sequence["Controller.Entry"]:
+            return self.__entries
+
+        @property
+        def missing(self) -> frozenset["Controller.State"]:
+            return self.__missing
+
+        @property
+        def status_mask(self) -> int:
+            return self.__status_mask
+
+        @property
+        def num_counters(self) -> int:
+            return self.__num_counters
+
+        @property
+        def status_indices(self) -> typing.Sequence[int]:
+            return self.__status_indices
+
+        @property
+        def table(self) -> typing.Sequence[int]:
+            return memoryview(self.__table).toreadonly()
+
+        def index(self, instruction: int, instruction_counter: int, status: int) -> int:
+            return (instruction * self.__num_counters + instruction_counter) * len(
+                self.__statuses
+            ) + self.__status_indices[status & self.__status_mask]
+
+        def state(self, index: int) -> "Controller.State":
+            index, status_index = divmod(index, len(self.__statuses))
+            instruction, instruction_counter = divmod(index, self.__num_counters)
+            return Controller.State(
+                instruction=instruction,
+                instruction_counter=instruction_counter,
+                status=self.__statuses[status_index],
+            )
+
+        def __lookup(
+            self, instruction: int, instruction_counter: int, status: int
+        ) -> int:
+            if instruction_counter >= self.__num_counters:
+                return -1
+            return self.__table[self.index(instruction, instruction_counter, status)]
+
+        def entry_index(
+            self, instruction: int, instruction_counter: int, status: int
+        ) -> int:
+            if (
+                entry_index := self.__lookup(instruction, instruction_counter, status)
+            ) == -1:
+                state = Controller.State(
+                    instruction=instruction,
+                    instruction_counter=instruction_counter,
+                    status=status,
+                )
+                raise Controller.EntryError(f"no entry for state {state}")
+            return entry_index
+
+        def ticks(self, instruction: int, status: int) -> int:
+            instruction_counter = 0
+            while True:
+                entry = self.entry(instruction, instruction_counter, status)
+                instruction_counter += 1
+                if self.__ends_instruction(entry):
+                    return instruction_counter
+
+        def entry(
+            self, instruction: int, instruction_counter: int, status: int
+        ) -> "Controller.Entry":
+            return self.__entries[
+                self.entry_index(instruction, instruction_counter, status)
+            ]
+
+    class Coverage(errorable.Errorable):
+        Key: typing.TypeAlias = tuple[
+            typing.Optional[int], typing.Optional[int], int, int
+        ]
+
+        def __init__(self, rom: "Controller.Rom") -> None:
+            self.rom = rom
+            self.hits = array.array("Q", bytes(8 * len(rom.entries)))
+
+        @staticmethod
+        def key(entry: "Controller.Entry") -> "Controller.Coverage.Key":
+            return (
+                entry.instruction,
+                entry.instruction_counter,
+                entry.status_mask,
+                entry.status_value,
+            )
+
+        def counts(self) -> typing.Mapping["Controller.Coverage.Key", int]:
+            return {
+                self.key(entry): hits
+                for entry, hits in zip(self.rom.entries, self.hits)
+                if hits
+            }
+
+        def unhit(self) -> typing.Sequence["Controller.Entry"]:
+            return [
+                entry for entry, hits in zip(self.rom.entries, self.hits) if not hits
+            ]
+
+        def merge(self, coverage: "Controller.Coverage") -> None:
+            if coverage.rom is not self.rom:
+                raise self.Error("can't merge coverage for different roms")
+            for index, hits in enumerate(coverage.hits):
+                self.hits[index] += hits
+
+        def reset(self) -> None:
+            self.hits = array.array("Q", bytes(8 * len(self.rom.entries)))
+
+    class ControlWords:
+        def __init__(
+            self,
+            root: component.Component,
+            rom: "Controller.Rom",
+        ) -> None:
+            self.__controls = tuple(
+                sorted(root.all_controls, key=lambda control: control.path)
+            )
+            self.__words = rom.control_words(
+                tuple(control.path[len(root.path) + 1 :] for control in self.__controls)
+            )
+
+        @property
+        def controls(self) -> typing.Sequence[control.Control]:
+            return self.__controls
+
+        @property
+        def words(self) -> typing.Sequence[int]:
+            return self.__words
+
+        def word(self) -> int:
+            return sum(
+                1 << i for i, control in enumerate(self.__controls) if control.value
+            )
+
+        def apply(self, word: int, previous_word: int) -> None:
+            self.__set(previous_word & ~word, False)
+            self.__set(word & ~previous_word, True)
+
+        def __set(self, bits: int, value: bool) -> None:
+            while bits:
+                bit = bits & -bits
+                self.__controls[bit.bit_length() - 1].value = value
+                bits ^= bit
+
     def __init__(
         self,
         bus: bus.Bus,
         entries: typing.Iterable[Entry],
         name: typing.Optional[str] = None,
+        *,
+        tracer: typing.Optional[tracer_lib.Tracer] = None,
     ) -> None:
         self.bus = bus
+        self.tracer = tracer or tracer_lib.Tracer()
         self._entries = frozenset(entries)
+        self._reset_control = f"{name or 'controller'}.instruction_counter.reset"
+        self._rom = self.Rom.for_entries(
+            self._entries,
+            increment_control=f"{name or 'controller'}.instruction_counter.increment",
+            reset_control=self._reset_control,
+        )
         self._instruction_buffer = register.Register(self.bus, "instruction_buffer")
         self._instruction_counter = counter.Counter(self.bus, "instruction_counter")
         self._address_buffer = register.Register(self.bus, "address_buffer")
+        self._control_words: typing.Optional[Controller.ControlWords] = None
+        self._control_words_root: typing.Optional[component.Component] = None
+        self._control_word = 0
+        self._control_changes = 0
+        self.coverage: typing.Optional[Controller.Coverage] = None
         super().__init__(
             name or "controller",
             children=frozenset(
@@ -91,25 +423,88 @@ class Controller(component.Component):
     def entries(self) -> frozenset["Controller.Entry"]:
         return self._entries
 
+    @property
+    def rom(self) -> "Controller.Rom":
+        return self._rom
+
     def entry(self, status: int) -> "Controller.Entry":
-        state = self.state(status)
-        print(f"controller state is {state}")
-        entries = [entry for entry in self.entries if entry.matches(state)]
-        print(f"matched entries {entries}")
-        if len(entries) != 1:
-            raise self.EntryError(
-                f"invalid entries {entries} for state {state}: entries are {'\n'.join(map(str, self.entries))}"
-            )
-        return entries[0]
+        return self._rom.entry(
+            self.instruction_buffer,
+            self.instruction_counter,
+            status,
+        )
 
-    def apply(self, status: int) -> None:
-        entry = self.entry(status)
-        print(f"running entry {entry}\nwith root {self.root}\n")
+    @property
+    def control_words(self) -> "Controller.ControlWords":
+        if self._control_words is None:
+            self.compile()
+        assert self._control_words is not None
+        return self._control_words
+
+    @typing.override
+    def _invalidate_path(self) -> None:
+        super()._invalidate_path()
+        self._control_words = None
+        self._control_words_root = None
+
+    def _sync_control_word(self) -> int:
+        control_words = self.control_words
+        assert self._control_words_root is not None
+        if self._control_words_root.control_changes != self._control_changes:
+            self._control_word = control_words.word()
+        return self._control_word
+
+    def _set_control_word(self, control_word: int) -> None:
+        self.control_words.apply(control_word, self._sync_control_word())
+        self._control_word = control_word
+        assert self._control_words_root is not None
+        self._control_changes = self._control_words_root.control_changes
+
+    @property
+    def control_word(self) -> int:
+        return self._sync_control_word()
+
+    @control_word.setter
+    def control_word(self, control_word: int) -> None:
+        self._set_control_word(control_word)
+
+    def enable_coverage(self) -> "Controller.Coverage":
+        if self.coverage is None:
+            self.coverage = self.Coverage(self._rom)
+        return self.coverage
+
+    def compile(self) -> None:
+        root = self.root
         try:
-            self.root.set_controls(*entry.controls)
+            self._control_words = self.ControlWords(root, self._rom)
         except self.Error as e:
-            raise self.Error(
-                f"failed to apply entry {entry} with state {self.state}: {e}"
+            raise self.Error(f"failed to compile controls for {root.path}: {e}")
+        self._control_words_root = root
+        self._control_word = self._control_words.word()
+        self._control_changes = root.control_changes
+
+    def apply(self, status: int) -> None:
+        entry_index = self._rom.entry_index(
+            self.instruction_buffer,
+            self.instruction_counter,
+            status,
+        )
+        if self.coverage is not None:
+            self.coverage.hits[entry_index] += 1
+        if self.tracer.level:
+            self._trace(status, self._rom.entries[entry_index])
+        self._set_control_word(self.control_words.words[entry_index])
+
+    def _trace(self, status: int, entry: "Controller.Entry") -> None:
+        state = self.state(status)
+        if self.tracer.enabled(tracer_lib.Tracer.Level.TICK):
+            self.tracer.emit(tracer_lib.Tracer.Tick(state=state, entry=entry))
+        if self._reset_control in entry.controls:
+            self.tracer.emit(
+                tracer_lib.Tracer.Instruction(
+                    instruction=state.instruction,
+                    ticks=state.instruction_counter + 1,
+                )
             )
 
     def run_instruction(self) -> int:
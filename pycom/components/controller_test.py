@@ -1,3 +1,4 @@
+import typing
 import unittest
 
 import pycom
@@ -128,3 +129,156 @@ class ControllerTest(unittest.TestCase):
                     }
                 ),
             ).entry(3)
+
+    def test_rom_ambiguous(self) -> None:
+        with self.assertRaises(pycom.Controller.EntryError):
+            pycom.Controller.Rom(
+                [
+                    pycom.Controller.Entry(
+                        instruction=1,
+                        controls=frozenset({"a"}),
+                    ),
+                    pycom.Controller.Entry(
+                        instruction_counter=0,
+                        controls=frozenset({"b"}),
+                    ),
+                ]
+            )
+
+    def test_rom_status(self) -> None:
+        a = pycom.Controller.Entry(
+            instruction=1,
+            status_mask=2,
+            status_value=2,
+            controls=frozenset({"a"}),
+        )
+        b = pycom.Controller.Entry(
+            instruction=1,
+            status_mask=2,
+            status_value=0,
+            controls=frozenset({"b"}),
+        )
+        rom = pycom.Controller.Rom([a, b])
+        self.assertEqual(rom.entry(1, 0, 0b11), a)
+        self.assertEqual(rom.entry(1, 0, 0b01), b)
+        with self.assertRaises(pycom.Controller.EntryError):
+            rom.entry(2, 0, 0)
+
+    def test_rom_missing(self) -> None:
+        rom = pycom.Controller.Rom(
+            [
+                pycom.Controller.Entry(
+                    instruction=1,
+                    instruction_counter=0,
+                    controls=frozenset({"controller.instruction_counter.increment"}),
+                ),
+            ]
+        )
+        self.assertSetEqual(
+            rom.missing,
+            {
+                pycom.Controller.State(
+                    instruction=1,
+                    instruction_counter=1,
+                    status=0,
+                )
+            },
+        )
+
+    def test_rom_instructions(self) -> None:
+        self.assertSetEqual(
+            pycom.Controller.Rom(pycom.Instructions.entries()).missing,
+            frozenset(),
+        )
+
+    def test_rom_read_only(self) -> None:
+        rom = pycom.Controller.Rom.for_entries(pycom.Instructions.entries())
+        with self.assertRaises(TypeError):
+            typing.cast(list[int], rom.table)[0] = 0
+        with self.assertRaises(TypeError):
+            typing.cast(list[int], rom.status_indices)[0] = 1
+        self.assertEqual(rom.table[0], rom.entry_index(0, 0, 0))
+
+    def test_control_words(self) -> None:
+        a = pycom.Control("a")
+        b = pycom.Control("b")
+        controller = pycom.Controller(
+            pycom.Bus(),
+            entries=frozenset(
+                {
+                    pycom.Controller.Entry(
+                        instruction=1,
+                        controls=frozenset({"a"}),
+                    ),
+                    pycom.Controller.Entry(
+                        instruction=2,
+                        controls=frozenset({"a", "b"}),
+                    ),
+                }
+            ),
+        )
+        pycom.Component("root", children=[controller], controls=[a, b])
+        control_words = controller.control_words
+        self.assertIn(a, control_words.controls)
+        self.assertIn(b, control_words.controls)
+        self.assertEqual(len(control_words.words), 2)
+        controller.instruction_buffer = 2
+        controller.apply(0)
+        self.assertTrue(a.value)
+        self.assertTrue(b.value)
+        controller.instruction_buffer = 1
+        controller.apply(0)
+        self.assertTrue(a.value)
+        self.assertFalse(b.value)
+
+    def test_control_words_not_found(self) -> None:
+        controller = pycom.Controller(
+            pycom.Bus(),
+            entries=frozenset({pycom.Controller.Entry(controls=frozenset({"a"}))}),
+        )
+        pycom.Component("root", children=[controller])
+        with self.assertRaises(pycom.Controller.Error):
+            controller.compile()
+
+    def test_coverage(self) -> None:
+        computer = pycom.Computer.build(
+            pycom.Instructions.NOP(),
+            pycom.Instructions.HLT(),
+        )
+        self.assertIsNone(computer.controller.coverage)
+        coverage = computer.controller.enable_coverage()
+        self.assertIs(computer.controller.enable_coverage(), coverage)
+        computer.run()
+        counts = coverage.counts()
+        self.assertEqual(counts[(None, 0, 0, 0)], 2)
+        nop = pycom.Instructions.NOP.value.opcodes[0]
+        self.assertEqual(counts[(nop, 3, 0, 0)], 1)
+        self.assertEqual(sum(coverage.hits), 8)
+        self.assertEqual(
+            len(coverage.unhit()), len(computer.controller.rom.entries) - len(counts)
+        )
+        self.assertNotIn((pycom.Instructions.LDA.value.opcodes[0], 3, 0, 0), counts)
+
+    def test_coverage_merge(self) -> None:
+        coverages = []
+        for instruction in [pycom.Instructions.NOP(), pycom.Instructions.INX()]:
+            computer = pycom.Computer.build(instruction)
+            coverages.append(computer.controller.enable_coverage())
+            computer.run()
+        coverage = pycom.Controller.Coverage(coverages[0].rom)
+        for c in coverages:
+            coverage.merge(c)
+        self.assertEqual(sum(coverage.hits), sum(sum(c.hits) for c in coverages))
+        coverage.reset()
+        self.assertEqual(sum(coverage.hits), 0)
+
+    def test_coverage_merge_different_rom(self) -> None:
+        coverage = pycom.Controller.Coverage(
+            pycom.Controller.Rom.for_entries(pycom.Instructions.entries())
+        )
+        with self.assertRaises(pycom.Controller.Coverage.Error):
+            coverage.merge(
+                pycom.Controller.Coverage(
+                    pycom.Controller.Rom([pycom.Controller.Entry()])
+                )
+            )
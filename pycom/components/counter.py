@@ -1,8 +1,10 @@
 import typing
-from pycom.components import bus, byte, control, register
+from pycom.components import bus, byte, component, control, register
 
 
 class Counter(register.Register):
+    __slots__ = ("_increment", "_reset")
+
     def __init__(
         self,
         bus: bus.Bus,
@@ -42,9 +44,15 @@ class Counter(register.Register):
         self._reset.value = reset
 
     @typing.override
-    def tick(self) -> None:
+    def phases(
+        self,
+    ) -> typing.Mapping[
+        component.Component.Phase, typing.Sequence[component.Component.Step]
+    ]:
+        return {self.Phase.COUNT: [self._count], **super().phases()}
+
+    def _count(self) -> None:
         if self.increment:
             self.value += 1
         elif self.reset:
             self.value = 0
-        super().tick()
@@ -1,2 +1,4 @@
 class Errorable:
+    __slots__ = ()
+
     class Error(Exception): ...
@@ -1,37 +1,91 @@
 import collections
+import dataclasses
+import enum
+import re
 import typing
-from pycom.components import bus, byte, component, control, register
+from pycom.components import bus, byte, component, control, errorable, register
 
 
 class Memory(
     component.Component,
     typing.MutableMapping[int, int],
 ):
+    class AddressError(errorable.Errorable.Error, KeyError): ...
+
+    class WatchError(errorable.Errorable.Error, ValueError): ...
+
+    class Watchpoint(enum.IntFlag):
+        READ = 1
+        WRITE = 2
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Hit:
+        kind: "Memory.Watchpoint"
+        address: int
+        old_value: int
+        new_value: int
+        cycle: int
+
+    class Data(typing.Mapping[int, int]):
+        def __init__(self, data: bytearray) -> None:
+            self.__data = data
+
+        def __getitem__(self, address: int) -> int:
+            if not 0 <= address < len(self.__data) or not self.__data[address]:
+                raise KeyError(address)
+            return self.__data[address]
+
+        def __iter__(self) -> typing.Iterator[int]:
+            return (match.start() for match in Memory._NONZERO.finditer(self.__data))
+
+        def __len__(self) -> int:
+            return len(self.__data) - self.__data.count(0)
+
+    _NONZERO = re.compile(rb"[^\x00]")
+
+    MAX_HITS = 1 << 10
+
+    @classmethod
+    def size(cls) -> int:
+        return byte.Byte.max() ** 2
+
+    @classmethod
+    def image(cls, data: typing.Mapping[int, int]) -> bytearray:
+        image = bytearray(cls.size())
+        for address, value in data.items():
+            if not 0 <= address < len(image):
+                raise cls.AddressError(f"invalid address {byte.Byte.hex_str(address)}")
+            image[address] = value % byte.Byte.max()
+        return image
+
     def __init__(
         self,
         bus: bus.Bus,
         *,
         name: typing.Optional[str] = None,
         data: typing.Optional[typing.Mapping[int, int]] = None,
+        watchable: bool = True,
+        max_hits: int = MAX_HITS,
     ) -> None:
         self.bus = bus
-        self._data: typing.MutableMapping[int, byte.Byte] = collections.defaultdict(
-            byte.Byte
-        )
+        self._data = bytearray(self.size())
+        self._watchpoints = bytearray(self.size())
+        self.on_hit: typing.Optional[typing.Callable[[Memory.Hit], None]] = None
+        self.watchable = watchable
+        self.hits: collections.deque[Memory.Hit] = collections.deque(maxlen=max_hits)
         if data is not None:
-            for address, value in data.items():
-                self._data[address] = byte.Byte(value)
-        self._in = control.Control("in", lambda _: self._write())
-        self._out = control.Control("out", lambda _: self._write())
+            self.load(0, self.image(data))
+        self._in = control.Control("in", self._on_control)
+        self._out = control.Control("out", self._on_control)
         self._address_high_byte = register.Register(
             self.bus,
             "address_high_byte",
-            lambda _: self._write(),
+            self._on_address,
         )
         self._address_low_byte = register.Register(
             self.bus,
             "address_low_byte",
-            lambda _: self._write(),
+            self._on_address,
         )
         super().__init__(
             name or "memory",
@@ -51,31 +105,100 @@ class Memory(
 
     @typing.override
     def __len__(self) -> int:
-        return len(self.data)
+        return len(self._data) - self._data.count(0)
 
     @typing.override
     def __iter__(self) -> typing.Iterator[int]:
-        return iter(self.data)
+        return (match.start() for match in self._NONZERO.finditer(self._data))
+
+    def _check_address(self, address: int) -> None:
+        if not 0 <= address < len(self._data):
+            raise self.AddressError(f"invalid address {byte.Byte.hex_str(address)}")
 
     @typing.override
     def __getitem__(self, address: int) -> int:
-        return self.data[address].value
+        self._check_address(address)
+        return self._data[address]
 
     @typing.override
     def __setitem__(self, address: int, value: int) -> None:
-        self._data[address] = byte.Byte(value)
+        self._check_address(address)
+        self._data[address] = value % byte.Byte.max()
 
     @typing.override
     def __delitem__(self, address: int) -> None:
-        del self._data[address]
+        self._check_address(address)
+        self._data[address] = 0
+
+    def load(self, address: int, buffer: typing.Sequence[int]) -> None:
+        self._check_address(address)
+        if address + len(buffer) > len(self._data):
+            raise self.AddressError(
+                f"buffer of size {len(buffer)} doesn't fit at {byte.Byte.hex_str(address)}"
+            )
+        self._data[address : address + len(buffer)] = bytes(buffer)
+
+    def _check_range(self, start: int, stop: typing.Optional[int]) -> range:
+        addresses = range(start, start + 1 if stop is None else stop)
+        if addresses:
+            self._check_address(addresses.start)
+            self._check_address(addresses.stop - 1)
+        return addresses
+
+    def watch(
+        self,
+        start: int,
+        stop: typing.Optional[int] = None,
+        kind: Watchpoint = Watchpoint.WRITE,
+    ) -> None:
+        if not self.watchable:
+            raise self.WatchError(f"{self.path} doesn't support watchpoints")
+        for address in self._check_range(start, stop):
+            self._watchpoints[address] |= kind
+
+    def unwatch(
+        self,
+        start: int,
+        stop: typing.Optional[int] = None,
+        kind: Watchpoint = Watchpoint.READ | Watchpoint.WRITE,
+    ) -> None:
+        for address in self._check_range(start, stop):
+            self._watchpoints[address] &= ~kind
+
+    def watchpoint(self, address: int) -> Watchpoint:
+        self._check_address(address)
+        return self.Watchpoint(self._watchpoints[address])
+
+    @property
+    def watchpoints(self) -> typing.Mapping[int, Watchpoint]:
+        return {
+            match.start(): self.Watchpoint(self._watchpoints[match.start()])
+            for match in self._NONZERO.finditer(self._watchpoints)
+        }
+
+    def _hit(self, kind: Watchpoint, address: int, old_value: int) -> None:
+        hit = self.Hit(
+            kind=kind,
+            address=address,
+            old_value=old_value,
+            new_value=self._data[address],
+            cycle=self.root.cycle,
+        )
+        if self.on_hit is not None:
+            self.on_hit(hit)
+        else:
+            self.hits.append(hit)
+
+    def view(self, start: int = 0, stop: typing.Optional[int] = None) -> memoryview:
+        return memoryview(self._data)[start:stop]
 
     @typing.override
     def _str_line(self) -> str:
         return f"{self.name}({self.address},{byte.Byte.hex_str(self.value)})"
 
     @property
-    def data(self) -> typing.Mapping[int, byte.Byte]:
-        return self._data
+    def data(self) -> "Memory.Data":
+        return self.Data(self._data)
 
     @property
     def address_high_byte(self) -> int:
@@ -123,11 +246,11 @@ class Memory(
 
     @property
     def _value(self) -> int:
-        return self.data[self.address].value
+        return self._data[self.address]
 
     @_value.setter
     def _value(self, _value: int) -> None:
-        self._data[self.address] = byte.Byte(_value)
+        self._data[self.address] = _value % byte.Byte.max()
 
     @property
     def value(self) -> int:
@@ -161,14 +284,33 @@ class Memory(
         self._write()
 
     @typing.override
-    def tick(self) -> None:
-        self._read()
-        self._write()
-        super().tick()
+    def phases(
+        self,
+    ) -> typing.Mapping[
+        component.Component.Phase, typing.Sequence[component.Component.Step]
+    ]:
+        return {
+            self.Phase.DRIVE: [self._write],
+            self.Phase.LATCH: [self._read],
+        }
 
     def _read(self) -> None:
         if self.in_:
-            self._value = self.bus.value
+            address = self.address
+            old_value = self._data[address]
+            self._data[address] = self.bus.value
+            if self._watchpoints[address] & self.Watchpoint.WRITE:
+                self._hit(self.Watchpoint.WRITE, address, old_value)
+        if self.out:
+            address = self.address
+            if self._watchpoints[address] & self.Watchpoint.READ:
+                self._hit(self.Watchpoint.READ, address, self._data[address])
+
+    def _on_control(self, _: bool) -> None:
+        self._write()
+
+    def _on_address(self, _: byte.Byte) -> None:
+        self._write()
 
     def _write(self) -> None:
         if self.out:
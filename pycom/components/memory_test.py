@@ -27,7 +27,7 @@ class MemoryTest(unittest.TestCase):
         m.address = 1
         m.value = 2
         self.assertEqual(m.value, 2)
-        self.assertDictEqual(m.data, {1: 2})
+        self.assertDictEqual(dict(m.data), {1: 2})
 
     def test_get_default(self) -> None:
         m = pycom.Memory(pycom.Bus())
@@ -53,7 +53,7 @@ class MemoryTest(unittest.TestCase):
         bus.value = 2
         self.assertEqual(memory.value, 0)
         memory.tick()
-        self.assertDictEqual(memory.data, {1: 2})
+        self.assertDictEqual(dict(memory.data), {1: 2})
 
     def test_data_out(self) -> None:
         bus = pycom.Bus()
@@ -77,3 +77,129 @@ class MemoryTest(unittest.TestCase):
             dict(memory),
             {1: 2},
         )
+
+    def test_del_item(self) -> None:
+        memory = pycom.Memory(pycom.Bus(), data={1: 2})
+        del memory[1]
+        self.assertEqual(memory[1], 0)
+        self.assertEqual(len(memory), 0)
+
+    def test_invalid_address(self) -> None:
+        memory = pycom.Memory(pycom.Bus())
+        with self.assertRaises(pycom.Memory.AddressError):
+            memory[pycom.Memory.size()] = 1
+        with self.assertRaises(pycom.Memory.AddressError):
+            memory[-1]
+
+    def test_load(self) -> None:
+        memory = pycom.Memory(pycom.Bus())
+        memory.load(0xBEEF, bytes([1, 2, 3]))
+        self.assertDictEqual(dict(memory), {0xBEEF: 1, 0xBEF0: 2, 0xBEF1: 3})
+
+    def test_load_overflow(self) -> None:
+        with self.assertRaises(pycom.Memory.AddressError):
+            pycom.Memory(pycom.Bus()).load(pycom.Memory.size() - 1, [1, 2])
+
+    def test_view(self) -> None:
+        memory = pycom.Memory(pycom.Bus())
+        view = memory.view(0xBEEF, 0xBEF1)
+        memory[0xBEEF] = 1
+        self.assertEqual(bytes(view), bytes([1, 0]))
+        view[1] = 2
+        self.assertEqual(memory[0xBEF0], 2)
+
+    def test_watch(self) -> None:
+        memory = pycom.Memory(pycom.Bus())
+        memory.watch(0x10, 0x20)
+        memory.watch(0x18, kind=pycom.Memory.Watchpoint.READ)
+        self.assertEqual(memory.watchpoint(0x0F), pycom.Memory.Watchpoint(0))
+        self.assertEqual(memory.watchpoint(0x10), pycom.Memory.Watchpoint.WRITE)
+        self.assertEqual(
+            memory.watchpoint(0x18),
+            pycom.Memory.Watchpoint.READ | pycom.Memory.Watchpoint.WRITE,
+        )
+        memory.unwatch(0x11, 0x20, pycom.Memory.Watchpoint.WRITE)
+        self.assertDictEqual(
+            dict(memory.watchpoints),
+            {
+                0x10: pycom.Memory.Watchpoint.WRITE,
+                0x18: pycom.Memory.Watchpoint.READ,
+            },
+        )
+
+    def test_watch_invalid_address(self) -> None:
+        with self.assertRaises(pycom.Memory.AddressError):
+            pycom.Memory(pycom.Bus()).watch(0xFFFF, 0x10001)
+
+    def test_watch_write(self) -> None:
+        bus = pycom.Bus()
+        memory = pycom.Memory(bus, data={1: 2})
+        memory.watch(1)
+        memory.address = 1
+        memory.tick()
+        memory.set_controls("in")
+        bus.value = 3
+        memory.tick()
+        self.assertEqual(
+            list(memory.hits),
+            [
+                pycom.Memory.Hit(
+                    kind=pycom.Memory.Watchpoint.WRITE,
+                    address=1,
+                    old_value=2,
+                    new_value=3,
+                    cycle=1,
+                )
+            ],
+        )
+
+    def test_watch_read_callback(self) -> None:
+        memory = pycom.Memory(pycom.Bus(), data={1: 2})
+        hits: list[pycom.Memory.Hit] = []
+        memory.on_hit = hits.append
+        memory.watch(1, kind=pycom.Memory.Watchpoint.READ)
+        memory.address = 1
+        memory.set_controls("out")
+        memory.tick()
+        self.assertEqual(
+            hits,
+            [
+                pycom.Memory.Hit(
+                    kind=pycom.Memory.Watchpoint.READ,
+                    address=1,
+                    old_value=2,
+                    new_value=2,
+                    cycle=0,
+                )
+            ],
+        )
+        self.assertEqual(list(memory.hits), [])
+
+    def test_max_hits(self) -> None:
+        bus = pycom.Bus()
+        memory = pycom.Memory(bus, max_hits=2)
+        memory.watch(0)
+        memory.set_controls("in")
+        for value in range(3):
+            bus.value = value
+            memory.tick()
+        self.assertEqual([hit.new_value for hit in memory.hits], [1, 2])
+
+    def test_unwatchable(self) -> None:
+        memory = pycom.Memory(pycom.Bus(), watchable=False)
+        with self.assertRaises(pycom.Memory.WatchError):
+            memory.watch(0)
+        self.assertEqual(dict(memory.watchpoints), {})
+
+    def test_data_view(self) -> None:
+        m = pycom.Memory(pycom.Bus(), data={1: 2})
+        data = m.data
+        m[3] = 4
+        self.assertEqual(data, {1: 2, 3: 4})
+        with self.assertRaises(KeyError):
+            data[0]
+        self.assertFalse(hasattr(data, "__setitem__"))
+
+    def test_invalid_data(self) -> None:
+        with self.assertRaises(pycom.Memory.AddressError):
+            pycom.Memory(pycom.Bus(), data={-1: 2})
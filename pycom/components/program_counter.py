@@ -64,9 +64,15 @@ class ProgramCounter(component.Component):
         self._reset.value = reset
 
     @typing.override
-    def tick(self) -> None:
+    def phases(
+        self,
+    ) -> typing.Mapping[
+        component.Component.Phase, typing.Sequence[component.Component.Step]
+    ]:
+        return {self.Phase.COUNT: [self._count]}
+
+    def _count(self) -> None:
         if self.increment:
             self.value += 1
         elif self.reset:
             self.value = 0
-        super().tick()
@@ -3,6 +3,8 @@ from pycom.components import byte, bus, component, control
 
 
 class Register(component.Component):
+    __slots__ = ("bus", "__value", "_on_change", "_in", "_out")
+
     def __init__(
         self,
         bus: bus.Bus,
@@ -11,10 +13,10 @@ class Register(component.Component):
         value: int = 0,
     ) -> None:
         self.bus = bus
-        self.__value = byte.Byte(value)
+        self.__value = value % byte.MAX
         self._on_change = on_change
-        self._in = control.Control("in", lambda _: self._write())
-        self._out = control.Control("out", lambda _: self._write())
+        self._in = control.Control("in", self._on_control)
+        self._out = control.Control("out", self._on_control)
         component.Component.__init__(
             self,
             name,
@@ -26,6 +28,9 @@ class Register(component.Component):
             ),
         )
 
+    def _on_control(self, _: bool) -> None:
+        self._write()
+
     @typing.override
     def _str_line(self) -> str:
         return f"{self.name}={byte.Byte.hex_str(self.value)}"
@@ -33,13 +38,23 @@ class Register(component.Component):
     @property
     def value(self) -> int:
         self._write()
-        return self.__value.value
+        return self.__value
 
     @value.setter
     def value(self, value: int) -> None:
-        self.__value = byte.Byte(value)
+        self.__value = value % byte.MAX
         self._write()
 
+    @property
+    def byte(self) -> byte.Byte:
+        return byte.Byte(self.peek())
+
+    def peek(self) -> int:
+        return self.__value
+
+    def poke(self, value: int) -> None:
+        self.__value = value % byte.MAX
+
     @property
     def in_(self) -> bool:
         return self._in.value
@@ -59,18 +74,23 @@ class Register(component.Component):
         self._write()
 
     @typing.override
-    def tick(self) -> None:
-        self._read()
-        self._write()
-        super().tick()
+    def phases(
+        self,
+    ) -> typing.Mapping[
+        component.Component.Phase, typing.Sequence[component.Component.Step]
+    ]:
+        return {
+            self.Phase.DRIVE: [self._write],
+            self.Phase.LATCH: [self._read],
+        }
 
     def _read(self) -> None:
-        if self.in_:
+        if self._in.value:
             old_value = self.__value
-            self.__value = byte.Byte(self.bus.value)
+            self.__value = self.bus.value
             if old_value != self.__value and self._on_change is not None:
-                self._on_change(self.__value)
+                self._on_change(byte.Byte(self.__value))
 
     def _write(self) -> None:
-        if self.out:
-            self.bus.value = self.__value.value
+        if self._out.value:
+            self.bus.value = self.__value
@@ -62,3 +62,21 @@ class RegisterTest(unittest.TestCase):
         register.tick()
         self.assertEqual(bus.value, 2)
         self.assertEqual(register.value, 2)
+
+    def test_byte(self) -> None:
+        register = pycom.Register(pycom.Bus(), "a", value=0x1FF)
+        self.assertEqual(register.value, 0xFF)
+        self.assertEqual(register.byte, pycom.Byte(0xFF))
+
+    def test_byte_does_not_drive_bus(self) -> None:
+        bus = pycom.Bus()
+        register = pycom.Register(bus, "a", value=1)
+        register.out = True
+        bus.value = 2
+        self.assertEqual(register.byte, pycom.Byte(1))
+        self.assertEqual(bus.value, 2)
+
+    def test_slots(self) -> None:
+        register = pycom.Register(pycom.Bus(), "a")
+        self.assertFalse(hasattr(register, "__dict__"))
+        self.assertFalse(hasattr(register.control("in"), "__dict__"))
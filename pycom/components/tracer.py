@@ -0,0 +1,80 @@
+import dataclasses
+import enum
+import typing
+from pycom.components import errorable
+
+
+class Tracer(errorable.Errorable):
+    class Level(enum.IntEnum):
+        NONE = 0
+        INSTRUCTION = 1
+        TICK = 2
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Event:
+        @classmethod
+        def level(cls) -> "Tracer.Level":
+            return Tracer.Level.NONE
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Instruction(Event):
+        instruction: int
+        ticks: int
+
+        @classmethod
+        @typing.override
+        def level(cls) -> "Tracer.Level":
+            return Tracer.Level.INSTRUCTION
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Tick(Event):
+        state: "controller.Controller.State"
+        entry: "controller.Controller.Entry"
+
+        @classmethod
+        @typing.override
+        def level(cls) -> "Tracer.Level":
+            return Tracer.Level.TICK
+
+        @property
+        def controls(self) -> frozenset[str]:
+            return self.entry.controls
+
+    Subscriber: typing.TypeAlias = typing.Callable[[Event], None]
+
+    def __init__(self) -> None:
+        self.__subscribers: dict[Tracer.Subscriber, Tracer.Level] = {}
+        self.__level = self.Level.NONE
+
+    @property
+    def level(self) -> "Tracer.Level":
+        return self.__level
+
+    def enabled(self, level: "Tracer.Level") -> bool:
+        return self.__level >= level
+
+    def subscribe(
+        self,
+        subscriber: Subscriber,
+        level: "Tracer.Level" = Level.TICK,
+    ) -> None:
+        self.__subscribers[subscriber] = level
+        self.__update_level()
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        if subscriber not in self.__subscribers:
+            raise self.Error(f"unknown subscriber {subscriber}")
+        del self.__subscribers[subscriber]
+        self.__update_level()
+
+    def __update_level(self) -> None:
+        self.__level = max(self.__subscribers.values(), default=self.Level.NONE)
+
+    def emit(self, event: Event) -> None:
+        level = event.level()
+        for subscriber, subscriber_level in list(self.__subscribers.items()):
+            if subscriber_level >= level:
+                subscriber(event)
+
+
+from pycom.components import controller
@@ -0,0 +1,68 @@
+import unittest
+import pycom
+
+
+class TracerTest(unittest.TestCase):
+    def test_empty(self) -> None:
+        tracer = pycom.Tracer()
+        self.assertEqual(tracer.level, pycom.Tracer.Level.NONE)
+        self.assertFalse(tracer.enabled(pycom.Tracer.Level.INSTRUCTION))
+
+    def test_subscribe(self) -> None:
+        events: list[pycom.Tracer.Event] = []
+        tracer = pycom.Tracer()
+        tracer.subscribe(events.append, pycom.Tracer.Level.INSTRUCTION)
+        self.assertEqual(tracer.level, pycom.Tracer.Level.INSTRUCTION)
+        self.assertTrue(tracer.enabled(pycom.Tracer.Level.INSTRUCTION))
+        self.assertFalse(tracer.enabled(pycom.Tracer.Level.TICK))
+        instruction = pycom.Tracer.Instruction(instruction=1, ticks=2)
+        tracer.emit(instruction)
+        tracer.emit(
+            pycom.Tracer.Tick(
+                state=pycom.Controller.State(
+                    instruction=1,
+                    instruction_counter=0,
+                    status=0,
+                ),
+                entry=pycom.Controller.Entry(),
+            )
+        )
+        self.assertListEqual(events, [instruction])
+
+    def test_unsubscribe(self) -> None:
+        events: list[pycom.Tracer.Event] = []
+        tracer = pycom.Tracer()
+        tracer.subscribe(events.append)
+        tracer.unsubscribe(events.append)
+        self.assertEqual(tracer.level, pycom.Tracer.Level.NONE)
+        tracer.emit(pycom.Tracer.Instruction(instruction=1, ticks=2))
+        self.assertListEqual(events, [])
+
+    def test_unsubscribe_unknown(self) -> None:
+        with self.assertRaises(pycom.Tracer.Error):
+            pycom.Tracer().unsubscribe(print)
+
+    def test_computer(self) -> None:
+        events: list[pycom.Tracer.Event] = []
+        computer = pycom.Computer.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(1)),
+        )
+        computer.tracer.subscribe(events.append)
+        ticks = computer.run_instruction()
+        self.assertEqual(len(events), ticks + 1)
+        tick = events[0]
+        assert isinstance(tick, pycom.Tracer.Tick)
+        self.assertEqual(
+            tick.state,
+            pycom.Controller.State(instruction=0, instruction_counter=0, status=0),
+        )
+        self.assertIn("program_counter.high_byte.out", tick.controls)
+        self.assertEqual(
+            events[-1],
+            pycom.Tracer.Instruction(
+                instruction=pycom.Instructions.LDA.value.operand_instance(
+                    pycom.operands.Immediate
+                ).opcode,
+                ticks=ticks,
+            ),
+        )
@@ -1,5 +1,6 @@
 import abc
 import contextlib
+import threading
 import typing
 
 from pycom.components import errorable
@@ -8,13 +9,44 @@ from pycom.components import errorable
 class Validatable(abc.ABC, errorable.Errorable):
     class ValidationError(errorable.Errorable.Error): ...
 
+    class FrozenError(errorable.Errorable.Error): ...
+
+    class Deferral(threading.local):
+        count = 0
+
+    __slots__ = ("__pause_validation_count", "__frozen")
+
+    _deferral: typing.ClassVar[Deferral] = Deferral()
+
     def __init__(self) -> None:
         self.__pause_validation_count = 0
+        self.__frozen = False
 
     @typing.final
     @property
     def _validation_enabled(self) -> bool:
-        return self.__pause_validation_count == 0
+        return self.__pause_validation_count == 0 and Validatable._deferral.count == 0
+
+    @staticmethod
+    @contextlib.contextmanager
+    def deferred_validation() -> typing.Iterator[None]:
+        try:
+            Validatable._deferral.count += 1
+            yield
+        finally:
+            Validatable._deferral.count -= 1
+
+    @property
+    def frozen(self) -> bool:
+        return self.__frozen
+
+    def _freeze(self) -> None:
+        self.__frozen = True
+
+    @typing.final
+    def _check_not_frozen(self) -> None:
+        if self.__frozen:
+            raise self.FrozenError(f"{self} is frozen")
 
     @typing.final
     @contextlib.contextmanager
@@ -1,3 +1,4 @@
+import threading
 import typing
 import unittest
 
@@ -42,3 +43,26 @@ class ValidatableTest(unittest.TestCase):
     def test_invalid_operation(self) -> None:
         with self.assertRaises(self.TestObject.ValidationError):
             self.TestObject().invalid_operation()
+
+    def test_deferred_validation(self) -> None:
+        obj = self.TestObject()
+        with validatable.Validatable.deferred_validation():
+            obj.invalid_operation()
+            obj.valid = False
+        with self.assertRaises(self.TestObject.ValidationError):
+            obj.validate()
+
+    def test_deferred_validation_thread_local(self) -> None:
+        errors: list[Exception] = []
+
+        def run() -> None:
+            try:
+                self.TestObject().invalid_operation()
+            except self.TestObject.ValidationError as error:
+                errors.append(error)
+
+        with validatable.Validatable.deferred_validation():
+            thread = threading.Thread(target=run)
+            thread.start()
+            thread.join()
+        self.assertEqual(len(errors), 1)
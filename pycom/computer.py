@@ -1,3 +1,7 @@
+import dataclasses
+import enum
+import io
+import pickle
 import typing
 from pycom.components import (
     alu,
@@ -5,9 +9,11 @@ from pycom.components import (
     clock,
     component,
     controller,
+    errorable,
     memory,
     program_counter,
     register,
+    tracer,
 )
 from pycom.instructions import instructions
 from pycom.programs import program
@@ -17,41 +23,176 @@ class Computer(component.Component):
     STACK_POINTER_ADDR = 0x00FE
     STACK_ADDR = 0x0100
 
+    class SnapshotError(errorable.Errorable.Error, ValueError): ...
+
+    class StopReason(enum.Enum):
+        HALTED = enum.auto()
+        MAX_CYCLES = enum.auto()
+        BREAKPOINT = enum.auto()
+        INSTRUCTIONS = enum.auto()
+        WATCHPOINT = enum.auto()
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class RunResult:
+        reason: "Computer.StopReason"
+        cycles: int
+        instructions: int
+        hits: tuple[memory.Memory.Hit, ...] = ()
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Snapshot:
+        registers: bytes
+        control_word: int
+        bus: int
+        memory: bytes
+        cycle: int
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Template:
+        image: bytes
+        shared: tuple[typing.Any, ...]
+
+        class Pickler(pickle.Pickler):
+            def __init__(
+                self, file: io.BytesIO, shared: tuple[typing.Any, ...]
+            ) -> None:
+                super().__init__(file, pickle.HIGHEST_PROTOCOL)
+                self.__ids = {id(obj): i for i, obj in enumerate(shared)}
+
+            @typing.override
+            def persistent_id(self, obj: typing.Any) -> typing.Optional[int]:
+                return self.__ids.get(id(obj))
+
+        class Unpickler(pickle.Unpickler):
+            def __init__(
+                self, file: io.BytesIO, shared: tuple[typing.Any, ...]
+            ) -> None:
+                super().__init__(file)
+                self.__shared = shared
+
+            @typing.override
+            def persistent_load(self, pid: typing.Any) -> typing.Any:
+                return self.__shared[pid]
+
+        @classmethod
+        def of(cls, computer: "Computer") -> "Computer.Template":
+            shared = (computer.controller.rom, computer.controller.entries)
+            file = io.BytesIO()
+            cls.Pickler(file, shared).dump(computer)
+            return cls(image=file.getvalue(), shared=shared)
+
+        def instantiate(self) -> "Computer":
+            computer = self.Unpickler(io.BytesIO(self.image), self.shared).load()
+            assert isinstance(computer, Computer)
+            return computer
+
+    _templates: typing.ClassVar[
+        dict[tuple[type["Computer"], str, bool], "Computer.Template"]
+    ] = {}
+
     def __init__(
         self,
         name: typing.Optional[str] = None,
         *,
         data: typing.Optional[typing.Mapping[int, int]] = None,
+        frozen: bool = False,
     ) -> None:
-        self.bus = bus.Bus()
-        self.__a = register.Register(self.bus, "a")
-        self.__x = register.Register(self.bus, "x")
-        self.__y = register.Register(self.bus, "y")
-        self.__instruction_buffer = register.Register(self.bus, "instruction_buffer")
-        self.memory = memory.Memory(self.bus, data=data)
-        self.__program_counter = program_counter.ProgramCounter(self.bus)
-        self.controller = controller.Controller(
-            self.bus, instructions.Instructions.entries()
-        )
-        self.clock = clock.Clock()
-        self.alu = alu.ALU(self.bus)
-        super().__init__(
-            name or "computer",
-            children=frozenset(
-                {
-                    self.__a,
-                    self.__x,
-                    self.__y,
-                    self.__instruction_buffer,
-                    self.memory,
-                    self.__program_counter,
-                    self.controller,
-                    self.alu,
-                    self.clock,
-                }
-            ),
+        with self.deferred_validation():
+            self.bus = bus.Bus()
+            self.__a = register.Register(self.bus, "a")
+            self.__x = register.Register(self.bus, "x")
+            self.__y = register.Register(self.bus, "y")
+            self.__instruction_buffer = register.Register(
+                self.bus, "instruction_buffer"
+            )
+            self.memory = memory.Memory(self.bus)
+            if data is not None:
+                self.memory.load(0, memory.Memory.image(data))
+            self.__program_counter = program_counter.ProgramCounter(self.bus)
+            self.controller = controller.Controller(
+                self.bus, instructions.Instructions.entries()
+            )
+            self.clock = clock.Clock()
+            self.alu = alu.ALU(self.bus)
+            super().__init__(
+                name or "computer",
+                children=frozenset(
+                    {
+                        self.__a,
+                        self.__x,
+                        self.__y,
+                        self.__instruction_buffer,
+                        self.memory,
+                        self.__program_counter,
+                        self.controller,
+                        self.alu,
+                        self.clock,
+                    }
+                ),
+            )
+        if frozen:
+            self.freeze()
+        else:
+            self.validate()
+        self.controller.compile()
+        self.__registers = self._registers(self)
+        self.breakpoints: set[int] = set()
+
+    @staticmethod
+    def _registers(root: component.Component) -> typing.Sequence[register.Register]:
+        registers: list[register.Register] = []
+        components = [root]
+        while components:
+            component = components.pop()
+            if isinstance(component, register.Register):
+                registers.append(component)
+            components.extend(component.children)
+        return sorted(registers, key=lambda register: register.path)
+
+    def snapshot(self) -> Snapshot:
+        return self.Snapshot(
+            registers=bytes(register.peek() for register in self.__registers),
+            control_word=self.controller.control_word,
+            bus=self.bus.value,
+            memory=bytes(self.memory.view()),
+            cycle=self.cycle,
         )
 
+    def restore(self, snapshot: Snapshot) -> None:
+        if len(snapshot.registers) != len(self.__registers):
+            raise self.SnapshotError(
+                f"snapshot has {len(snapshot.registers)} registers, expected {len(self.__registers)}"
+            )
+        if len(snapshot.memory) != memory.Memory.size():
+            raise self.SnapshotError(
+                f"snapshot has {len(snapshot.memory)} bytes of memory, expected {memory.Memory.size()}"
+            )
+        for register, value in zip(self.__registers, snapshot.registers):
+            register.poke(value)
+        self.controller.control_word = snapshot.control_word
+        self.memory.load(0, snapshot.memory)
+        self.bus.value = snapshot.bus
+        self.cycle = snapshot.cycle
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._templates.clear()
+
+    def fork(self) -> "Computer":
+        key = (type(self), self.name, self.frozen)
+        if key not in self._templates:
+            self._templates[key] = self.Template.of(
+                type(self)(self.name, frozen=self.frozen)
+            )
+        computer = self._templates[key].instantiate()
+        computer.restore(self.snapshot())
+        computer.breakpoints = set(self.breakpoints)
+        for address, kind in self.memory.watchpoints.items():
+            computer.memory.watch(address, kind=kind)
+        computer.memory.on_hit = self.memory.on_hit
+        computer.event_driven = self.event_driven
+        return computer
+
     @property
     def program_counter(self) -> int:
         return self.__program_counter.value
@@ -84,6 +225,10 @@ class Computer(component.Component):
     def y(self, y: int) -> None:
         self.__y.value = y
 
+    @property
+    def tracer(self) -> tracer.Tracer:
+        return self.controller.tracer
+
     @typing.override
     def _str_line(self) -> str:
         return f"Computer(bus={self.bus})"
@@ -96,6 +241,10 @@ class Computer(component.Component):
     def status(self, status: int) -> None:
         self.alu.status = status
 
+    @property
+    def halted(self) -> bool:
+        return self.clock.disable
+
     def tick(self) -> None:
         self.controller.apply(self.status)
         super().tick()
@@ -109,6 +258,55 @@ class Computer(component.Component):
     def run(self) -> int:
         return self.clock.run()
 
+    def run_until(
+        self,
+        *,
+        max_cycles: typing.Optional[int] = None,
+        until_pc: typing.Optional[int | typing.Iterable[int]] = None,
+        until_instructions: typing.Optional[int] = None,
+    ) -> RunResult:
+        match until_pc:
+            case None:
+                breakpoints = frozenset(self.breakpoints)
+            case int():
+                breakpoints = frozenset(self.breakpoints | {until_pc})
+            case _:
+                breakpoints = frozenset(self.breakpoints).union(until_pc)
+        cycles = 0
+        instructions = 0
+        self.memory.hits.clear()
+        self.clock.disable = False
+        while True:
+            if max_cycles is not None and cycles >= max_cycles:
+                reason = self.StopReason.MAX_CYCLES
+                break
+            self.tick()
+            cycles += 1
+            completed = self.controller.instruction_counter == 0
+            instructions += completed
+            if self.clock.disable:
+                reason = self.StopReason.HALTED
+                break
+            if self.memory.hits:
+                reason = self.StopReason.WATCHPOINT
+                break
+            if completed:
+                if (
+                    until_instructions is not None
+                    and instructions >= until_instructions
+                ):
+                    reason = self.StopReason.INSTRUCTIONS
+                    break
+                if self.program_counter in breakpoints:
+                    reason = self.StopReason.BREAKPOINT
+                    break
+        return self.RunResult(
+            reason=reason,
+            cycles=cycles,
+            instructions=instructions,
+            hits=tuple(self.memory.hits),
+        )
+
     @classmethod
     def build(cls, *entries: program.Entry) -> "Computer":
         return cls.for_program(program.Program.build(*entries))
@@ -116,3 +314,6 @@ class Computer(component.Component):
     @classmethod
     def for_program(cls, program: program.Program) -> "Computer":
         return program.as_computer()
+
+
+instructions.Instructions.on_invalidate(Computer.clear_cache)
@@ -1,3 +1,5 @@
+import dataclasses
+import typing
 import unittest
 import pycom
 
@@ -330,3 +332,256 @@ class ComputerTest(unittest.TestCase):
         )
         computer.run()
         self.assertEqual(computer.a, 15)
+
+    def test_snapshot_restore(self) -> None:
+        computer = pycom.Computer.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(0x42)),
+            pycom.Instructions.STA(pycom.operands.Absolute("result")),
+            pycom.Instructions.HLT(),
+            "result",
+        )
+        computer.run_instruction()
+        for _ in range(3):
+            computer.tick()
+        snapshot = computer.snapshot()
+        ticks = computer.run()
+        a, program_counter, data = (
+            computer.a,
+            computer.program_counter,
+            dict(computer.memory.data),
+        )
+        computer.restore(snapshot)
+        self.assertEqual(computer.snapshot(), snapshot)
+        self.assertEqual(computer.controller.instruction_counter, 3)
+        self.assertEqual(computer.run(), ticks)
+        self.assertEqual(computer.a, a)
+        self.assertEqual(computer.program_counter, program_counter)
+        self.assertDictEqual(dict(computer.memory.data), data)
+
+    def test_fork(self) -> None:
+        computer = pycom.Computer.build(
+            pycom.Instructions.LDX(pycom.operands.Immediate(3)),
+            "loop",
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("done")),
+            pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+            "done",
+            pycom.Instructions.HLT(),
+        )
+        computer.run_instructions(2)
+        computer.tick()
+        fork = computer.fork()
+        self.assertIsNot(fork, computer)
+        self.assertEqual(fork.snapshot(), computer.snapshot())
+        fork.x = 1
+        self.assertEqual(computer.x, 2)
+        self.assertEqual(computer.run(), fork.run() + 4 + 10 + 6)
+        self.assertEqual(computer.x, fork.x)
+        self.assertEqual(computer.program_counter, fork.program_counter)
+
+    def test_fork_independent(self) -> None:
+        computer = pycom.Computer.for_program(pycom.workloads.multiply().program)
+        lhs = computer.fork()
+        rhs = computer.fork()
+        lhs.memory[0x1234] = 1
+        lhs.run()
+        self.assertEqual(rhs.memory[0x1234], 0)
+        self.assertEqual(rhs.snapshot(), computer.snapshot())
+        self.assertIsNot(lhs.tracer, rhs.tracer)
+        self.assertIs(lhs.controller.rom, computer.controller.rom)
+        self.assertEqual(rhs.run(), computer.run())
+
+    def test_fork_debug_state(self) -> None:
+        program = pycom.workloads.multiply().program
+        computer = program.as_computer()
+        computer.breakpoints.add(program.label("done"))
+        computer.memory.watch(program.label("result"))
+        computer.memory.watch(program.label("lhs"), kind=pycom.Memory.Watchpoint.READ)
+        hits: list[pycom.Memory.Hit] = []
+        computer.memory.on_hit = hits.append
+        computer.event_driven = True
+        fork = computer.fork()
+        self.assertSetEqual(fork.breakpoints, computer.breakpoints)
+        self.assertIsNot(fork.breakpoints, computer.breakpoints)
+        self.assertDictEqual(
+            dict(fork.memory.watchpoints), dict(computer.memory.watchpoints)
+        )
+        self.assertIs(fork.memory.on_hit, computer.memory.on_hit)
+        self.assertTrue(fork.event_driven)
+        self.assertEqual(fork.run_until().reason, pycom.Computer.StopReason.BREAKPOINT)
+        self.assertTrue(hits)
+
+    def test_restore_invalid_snapshot(self) -> None:
+        snapshot = pycom.Computer().snapshot()
+        for invalid in list[pycom.Computer.Snapshot](
+            [
+                dataclasses.replace(snapshot, registers=snapshot.registers[1:]),
+                dataclasses.replace(snapshot, memory=snapshot.memory[1:]),
+            ]
+        ):
+            with self.subTest(snapshot=invalid):
+                with self.assertRaises(pycom.Computer.SnapshotError):
+                    pycom.Computer().restore(invalid)
+
+    def test_run_until_halted(self) -> None:
+        computer = pycom.Computer.build(
+            pycom.Instructions.NOP(),
+            pycom.Instructions.HLT(),
+        )
+        self.assertEqual(
+            computer.run_until(),
+            pycom.Computer.RunResult(
+                reason=pycom.Computer.StopReason.HALTED,
+                cycles=8,
+                instructions=2,
+            ),
+        )
+
+    def test_run_until(self) -> None:
+        program = pycom.Program.build(
+            "loop",
+            pycom.Instructions.INX(),
+            "jmp",
+            pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+        )
+        for kwargs, result, x in list[
+            tuple[dict[str, typing.Any], pycom.Computer.RunResult, int]
+        ](
+            [
+                (
+                    {"max_cycles": 100},
+                    pycom.Computer.RunResult(
+                        reason=pycom.Computer.StopReason.MAX_CYCLES,
+                        cycles=100,
+                        instructions=12,
+                    ),
+                    6,
+                ),
+                (
+                    {"until_instructions": 5},
+                    pycom.Computer.RunResult(
+                        reason=pycom.Computer.StopReason.INSTRUCTIONS,
+                        cycles=6 + 10 + 6 + 10 + 6,
+                        instructions=5,
+                    ),
+                    3,
+                ),
+                (
+                    {"until_pc": program.label("jmp")},
+                    pycom.Computer.RunResult(
+                        reason=pycom.Computer.StopReason.BREAKPOINT,
+                        cycles=6,
+                        instructions=1,
+                    ),
+                    1,
+                ),
+                (
+                    {"until_pc": [0xBEEF, program.label("loop")]},
+                    pycom.Computer.RunResult(
+                        reason=pycom.Computer.StopReason.BREAKPOINT,
+                        cycles=16,
+                        instructions=2,
+                    ),
+                    1,
+                ),
+            ]
+        ):
+            with self.subTest(kwargs=kwargs):
+                computer = program.as_computer()
+                self.assertEqual(computer.run_until(**kwargs), result)
+                self.assertEqual(computer.x, x)
+
+    def test_breakpoints(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.NOP(),
+            "breakpoint",
+            pycom.Instructions.NOP(),
+            pycom.Instructions.HLT(),
+        )
+        computer = program.as_computer()
+        computer.breakpoints.add(program.label("breakpoint"))
+        result = computer.run_until()
+        self.assertEqual(result.reason, pycom.Computer.StopReason.BREAKPOINT)
+        self.assertEqual(computer.program_counter, program.label("breakpoint"))
+        self.assertEqual(computer.run_until().reason, pycom.Computer.StopReason.HALTED)
+
+    def test_run_until_watchpoint(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(0x42)),
+            pycom.Instructions.STA(pycom.operands.Absolute("result")),
+            pycom.Instructions.HLT(),
+            "result",
+            0x01,
+        )
+        computer = program.as_computer()
+        ticks = computer.run_instruction()
+        computer = computer.fork()
+        computer.memory.watch(program.label("result"))
+        result = computer.run_until()
+        self.assertEqual(result.reason, pycom.Computer.StopReason.WATCHPOINT)
+        self.assertEqual(
+            result.hits,
+            (
+                pycom.Memory.Hit(
+                    kind=pycom.Memory.Watchpoint.WRITE,
+                    address=program.label("result"),
+                    old_value=0x01,
+                    new_value=0x42,
+                    cycle=ticks + result.cycles - 1,
+                ),
+            ),
+        )
+        self.assertEqual(computer.cycle, ticks + result.cycles)
+        self.assertEqual(computer.run_until().reason, pycom.Computer.StopReason.HALTED)
+
+    def test_event_driven(self) -> None:
+        for workload in pycom.workloads.corpus():
+            with self.subTest(workload=workload.name):
+                full = pycom.Computer.for_program(workload.program)
+                event_driven = pycom.Computer.for_program(workload.program)
+                event_driven.event_driven = True
+                for _ in range(1000):
+                    if full.halted:
+                        break
+                    full.tick()
+                    event_driven.tick()
+                    self.assertEqual(
+                        (event_driven.a, event_driven.x, event_driven.y),
+                        (full.a, full.x, full.y),
+                    )
+                    self.assertEqual(
+                        (event_driven.program_counter, event_driven.status),
+                        (full.program_counter, full.status),
+                    )
+                self.assertEqual(event_driven.halted, full.halted)
+                self.assertEqual(event_driven.snapshot(), full.snapshot())
+                self.assertEqual(event_driven.cycle, full.cycle)
+
+    def test_worklist(self) -> None:
+        computer = pycom.Computer.build(pycom.Instructions.HLT())
+        computer.event_driven = True
+        self.assertSetEqual(set(computer.worklist), set())
+        computer.set_control("a.out", True)
+        self.assertSetEqual(set(computer.worklist), {computer.child("a")})
+        computer.set_control("a.out", False)
+        self.assertSetEqual(set(computer.worklist), set())
+
+    def test_frozen(self) -> None:
+        program = pycom.workloads.multiply().program
+        computer = pycom.Computer(data=program.output().data, frozen=True)
+        self.assertTrue(computer.frozen)
+        self.assertTrue(computer.fork().frozen)
+        with self.assertRaises(pycom.Component.FrozenError):
+            computer.add_child(pycom.Component("other"))
+        self.assertEqual(computer.run(), program.as_computer().run())
+
+    def test_external_controls_cleared_on_tick(self) -> None:
+        computer = pycom.Computer.build(pycom.Instructions.NOP())
+        computer.tick()
+        computer.set_controls("a.out", "x.in")
+        self.assertEqual(
+            computer.controller.control_word, computer.controller.control_words.word()
+        )
+        computer.tick()
+        self.assertFalse(computer.control("a.out").value)
+        self.assertFalse(computer.control("x.in").value)
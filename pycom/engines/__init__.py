@@ -0,0 +1,10 @@
+from .engine import Engine
+from .profiler import Profiler
+from .datapath import Datapath
+from .interpreter import Interpreter
+from .codegen import Codegen
+from .batch import Batch
+from .runner import Runner, run_many
+from .trace import Trace
+from .differential import Differential
+from .netlist import Netlist
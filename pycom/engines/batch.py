@@ -0,0 +1,218 @@
+import typing
+import numpy
+import numpy.typing
+from pycom import computer
+from pycom.components import alu, byte, controller, errorable, memory
+from pycom.engines import datapath
+from pycom.instructions import instructions
+from pycom.programs import program
+
+Array: typing.TypeAlias = numpy.typing.NDArray[typing.Any]
+
+
+class Batch(errorable.Errorable):
+    def __init__(
+        self,
+        size: int,
+        *,
+        data: typing.Optional[typing.Mapping[int, int]] = None,
+    ) -> None:
+        if size <= 0:
+            raise self.Error(f"invalid batch size {size}")
+        self.__datapath = datapath.Datapath(computer.Computer())
+        self.__rom = controller.Controller.Rom.for_entries(
+            instructions.Instructions.entries()
+        )
+        self.__controls = tuple(
+            sorted(
+                frozenset[str]().union(
+                    *[entry.controls for entry in self.__rom.entries]
+                ),
+                key=lambda control: (self.__datapath.operation(control).phase, control),
+            )
+        )
+        self.__operations = [
+            self.__datapath.operation(control) for control in self.__controls
+        ]
+        self.__words = numpy.array(
+            [
+                [bool(word & (1 << i)) for i in range(len(self.__controls))]
+                for word in self.__rom.control_words(self.__controls)
+            ],
+            dtype=numpy.bool_,
+        ).reshape(len(self.__rom.entries), len(self.__controls))
+        self.__table = numpy.array(self.__rom.table, dtype=numpy.int32)
+        self.__status_indices = numpy.array(
+            self.__rom.status_indices, dtype=numpy.int32
+        )
+        self.__num_statuses = int(self.__status_indices.max()) + 1
+        self.__registers = {
+            register: numpy.zeros(size, dtype=numpy.uint8)
+            for register in self.__datapath.registers
+        }
+        self.__bus = numpy.zeros(size, dtype=numpy.uint8)
+        self.memory = numpy.zeros((size, memory.Memory.size()), dtype=numpy.uint8)
+        for address, value in (data or {}).items():
+            self.memory[:, address] = value % byte.Byte.max()
+        self.halted = numpy.zeros(size, dtype=numpy.bool_)
+        self.faulted = numpy.zeros(size, dtype=numpy.bool_)
+        self.ticks = numpy.zeros(size, dtype=numpy.int64)
+
+    @property
+    def size(self) -> int:
+        return len(self.halted)
+
+    def register(self, name: str) -> Array:
+        if name not in self.__registers:
+            raise self.Error(f"unknown register {name}")
+        return self.__registers[name]
+
+    @property
+    def a(self) -> Array:
+        return self.register("a")
+
+    @a.setter
+    def a(self, a: numpy.typing.ArrayLike) -> None:
+        self.a[:] = numpy.asarray(a) % byte.Byte.max()
+
+    @property
+    def x(self) -> Array:
+        return self.register("x")
+
+    @x.setter
+    def x(self, x: numpy.typing.ArrayLike) -> None:
+        self.x[:] = numpy.asarray(x) % byte.Byte.max()
+
+    @property
+    def y(self) -> Array:
+        return self.register("y")
+
+    @y.setter
+    def y(self, y: numpy.typing.ArrayLike) -> None:
+        self.y[:] = numpy.asarray(y) % byte.Byte.max()
+
+    @property
+    def program_counter(self) -> Array:
+        return (
+            self.register("program_counter.high_byte").astype(numpy.uint16) << 8
+        ) | self.register("program_counter.low_byte")
+
+    @program_counter.setter
+    def program_counter(self, program_counter: numpy.typing.ArrayLike) -> None:
+        value = numpy.asarray(program_counter) % memory.Memory.size()
+        self.register("program_counter.high_byte")[:] = value >> 8
+        self.register("program_counter.low_byte")[:] = value & 0xFF
+
+    @property
+    def status(self) -> Array:
+        return self.register("alu.status")
+
+    @status.setter
+    def status(self, status: numpy.typing.ArrayLike) -> None:
+        self.status[:] = numpy.asarray(status) % byte.Byte.max()
+
+    @property
+    def active(self) -> Array:
+        return ~(self.halted | self.faulted)
+
+    def tick(self) -> int:
+        machines = numpy.flatnonzero(self.active)
+        if not len(machines):
+            return 0
+        instruction_counter = self.register(self.__datapath.instruction_counter)[
+            machines
+        ].astype(numpy.int32)
+        valid = instruction_counter < self.__rom.num_counters
+        indices = (
+            self.register("controller.instruction_buffer")[machines].astype(numpy.int32)
+            * self.__rom.num_counters
+            + numpy.minimum(instruction_counter, self.__rom.num_counters - 1)
+        ) * self.__num_statuses + self.__status_indices[
+            self.status[machines] & self.__rom.status_mask
+        ]
+        entries = numpy.where(valid, self.__table[indices], -1)
+        faulted = entries == -1
+        self.faulted[machines[faulted]] = True
+        machines, entries = machines[~faulted], entries[~faulted]
+        words = self.__words[entries]
+        for i in numpy.flatnonzero(words.any(axis=0)):
+            self.__apply(self.__operations[i], machines[words[:, i]])
+        self.ticks[machines] += 1
+        return len(machines)
+
+    def run(self, max_ticks: typing.Optional[int] = None) -> Array:
+        ticks = 0
+        while (max_ticks is None or ticks < max_ticks) and self.tick():
+            ticks += 1
+        return self.ticks
+
+    def __apply(self, operation: datapath.Datapath.Operation, machines: Array) -> None:
+        registers = [self.register(register) for register in operation.registers]
+        match operation.kind:
+            case datapath.Datapath.Kind.REGISTER_OUT:
+                self.__bus[machines] = registers[0][machines]
+            case datapath.Datapath.Kind.REGISTER_IN:
+                registers[0][machines] = self.__bus[machines]
+            case datapath.Datapath.Kind.COUNTER_INCREMENT:
+                registers[0][machines] += 1
+            case datapath.Datapath.Kind.COUNTER_RESET:
+                registers[0][machines] = 0
+            case datapath.Datapath.Kind.PROGRAM_COUNTER_INCREMENT:
+                high, low = registers
+                value = ((high[machines].astype(numpy.int32) << 8) | low[machines]) + 1
+                high[machines] = (value >> 8) & 0xFF
+                low[machines] = value & 0xFF
+            case datapath.Datapath.Kind.PROGRAM_COUNTER_RESET:
+                high, low = registers
+                high[machines] = 0
+                low[machines] = 0
+            case datapath.Datapath.Kind.MEMORY_OUT:
+                self.__bus[machines] = self.memory[
+                    machines, self.__address(registers, machines)
+                ]
+            case datapath.Datapath.Kind.MEMORY_IN:
+                self.memory[machines, self.__address(registers, machines)] = self.__bus[
+                    machines
+                ]
+            case datapath.Datapath.Kind.CARRY_SET:
+                registers[0][machines] |= alu.ALU.CARRY
+            case datapath.Datapath.Kind.CARRY_CLEAR:
+                registers[0][machines] &= ~alu.ALU.CARRY & 0xFF
+            case (
+                datapath.Datapath.Kind.ADD
+                | datapath.Datapath.Kind.INC
+                | datapath.Datapath.Kind.DEC
+            ):
+                lhs, rhs, result, status = registers
+                status_value = status[machines]
+                value = lhs[machines].astype(numpy.int32)
+                match operation.kind:
+                    case datapath.Datapath.Kind.ADD:
+                        value += (status_value & alu.ALU.CARRY) + rhs[machines]
+                    case datapath.Datapath.Kind.INC:
+                        value += 1
+                    case datapath.Datapath.Kind.DEC:
+                        value -= 1
+                result[machines] = value & 0xFF
+                status[machines] = (
+                    (status_value & (~(alu.ALU.CARRY | alu.ALU.ZERO) & 0xFF))
+                    | numpy.where(
+                        (value >= byte.Byte.max()) | (value < 0), alu.ALU.CARRY, 0
+                    )
+                    | numpy.where(value & 0xFF == 0, alu.ALU.ZERO, 0)
+                )
+            case datapath.Datapath.Kind.HALT:
+                self.halted[machines] = True
+
+    @staticmethod
+    def __address(registers: typing.Sequence[Array], machines: Array) -> Array:
+        high, low = registers
+        return (high[machines].astype(numpy.int32) << 8) | low[machines]
+
+    @classmethod
+    def build(cls, size: int, *entries: program.Entry) -> "Batch":
+        return cls.for_program(program.Program.build(*entries), size)
+
+    @classmethod
+    def for_program(cls, program: program.Program, size: int) -> "Batch":
+        return cls(size, data=program.output().data)
@@ -0,0 +1,134 @@
+import unittest
+import numpy
+import pycom
+
+
+class BatchTest(unittest.TestCase):
+    def test_invalid_size(self) -> None:
+        with self.assertRaises(pycom.Batch.Error):
+            pycom.Batch(0)
+
+    def test_unknown_register(self) -> None:
+        with self.assertRaises(pycom.Batch.Error):
+            pycom.Batch(1).register("invalid")
+
+    def test_empty(self) -> None:
+        batch = pycom.Batch(3)
+        numpy.testing.assert_array_equal(batch.run(), [pycom.Computer().run()] * 3)
+        self.assertTrue(batch.halted.all())
+        self.assertFalse(batch.active.any())
+        numpy.testing.assert_array_equal(batch.program_counter, [1] * 3)
+
+    def test_invalid_opcode(self) -> None:
+        batch = pycom.Batch.build(2, 0xFF)
+        batch.run()
+        self.assertTrue(batch.faulted.all())
+        self.assertFalse(batch.halted.any())
+
+    def test_registers(self) -> None:
+        batch = pycom.Batch(2)
+        batch.a = [0x142, 0x43]
+        batch.program_counter = 0x1BEEF
+        numpy.testing.assert_array_equal(batch.a, [0x42, 0x43])
+        numpy.testing.assert_array_equal(batch.program_counter, [0xBEEF, 0xBEEF])
+
+    def test_bne(self) -> None:
+        batch = pycom.Batch.for_program(
+            pycom.Program()
+            .at(0xBEEF)
+            .with_entry(pycom.Instructions.BNE(pycom.operands.Relative(0x42))),
+            2,
+        )
+        batch.status = [pycom.ALU.ZERO, 0]
+        batch.program_counter = 0xBEEF
+        batch.run(max_ticks=4)
+        self.assertEqual(batch.program_counter[1], 0xBEF1)
+        batch.run(max_ticks=2)
+        self.assertEqual(batch.program_counter[0], 0xBE42)
+
+    def test_divergent(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(0)),
+            pycom.Instructions.LDY(pycom.operands.Immediate(5)),
+            "loop",
+            pycom.Instructions.STY(pycom.operands.Absolute("tmp")),
+            pycom.Instructions.ADC(pycom.operands.Absolute("tmp")),
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("done")),
+            pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+            "done",
+            pycom.Instructions.HLT(),
+            "tmp",
+        )
+        counts = [1, 2, 3, 7]
+        batch = pycom.Batch.for_program(program, len(counts))
+        batch.x = counts
+        batch.run()
+        self.assertTrue(batch.halted.all())
+        for i, count in enumerate(counts):
+            with self.subTest(count=count):
+                interpreter = pycom.Interpreter.for_program(program)
+                interpreter.x = count
+                ticks = interpreter.run()
+                self.assertEqual(batch.ticks[i], ticks)
+                self.assertEqual(batch.a[i], interpreter.a)
+                self.assertEqual(batch.x[i], interpreter.x)
+                self.assertEqual(batch.y[i], interpreter.y)
+                self.assertEqual(batch.status[i], interpreter.status)
+                self.assertEqual(batch.program_counter[i], interpreter.program_counter)
+                self.assertEqual(
+                    bytes(batch.memory[i]), bytes(interpreter.memory.view())
+                )
+
+    def test_matches_computer(self) -> None:
+        for program in list[pycom.Program](
+            [
+                pycom.Program.build(
+                    pycom.Instructions.LDA(pycom.operands.Immediate(0xFF)),
+                    pycom.Instructions.SEC(),
+                    pycom.Instructions.ADC(pycom.operands.Absolute("value")),
+                    pycom.Instructions.STA(pycom.operands.Absolute("result")),
+                    pycom.Instructions.CLC(),
+                    pycom.Instructions.NOP(),
+                    pycom.Instructions.HLT(),
+                    "value",
+                    0x01,
+                    "result",
+                ),
+                pycom.Program.build(
+                    pycom.Instructions.LDX(pycom.operands.Immediate(0)),
+                    pycom.Instructions.DEX(),
+                    pycom.Instructions.INX(),
+                    pycom.Instructions.STX(pycom.operands.Absolute("x")),
+                    pycom.Instructions.LDY(pycom.operands.Absolute("x")),
+                    pycom.Instructions.INY(),
+                    pycom.Instructions.DEY(),
+                    pycom.Instructions.STY(pycom.operands.Absolute("y")),
+                    pycom.Instructions.LDA(pycom.operands.Absolute("y")),
+                    pycom.Instructions.HLT(),
+                    "x",
+                    0,
+                    "y",
+                ),
+            ]
+        ):
+            with self.subTest(program=program):
+                computer = program.as_computer()
+                batch = pycom.Batch.for_program(program, 2)
+                ticks = computer.run()
+                numpy.testing.assert_array_equal(batch.run(), [ticks] * 2)
+                numpy.testing.assert_array_equal(batch.a, [computer.a] * 2)
+                numpy.testing.assert_array_equal(batch.x, [computer.x] * 2)
+                numpy.testing.assert_array_equal(batch.y, [computer.y] * 2)
+                numpy.testing.assert_array_equal(batch.status, [computer.status] * 2)
+                numpy.testing.assert_array_equal(
+                    batch.program_counter, [computer.program_counter] * 2
+                )
+                for i in range(2):
+                    self.assertDictEqual(
+                        {
+                            int(address): int(batch.memory[i, address])
+                            for address in numpy.flatnonzero(batch.memory[i])
+                        },
+                        dict(computer.memory.data),
+                    )
@@ -0,0 +1,275 @@
+import dataclasses
+import hashlib
+import os
+import pathlib
+import typing
+from pycom import computer
+from pycom.components import bus, byte, component, controller, errorable, memory
+from pycom.engines import datapath, profiler
+from pycom.instructions import instructions
+from pycom.programs import program
+
+
+class Codegen(errorable.Errorable):
+    class InvalidOpcodeError(errorable.Errorable.Error, KeyError): ...
+
+    VERSION = 2
+
+    Function: typing.TypeAlias = typing.Callable[["Codegen", memoryview], None]
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Module:
+        registers: typing.Sequence[str]
+        status_mask: int
+        functions: typing.Sequence[typing.Optional["Codegen.Function"]]
+        ticks: typing.Sequence[int]
+
+        @classmethod
+        def load(cls, source: str, filename: str) -> "Codegen.Module":
+            namespace: dict[str, typing.Any] = {}
+            exec(compile(source, filename, "exec"), namespace)
+            return cls(
+                registers=namespace["REGISTERS"],
+                status_mask=namespace["STATUS_MASK"],
+                functions=tuple(namespace["FUNCTIONS"]),
+                ticks=tuple(namespace["TICKS"]),
+            )
+
+    class Generator:
+        def __init__(self, root: component.Component) -> None:
+            self.__datapath = datapath.Datapath(root)
+
+        @property
+        def registers(self) -> typing.Sequence[str]:
+            return [self.var(register) for register in self.__datapath.registers]
+
+        @staticmethod
+        def var(register: str) -> str:
+            return register.replace(".", "_")
+
+        def step(
+            self, controls: typing.Iterable[str]
+        ) -> list[datapath.Datapath.Statement]:
+            return [
+                operation.statement(self.var, bus="bus", halt="s.halted = True")
+                for operation in self.__datapath.step(controls)
+                if operation.registers[:1] != (self.__datapath.instruction_counter,)
+            ]
+
+        def function(
+            self,
+            name: str,
+            steps: typing.Iterable[typing.Iterable[str]],
+        ) -> str:
+            statements = [
+                statement for controls in steps for statement in self.step(controls)
+            ]
+            used = sorted(
+                frozenset().union(
+                    *[statement.reads | statement.writes for statement in statements]
+                )
+            )
+            written = sorted(
+                frozenset().union(*[statement.writes for statement in statements])
+            )
+            lines = [f"def {name}(s, data):"]
+            lines += [f"    {var} = s._{var}" for var in used]
+            lines += [
+                f"    {line}"
+                for statement in statements
+                for line in statement.code.split("\n")
+            ]
+            lines += [f"    s._{var} = {var}" for var in written]
+            if len(lines) == 1:
+                lines.append("    pass")
+            return "\n".join(lines)
+
+        def source(self, rom: controller.Controller.Rom) -> str:
+            num_statuses = rom.status_mask + 1
+            ticks = [0] * (byte.Byte.max() * num_statuses)
+            functions: list[str] = []
+            table: list[str] = []
+            for instruction in instructions.Instructions:
+                for opcode in instruction.value.opcodes:
+                    for status in range(num_statuses):
+                        if status & rom.status_mask != status:
+                            continue
+                        index = opcode * num_statuses + status
+                        ticks[index] = rom.ticks(opcode, status)
+                        name = f"{instruction.name.lower()}_{opcode:02x}_{status:02x}"
+                        functions.append(
+                            self.function(
+                                name,
+                                [
+                                    rom.entry(
+                                        opcode, instruction_counter, status
+                                    ).controls
+                                    for instruction_counter in range(ticks[index])
+                                ],
+                            )
+                        )
+                        table.append(f"FUNCTIONS[{index}] = {name}")
+            return "\n".join(
+                [
+                    f"REGISTERS = {tuple(['bus', *self.registers])!r}",
+                    f"STATUS_MASK = {rom.status_mask}",
+                    f"TICKS = {ticks!r}",
+                    "",
+                    *[f"\n{function}\n" for function in functions],
+                    f"FUNCTIONS = [None] * {len(ticks)}",
+                    *table,
+                    "",
+                ]
+            )
+
+    _modules: typing.ClassVar[dict[str, "Codegen.Module"]] = {}
+
+    _a: int
+    _x: int
+    _y: int
+    _alu_status: int
+    _program_counter_high_byte: int
+    _program_counter_low_byte: int
+
+    def __init__(
+        self,
+        *,
+        data: typing.Optional[typing.Mapping[int, int]] = None,
+        cache_dir: typing.Optional[pathlib.Path] = None,
+    ) -> None:
+        self.memory = memory.Memory(bus.Bus(), data=data, watchable=False)
+        self._data = self.memory.view()
+        self._module = self.module(cache_dir)
+        for var in self._module.registers:
+            setattr(self, f"_{var}", 0)
+        self.halted = False
+        self.ticks = 0
+        self.profiler: typing.Optional[profiler.Profiler] = None
+
+    @classmethod
+    def default_cache_dir(cls) -> pathlib.Path:
+        return (
+            pathlib.Path(
+                os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+            )
+            / "pycom"
+            / "codegen"
+        )
+
+    @classmethod
+    def key(cls, rom: controller.Controller.Rom) -> str:
+        return hashlib.sha256(
+            "\n".join(
+                [
+                    f"version={cls.VERSION}",
+                    *[repr(rom.sort_key(entry)) for entry in rom.entries],
+                ]
+            ).encode()
+        ).hexdigest()
+
+    @classmethod
+    def module(cls, cache_dir: typing.Optional[pathlib.Path] = None) -> Module:
+        rom = controller.Controller.Rom.for_entries(instructions.Instructions.entries())
+        key = cls.key(rom)
+        if key not in cls._modules:
+            path = (cache_dir or cls.default_cache_dir()) / f"{key}.py"
+            if path.exists():
+                source = path.read_text()
+            else:
+                source = cls.Generator(computer.Computer()).source(rom)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                temp_path.write_text(source)
+                os.replace(temp_path, path)
+            cls._modules[key] = cls.Module.load(source, str(path))
+        return cls._modules[key]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._modules.clear()
+
+    @property
+    def a(self) -> int:
+        return self._a
+
+    @a.setter
+    def a(self, a: int) -> None:
+        self._a = a % byte.Byte.max()
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, x: int) -> None:
+        self._x = x % byte.Byte.max()
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, y: int) -> None:
+        self._y = y % byte.Byte.max()
+
+    @property
+    def program_counter(self) -> int:
+        return byte.Byte.unpartition(
+            self._program_counter_high_byte, self._program_counter_low_byte
+        )
+
+    @program_counter.setter
+    def program_counter(self, program_counter: int) -> None:
+        self._program_counter_high_byte, self._program_counter_low_byte, *_ = (
+            byte.Byte.partition(program_counter % memory.Memory.size())
+        )
+
+    @property
+    def status(self) -> int:
+        return self._alu_status
+
+    @status.setter
+    def status(self, status: int) -> None:
+        self._alu_status = status % byte.Byte.max()
+
+    def run_instruction(self) -> int:
+        program_counter = (
+            self._program_counter_high_byte << 8
+        ) | self._program_counter_low_byte
+        opcode = self._data[program_counter]
+        status = self._alu_status
+        index = opcode * (self._module.status_mask + 1) + (
+            status & self._module.status_mask
+        )
+        function = self._module.functions[index]
+        if function is None:
+            raise self.InvalidOpcodeError(
+                f"invalid opcode {byte.Byte.hex_str(opcode)} at {byte.Byte.hex_str(self.program_counter)}"
+            )
+        function(self, self._data)
+        ticks = self._module.ticks[index]
+        self.ticks += ticks
+        if self.profiler is not None:
+            self.profiler.record(program_counter, opcode, ticks, status)
+        return ticks
+
+    def run_instructions(self, num: int) -> int:
+        return sum(self.run_instruction() for _ in range(num))
+
+    def run(self) -> int:
+        ticks = 0
+        self.halted = False
+        while not self.halted:
+            ticks += self.run_instruction()
+        return ticks
+
+    @classmethod
+    def build(cls, *entries: program.Entry) -> "Codegen":
+        return cls.for_program(program.Program.build(*entries))
+
+    @classmethod
+    def for_program(cls, program: program.Program) -> "Codegen":
+        return cls(data=program.output().data)
+
+
+instructions.Instructions.on_invalidate(Codegen.clear_cache)
@@ -0,0 +1,118 @@
+import os
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+import pycom
+
+
+class CodegenTest(unittest.TestCase):
+    def setUp(self) -> None:
+        cache_dir = self.enterContext(tempfile.TemporaryDirectory())
+        self.cache_dir = pathlib.Path(cache_dir)
+        pycom.Codegen.clear_cache()
+        self.addCleanup(pycom.Codegen.clear_cache)
+
+    def codegen(self, program: pycom.Program) -> pycom.Codegen:
+        return pycom.Codegen(data=program.output().data, cache_dir=self.cache_dir)
+
+    def test_empty(self) -> None:
+        codegen = self.codegen(pycom.Program())
+        self.assertEqual(codegen.run(), pycom.Computer().run())
+        self.assertTrue(codegen.halted)
+
+    def test_watch_unsupported(self) -> None:
+        with self.assertRaises(pycom.Memory.WatchError):
+            self.codegen(pycom.Program()).memory.watch(0)
+
+    def test_invalid_opcode(self) -> None:
+        with self.assertRaises(pycom.Codegen.InvalidOpcodeError):
+            self.codegen(pycom.Program.build(0xFF)).run_instruction()
+
+    def test_cache(self) -> None:
+        self.codegen(pycom.Program())
+        paths = list(self.cache_dir.glob("*.py"))
+        self.assertEqual(len(paths), 1)
+        pycom.Codegen.clear_cache()
+        paths[0].write_text(paths[0].read_text().replace("TICKS = [4,", "TICKS = [5,"))
+        self.assertEqual(self.codegen(pycom.Program()).run(), 5)
+
+    def test_key_stable_across_processes(self) -> None:
+        rom = pycom.Computer().controller.rom
+        for seed in ["1", "2"]:
+            with self.subTest(seed=seed):
+                result = subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import pycom; print(pycom.Codegen.key(pycom.Computer().controller.rom))",
+                    ],
+                    env={**os.environ, "PYTHONHASHSEED": seed},
+                    cwd=pathlib.Path(pycom.__file__).parent.parent,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                self.assertEqual(result.stdout.strip(), pycom.Codegen.key(rom))
+
+    def test_unsupported_control(self) -> None:
+        with self.assertRaises(pycom.engines.Datapath.UnsupportedControlError):
+            pycom.Codegen.Generator(pycom.Computer()).step(["invalid"])
+
+    def test_matches_computer(self) -> None:
+        for program in list[pycom.Program](
+            [
+                pycom.Program.build(
+                    pycom.Instructions.LDA(pycom.operands.Immediate(0xFF)),
+                    pycom.Instructions.SEC(),
+                    pycom.Instructions.ADC(pycom.operands.Absolute("value")),
+                    pycom.Instructions.STA(pycom.operands.Absolute("result")),
+                    pycom.Instructions.CLC(),
+                    pycom.Instructions.NOP(),
+                    pycom.Instructions.HLT(),
+                    "value",
+                    0x01,
+                    "result",
+                ),
+                pycom.Program.build(
+                    pycom.Instructions.LDX(pycom.operands.Immediate(0)),
+                    pycom.Instructions.DEX(),
+                    pycom.Instructions.INX(),
+                    pycom.Instructions.STX(pycom.operands.Absolute("x")),
+                    pycom.Instructions.LDY(pycom.operands.Absolute("x")),
+                    pycom.Instructions.INY(),
+                    pycom.Instructions.DEY(),
+                    pycom.Instructions.STY(pycom.operands.Absolute("y")),
+                    pycom.Instructions.LDA(pycom.operands.Absolute("y")),
+                    pycom.Instructions.HLT(),
+                    "x",
+                    0,
+                    "y",
+                ),
+                pycom.Program.build(
+                    pycom.Instructions.LDA(pycom.operands.Immediate(0)),
+                    pycom.Instructions.LDX(pycom.operands.Immediate(3)),
+                    pycom.Instructions.LDY(pycom.operands.Immediate(5)),
+                    "loop",
+                    pycom.Instructions.STY(pycom.operands.Absolute("tmp")),
+                    pycom.Instructions.ADC(pycom.operands.Absolute("tmp")),
+                    pycom.Instructions.DEX(),
+                    pycom.Instructions.BNE(pycom.operands.Relative("done")),
+                    pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+                    "done",
+                    pycom.Instructions.HLT(),
+                    "tmp",
+                ),
+            ]
+        ):
+            with self.subTest(program=program):
+                computer = program.as_computer()
+                codegen = self.codegen(program)
+                self.assertEqual(codegen.run(), computer.run())
+                self.assertEqual(codegen.a, computer.a)
+                self.assertEqual(codegen.x, computer.x)
+                self.assertEqual(codegen.y, computer.y)
+                self.assertEqual(codegen.status, computer.status)
+                self.assertEqual(codegen.program_counter, computer.program_counter)
+                self.assertEqual(codegen.memory.data, computer.memory.data)
@@ -0,0 +1,286 @@
+import dataclasses
+import enum
+import typing
+from pycom.components import (
+    alu,
+    byte,
+    clock,
+    component,
+    controller,
+    counter,
+    errorable,
+    memory,
+    program_counter,
+    register,
+)
+
+
+class Datapath(errorable.Errorable):
+    class UnsupportedControlError(errorable.Errorable.Error): ...
+
+    class Phase(enum.IntEnum):
+        DRIVE = 0
+        COUNT = 1
+        STORE = 2
+        LATCH = 3
+        CARRY = 4
+        ARITHMETIC = 5
+        HALT = 6
+
+    class Kind(enum.Enum):
+        REGISTER_OUT = enum.auto()
+        REGISTER_IN = enum.auto()
+        COUNTER_INCREMENT = enum.auto()
+        COUNTER_RESET = enum.auto()
+        PROGRAM_COUNTER_INCREMENT = enum.auto()
+        PROGRAM_COUNTER_RESET = enum.auto()
+        MEMORY_OUT = enum.auto()
+        MEMORY_IN = enum.auto()
+        CARRY_SET = enum.auto()
+        CARRY_CLEAR = enum.auto()
+        ADD = enum.auto()
+        INC = enum.auto()
+        DEC = enum.auto()
+        HALT = enum.auto()
+
+        @property
+        def phase(self) -> "Datapath.Phase":
+            match self:
+                case Datapath.Kind.REGISTER_OUT | Datapath.Kind.MEMORY_OUT:
+                    return Datapath.Phase.DRIVE
+                case (
+                    Datapath.Kind.COUNTER_INCREMENT
+                    | Datapath.Kind.COUNTER_RESET
+                    | Datapath.Kind.PROGRAM_COUNTER_INCREMENT
+                    | Datapath.Kind.PROGRAM_COUNTER_RESET
+                ):
+                    return Datapath.Phase.COUNT
+                case Datapath.Kind.MEMORY_IN:
+                    return Datapath.Phase.STORE
+                case Datapath.Kind.REGISTER_IN:
+                    return Datapath.Phase.LATCH
+                case Datapath.Kind.CARRY_SET | Datapath.Kind.CARRY_CLEAR:
+                    return Datapath.Phase.CARRY
+                case Datapath.Kind.ADD | Datapath.Kind.INC | Datapath.Kind.DEC:
+                    return Datapath.Phase.ARITHMETIC
+                case Datapath.Kind.HALT:
+                    return Datapath.Phase.HALT
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Statement:
+        code: str
+        reads: frozenset[str] = frozenset()
+        writes: frozenset[str] = frozenset()
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Operation:
+        kind: "Datapath.Kind"
+        registers: tuple[str, ...] = ()
+
+        @property
+        def phase(self) -> "Datapath.Phase":
+            return self.kind.phase
+
+        def statement(
+            self,
+            var: typing.Callable[[str], str],
+            *,
+            bus: str,
+            halt: str,
+        ) -> "Datapath.Statement":
+            registers = [var(register) for register in self.registers]
+            match self.kind:
+                case Datapath.Kind.REGISTER_OUT:
+                    return Datapath.Statement(
+                        code=f"{bus} = {registers[0]}",
+                        reads=frozenset(registers),
+                        writes=frozenset({bus}),
+                    )
+                case Datapath.Kind.REGISTER_IN:
+                    return Datapath.Statement(
+                        code=f"{registers[0]} = {bus}",
+                        reads=frozenset({bus}),
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.COUNTER_INCREMENT:
+                    return Datapath.Statement(
+                        code=f"{registers[0]} = ({registers[0]} + 1) % {byte.Byte.max()}",
+                        reads=frozenset(registers),
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.COUNTER_RESET:
+                    return Datapath.Statement(
+                        code=f"{registers[0]} = 0",
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.PROGRAM_COUNTER_INCREMENT:
+                    high, low = registers
+                    return Datapath.Statement(
+                        code=f"{high}, {low} = divmod(((({high} << 8) | {low}) + 1) % {memory.Memory.size()}, {byte.Byte.max()})",
+                        reads=frozenset(registers),
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.PROGRAM_COUNTER_RESET:
+                    high, low = registers
+                    return Datapath.Statement(
+                        code=f"{high} = {low} = 0",
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.MEMORY_OUT:
+                    high, low = registers
+                    return Datapath.Statement(
+                        code=f"{bus} = data[({high} << 8) | {low}]",
+                        reads=frozenset(registers),
+                        writes=frozenset({bus}),
+                    )
+                case Datapath.Kind.MEMORY_IN:
+                    high, low = registers
+                    return Datapath.Statement(
+                        code=f"data[({high} << 8) | {low}] = {bus}",
+                        reads=frozenset({*registers, bus}),
+                    )
+                case Datapath.Kind.CARRY_SET:
+                    return Datapath.Statement(
+                        code=f"{registers[0]} |= {alu.ALU.CARRY}",
+                        reads=frozenset(registers),
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.CARRY_CLEAR:
+                    return Datapath.Statement(
+                        code=f"{registers[0]} &= ~{alu.ALU.CARRY}",
+                        reads=frozenset(registers),
+                        writes=frozenset(registers),
+                    )
+                case Datapath.Kind.ADD | Datapath.Kind.INC | Datapath.Kind.DEC:
+                    lhs, rhs, result, status = registers
+                    expression = {
+                        Datapath.Kind.ADD: f"({status} & {alu.ALU.CARRY}) + {lhs} + {rhs}",
+                        Datapath.Kind.INC: f"{lhs} + 1",
+                        Datapath.Kind.DEC: f"{lhs} - 1",
+                    }[self.kind]
+                    return Datapath.Statement(
+                        code="\n".join(
+                            [
+                                f"value = {expression}",
+                                f"{result} = value % {byte.Byte.max()}",
+                                f"{status} = ({status} & ~{alu.ALU.CARRY | alu.ALU.ZERO})"
+                                f" | ({alu.ALU.CARRY} if value >= {byte.Byte.max()} or value < 0 else 0)"
+                                f" | ({alu.ALU.ZERO} if {result} == 0 else 0)",
+                            ]
+                        ),
+                        reads=frozenset(registers),
+                        writes=frozenset({result, status}),
+                    )
+                case Datapath.Kind.HALT:
+                    return Datapath.Statement(code=halt)
+
+    def __init__(self, root: component.Component) -> None:
+        self.__root = root
+        self.__registers: list[str] = []
+        self.__operations: dict[str, Datapath.Operation] = {}
+        self.__instruction_counter: typing.Optional[str] = None
+        self.__visit(root)
+
+    @property
+    def registers(self) -> typing.Sequence[str]:
+        return self.__registers
+
+    @property
+    def operations(self) -> typing.Mapping[str, "Datapath.Operation"]:
+        return self.__operations
+
+    @property
+    def instruction_counter(self) -> str:
+        if self.__instruction_counter is None:
+            raise self.Error(f"no controller in {self.__root.path}")
+        return self.__instruction_counter
+
+    def name(self, component: component.Component) -> str:
+        return component.path[len(self.__root.path) + 1 :]
+
+    def __add(
+        self,
+        component: component.Component,
+        control: str,
+        kind: "Datapath.Kind",
+        *registers: component.Component,
+    ) -> None:
+        self.__operations[f"{self.name(component)}.{control}"] = self.Operation(
+            kind=kind,
+            registers=tuple(self.name(register) for register in registers),
+        )
+
+    def __visit(self, component: component.Component) -> None:
+        match component:
+            case controller.Controller():
+                self.__instruction_counter = self.name(
+                    component.child("instruction_counter")
+                )
+            case register.Register():
+                self.__registers.append(self.name(component))
+                self.__add(component, "out", self.Kind.REGISTER_OUT, component)
+                self.__add(component, "in", self.Kind.REGISTER_IN, component)
+                if isinstance(component, counter.Counter):
+                    self.__add(
+                        component, "increment", self.Kind.COUNTER_INCREMENT, component
+                    )
+                    self.__add(component, "reset", self.Kind.COUNTER_RESET, component)
+            case program_counter.ProgramCounter():
+                for control, kind in [
+                    ("increment", self.Kind.PROGRAM_COUNTER_INCREMENT),
+                    ("reset", self.Kind.PROGRAM_COUNTER_RESET),
+                ]:
+                    self.__add(
+                        component,
+                        control,
+                        kind,
+                        component.child("high_byte"),
+                        component.child("low_byte"),
+                    )
+            case memory.Memory():
+                for control, kind in [
+                    ("out", self.Kind.MEMORY_OUT),
+                    ("in", self.Kind.MEMORY_IN),
+                ]:
+                    self.__add(
+                        component,
+                        control,
+                        kind,
+                        component.child("address_high_byte"),
+                        component.child("address_low_byte"),
+                    )
+            case alu.ALU():
+                for control, kind in [
+                    ("carry_set", self.Kind.CARRY_SET),
+                    ("carry_clear", self.Kind.CARRY_CLEAR),
+                ]:
+                    self.__add(component, control, kind, component.child("status"))
+                for control, kind in [
+                    ("add", self.Kind.ADD),
+                    ("inc", self.Kind.INC),
+                    ("dec", self.Kind.DEC),
+                ]:
+                    self.__add(
+                        component,
+                        control,
+                        kind,
+                        component.child("lhs"),
+                        component.child("rhs"),
+                        component.child("result"),
+                        component.child("status"),
+                    )
+            case clock.Clock():
+                self.__add(component, "disable", self.Kind.HALT)
+        for child in sorted(component.children, key=lambda child: child.name):
+            self.__visit(child)
+
+    def operation(self, control: str) -> "Datapath.Operation":
+        if control not in self.__operations:
+            raise self.UnsupportedControlError(f"unsupported control {control}")
+        return self.__operations[control]
+
+    def step(self, controls: typing.Iterable[str]) -> list["Datapath.Operation"]:
+        return sorted(
+            (self.operation(control) for control in sorted(controls)),
+            key=lambda operation: operation.phase,
+        )
@@ -0,0 +1,37 @@
+import unittest
+import pycom
+
+
+class DatapathTest(unittest.TestCase):
+    def test_statement(self) -> None:
+        datapath = pycom.engines.Datapath(pycom.Computer())
+        self.assertEqual(
+            datapath.operation("a.out").statement(
+                lambda register: register.upper(), bus="BUS", halt="halt()"
+            ),
+            pycom.engines.Datapath.Statement(
+                code="BUS = A",
+                reads=frozenset({"A"}),
+                writes=frozenset({"BUS"}),
+            ),
+        )
+        self.assertEqual(
+            datapath.operation("clock.disable")
+            .statement(str, bus="bus", halt="halt()")
+            .code,
+            "halt()",
+        )
+
+    def test_statements_compile(self) -> None:
+        datapath = pycom.engines.Datapath(pycom.Computer())
+        for control, operation in datapath.operations.items():
+            with self.subTest(control=control):
+                compile(
+                    operation.statement(
+                        lambda register: register.replace(".", "_"),
+                        bus="bus",
+                        halt="halted = True",
+                    ).code,
+                    control,
+                    "exec",
+                )
@@ -0,0 +1,245 @@
+import concurrent.futures
+import dataclasses
+import random
+import typing
+from pycom import computer
+from pycom.components import byte, errorable
+from pycom.engines import codegen, engine as engine_lib, interpreter, netlist
+from pycom.instructions import instructions
+from pycom.programs import operands, program
+
+Factory: typing.TypeAlias = typing.Callable[..., engine_lib.Engine]
+
+
+class Differential(errorable.Errorable):
+    ENGINES: typing.ClassVar[typing.Mapping[str, Factory]] = {
+        "computer": computer.Computer,
+        "interpreter": interpreter.Interpreter,
+        "codegen": codegen.Codegen,
+        "netlist": netlist.Netlist,
+    }
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class State:
+        a: int
+        x: int
+        y: int
+        status: int
+        program_counter: int
+        halted: bool
+        memory: bytes
+        error: typing.Optional[str] = None
+
+        @classmethod
+        def of(
+            cls, engine: engine_lib.Engine, error: typing.Optional[str] = None
+        ) -> "Differential.State":
+            return cls(
+                a=engine.a,
+                x=engine.x,
+                y=engine.y,
+                status=engine.status,
+                program_counter=engine.program_counter,
+                halted=engine.halted,
+                memory=bytes(engine.memory.view()),
+                error=error,
+            )
+
+        def diff(self, rhs: "Differential.State") -> typing.Sequence[str]:
+            fields = [
+                field.name
+                for field in dataclasses.fields(self)
+                if field.name != "memory"
+                and getattr(self, field.name) != getattr(rhs, field.name)
+            ]
+            if self.memory != rhs.memory:
+                fields += [
+                    f"memory[{byte.Byte.hex_str(address)}]"
+                    for address, (lhs_value, rhs_value) in enumerate(
+                        zip(self.memory, rhs.memory)
+                    )
+                    if lhs_value != rhs_value
+                ]
+            return fields
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Step:
+        instruction: int
+        program_counter: int
+        opcode: int
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Divergence:
+        instruction: int
+        fields: typing.Sequence[str]
+        states: typing.Mapping[str, "Differential.State"]
+        trace: typing.Sequence["Differential.Step"]
+
+        def __str__(self) -> str:
+            return "\n".join(
+                [
+                    f"engines diverged after instruction {self.instruction} in {', '.join(self.fields)}",
+                    *[
+                        f"  {step.instruction}: {byte.Byte.hex_str(step.program_counter)} {byte.Byte.hex_str(step.opcode)}"
+                        for step in self.trace
+                    ],
+                ]
+            )
+
+    def __init__(
+        self,
+        engines: typing.Optional[typing.Mapping[str, Factory]] = None,
+        *,
+        interval: int = 1,
+        max_instructions: int = 100000,
+    ) -> None:
+        self.engines = dict(engines if engines is not None else self.ENGINES)
+        if len(self.engines) < 2:
+            raise self.Error("need at least two engines to compare")
+        if interval <= 0:
+            raise self.Error(f"invalid interval {interval}")
+        self.interval = interval
+        self.max_instructions = max_instructions
+
+    def build(self, image: typing.Mapping[int, int]) -> dict[str, engine_lib.Engine]:
+        return {name: factory(data=image) for name, factory in self.engines.items()}
+
+    @staticmethod
+    def _step(engine: engine_lib.Engine) -> typing.Optional[str]:
+        try:
+            engine.run_instruction()
+        except errorable.Errorable.Error as error:
+            return str(error)
+        return None
+
+    def _states(
+        self,
+        engines: typing.Mapping[str, engine_lib.Engine],
+        errors: typing.Mapping[str, typing.Optional[str]],
+    ) -> dict[str, "Differential.State"]:
+        return {
+            name: self.State.of(engine, errors.get(name))
+            for name, engine in engines.items()
+        }
+
+    def _diff(
+        self, states: typing.Mapping[str, "Differential.State"]
+    ) -> typing.Sequence[str]:
+        reference, *others = states.values()
+        return sorted(
+            frozenset[str]().union(*[reference.diff(state) for state in others]),
+        )
+
+    def _advance(
+        self,
+        engines: typing.Mapping[str, engine_lib.Engine],
+        errors: dict[str, typing.Optional[str]],
+    ) -> bool:
+        if all(engine.halted or errors.get(name) for name, engine in engines.items()):
+            return False
+        for name, engine in engines.items():
+            if not engine.halted and not errors.get(name):
+                errors[name] = self._step(engine)
+        return True
+
+    def run(
+        self, program_or_image: program.Program | typing.Mapping[int, int]
+    ) -> typing.Optional["Differential.Divergence"]:
+        image = (
+            program_or_image.output().data
+            if isinstance(program_or_image, program.Program)
+            else program_or_image
+        )
+        engines = self.build(image)
+        errors: dict[str, typing.Optional[str]] = {}
+        checked = 0
+        for executed in range(1, self.max_instructions + 1):
+            if not self._advance(engines, errors):
+                break
+            if executed % self.interval == 0:
+                if self._diff(self._states(engines, errors)):
+                    return self._minimize(image, checked)
+                checked = executed
+        if self._diff(self._states(engines, errors)):
+            return self._minimize(image, checked)
+        return None
+
+    def _minimize(
+        self, image: typing.Mapping[int, int], checked: int
+    ) -> "Differential.Divergence":
+        engines = self.build(image)
+        errors: dict[str, typing.Optional[str]] = {}
+        for _ in range(checked):
+            self._advance(engines, errors)
+        reference = next(iter(engines.values()))
+        trace: list[Differential.Step] = []
+        instruction = checked
+        while True:
+            trace.append(
+                self.Step(
+                    instruction=instruction,
+                    program_counter=reference.program_counter,
+                    opcode=reference.memory[reference.program_counter],
+                )
+            )
+            advanced = self._advance(engines, errors)
+            instruction += advanced
+            states = self._states(engines, errors)
+            if fields := self._diff(states):
+                return self.Divergence(
+                    instruction=instruction,
+                    fields=fields,
+                    states=states,
+                    trace=trace,
+                )
+            if not advanced:
+                raise self.Error("engines no longer diverge when replayed")
+
+    @staticmethod
+    def random_program(
+        rng: random.Random,
+        size: int = 32,
+        *,
+        data: int = 0x8000,
+    ) -> program.Program:
+        choices = [
+            (instruction, operand_type)
+            for instruction in instructions.Instructions
+            for operand_type in instruction.value.operand_instances
+            if instruction is not instructions.Instructions.HLT
+        ]
+        entries: list[program.Entry] = []
+        for index in range(size):
+            instruction, operand_type = rng.choice(choices)
+            match operand_type:
+                case operands.Immediate:
+                    operand: operands.Operand = operands.Immediate(rng.randrange(0x100))
+                case operands.Absolute if instruction is instructions.Instructions.JMP:
+                    operand = operands.Absolute(f"l{rng.randint(index + 1, size)}")
+                case operands.Absolute:
+                    operand = operands.Absolute(data + rng.randrange(0x10))
+                case operands.Relative:
+                    operand = operands.Relative(f"l{rng.randint(index + 1, size)}")
+                case _:
+                    operand = operands.None_()
+            entries += [f"l{index}", instruction(operand)]
+        return program.Program.build(
+            *entries, f"l{size}", instructions.Instructions.HLT()
+        )
+
+    def fuzz_one(
+        self, seed: int, size: int = 32
+    ) -> tuple[int, typing.Optional["Differential.Divergence"]]:
+        return seed, self.run(self.random_program(random.Random(seed), size))
+
+    def fuzz(
+        self,
+        seeds: typing.Iterable[int],
+        *,
+        size: int = 32,
+        workers: typing.Optional[int] = None,
+    ) -> typing.Iterator[tuple[int, typing.Optional["Differential.Divergence"]]]:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.fuzz_one, seed, size) for seed in seeds]
+            for future in concurrent.futures.as_completed(futures):
+                yield future.result()
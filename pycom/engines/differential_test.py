@@ -0,0 +1,75 @@
+import functools
+import pathlib
+import random
+import tempfile
+import typing
+import unittest
+import pycom
+
+
+class BrokenInterpreter(pycom.Interpreter):
+    @typing.override
+    def _inx(self) -> None:
+        self.x = self._alu(self.x + 2)
+
+
+class DifferentialTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.addCleanup(pycom.Codegen.clear_cache)
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(pycom.engines.Differential.Error):
+            pycom.engines.Differential({"interpreter": pycom.Interpreter})
+        with self.assertRaises(pycom.engines.Differential.Error):
+            pycom.engines.Differential(interval=0)
+
+    def test_agree(self) -> None:
+        differential = pycom.engines.Differential(
+            {
+                "computer": pycom.Computer,
+                "interpreter": pycom.Interpreter,
+                "codegen": functools.partial(pycom.Codegen, cache_dir=self.cache_dir),
+            },
+            interval=3,
+        )
+        for workload in [pycom.workloads.multiply(), pycom.workloads.count(5)]:
+            with self.subTest(workload=workload.name):
+                self.assertIsNone(differential.run(workload.program))
+
+    def test_diverge(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.NOP(),
+            pycom.Instructions.NOP(),
+            pycom.Instructions.INX(),
+            pycom.Instructions.NOP(),
+            pycom.Instructions.NOP(),
+            pycom.Instructions.HLT(),
+        )
+        divergence = pycom.engines.Differential(
+            {"interpreter": pycom.Interpreter, "broken": BrokenInterpreter},
+            interval=4,
+        ).run(program)
+        assert divergence is not None
+        self.assertEqual(divergence.instruction, 3)
+        self.assertEqual(divergence.fields, ["x"])
+        self.assertEqual(divergence.states["interpreter"].x, 1)
+        self.assertEqual(divergence.states["broken"].x, 2)
+        self.assertEqual([step.program_counter for step in divergence.trace], [0, 1, 2])
+        self.assertIn("diverged after instruction 3", str(divergence))
+
+    def test_random_program(self) -> None:
+        for seed in range(20):
+            with self.subTest(seed=seed):
+                engine = pycom.Interpreter.for_program(
+                    pycom.engines.Differential.random_program(random.Random(seed))
+                )
+                engine.run()
+                self.assertTrue(engine.halted)
+
+    def test_fuzz(self) -> None:
+        differential = pycom.engines.Differential(
+            {"computer": pycom.Computer, "interpreter": pycom.Interpreter}
+        )
+        results = dict(differential.fuzz(range(4), size=16, workers=2))
+        self.assertEqual(results, {seed: None for seed in range(4)})
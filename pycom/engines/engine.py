@@ -0,0 +1,45 @@
+import typing
+from pycom.components import memory
+
+
+class Engine(typing.Protocol):
+    memory: memory.Memory
+
+    @property
+    def a(self) -> int: ...
+
+    @a.setter
+    def a(self, a: int) -> None: ...
+
+    @property
+    def x(self) -> int: ...
+
+    @x.setter
+    def x(self, x: int) -> None: ...
+
+    @property
+    def y(self) -> int: ...
+
+    @y.setter
+    def y(self, y: int) -> None: ...
+
+    @property
+    def program_counter(self) -> int: ...
+
+    @program_counter.setter
+    def program_counter(self, program_counter: int) -> None: ...
+
+    @property
+    def status(self) -> int: ...
+
+    @status.setter
+    def status(self, status: int) -> None: ...
+
+    @property
+    def halted(self) -> bool: ...
+
+    def run_instruction(self) -> int: ...
+
+    def run_instructions(self, num: int) -> int: ...
+
+    def run(self) -> int: ...
@@ -0,0 +1,289 @@
+import typing
+from pycom.components import alu, bus, byte, controller, errorable, memory
+from pycom.engines import profiler
+from pycom.instructions import instructions
+from pycom.programs import operands, program
+
+
+class Interpreter(errorable.Errorable):
+    class InvalidOpcodeError(errorable.Errorable.Error, KeyError): ...
+
+    Handler: typing.TypeAlias = typing.Callable[["Interpreter"], None]
+
+    _handler_tables: typing.ClassVar[
+        dict[type["Interpreter"], typing.Sequence[typing.Optional[Handler]]]
+    ] = {}
+    _ticks_tables: typing.ClassVar[
+        dict[controller.Controller.Rom, tuple[int, typing.Sequence[int]]]
+    ] = {}
+
+    def __init__(
+        self,
+        *,
+        data: typing.Optional[typing.Mapping[int, int]] = None,
+    ) -> None:
+        self.memory = memory.Memory(bus.Bus(), data=data, watchable=False)
+        self._data = self.memory.view()
+        self._a = 0
+        self._x = 0
+        self._y = 0
+        self._program_counter = 0
+        self._status = 0
+        self.halted = False
+        self.ticks = 0
+        self.profiler: typing.Optional[profiler.Profiler] = None
+        self._handlers = self.handler_table()
+        self._status_mask, self._ticks = self.ticks_table(
+            controller.Controller.Rom.for_entries(instructions.Instructions.entries())
+        )
+
+    @classmethod
+    def handlers(
+        cls,
+    ) -> typing.Mapping[
+        tuple[instructions.Instructions, typing.Type[operands.Operand]],
+        Handler,
+    ]:
+        return {
+            (instructions.Instructions.HLT, operands.None_): cls._hlt,
+            (instructions.Instructions.NOP, operands.None_): cls._nop,
+            (instructions.Instructions.LDA, operands.Immediate): cls._lda_immediate,
+            (instructions.Instructions.LDA, operands.Absolute): cls._lda_absolute,
+            (instructions.Instructions.STA, operands.Absolute): cls._sta_absolute,
+            (instructions.Instructions.SEC, operands.None_): cls._sec,
+            (instructions.Instructions.CLC, operands.None_): cls._clc,
+            (instructions.Instructions.ADC, operands.Immediate): cls._adc_immediate,
+            (instructions.Instructions.ADC, operands.Absolute): cls._adc_absolute,
+            (instructions.Instructions.JMP, operands.Absolute): cls._jmp_absolute,
+            (instructions.Instructions.BNE, operands.Relative): cls._bne_relative,
+            (instructions.Instructions.LDX, operands.Immediate): cls._ldx_immediate,
+            (instructions.Instructions.LDX, operands.Absolute): cls._ldx_absolute,
+            (instructions.Instructions.STX, operands.Absolute): cls._stx_absolute,
+            (instructions.Instructions.INX, operands.None_): cls._inx,
+            (instructions.Instructions.DEX, operands.None_): cls._dex,
+            (instructions.Instructions.LDY, operands.Immediate): cls._ldy_immediate,
+            (instructions.Instructions.LDY, operands.Absolute): cls._ldy_absolute,
+            (instructions.Instructions.STY, operands.Absolute): cls._sty_absolute,
+            (instructions.Instructions.INY, operands.None_): cls._iny,
+            (instructions.Instructions.DEY, operands.None_): cls._dey,
+        }
+
+    @classmethod
+    def handler_table(cls) -> typing.Sequence[typing.Optional[Handler]]:
+        if cls not in cls._handler_tables:
+            cls._handler_tables[cls] = cls._build_handler_table()
+        return cls._handler_tables[cls]
+
+    @classmethod
+    def _build_handler_table(cls) -> typing.Sequence[typing.Optional[Handler]]:
+        handlers = cls.handlers()
+        table: list[typing.Optional[Interpreter.Handler]] = [None] * byte.Byte.max()
+        for instruction in instructions.Instructions:
+            for (
+                operand_type,
+                operand_instance,
+            ) in instruction.value.operand_instances.items():
+                if (instruction, operand_type) not in handlers:
+                    raise cls.Error(
+                        f"no handler for {instruction.name} {operand_type.__name__}"
+                    )
+                table[operand_instance.opcode] = handlers[(instruction, operand_type)]
+        return tuple(table)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._handler_tables.clear()
+        cls._ticks_tables.clear()
+
+    @classmethod
+    def ticks_table(
+        cls, rom: controller.Controller.Rom
+    ) -> tuple[int, typing.Sequence[int]]:
+        if rom not in cls._ticks_tables:
+            cls._ticks_tables[rom] = cls._build_ticks_table(rom)
+        return cls._ticks_tables[rom]
+
+    @classmethod
+    def _build_ticks_table(
+        cls, rom: controller.Controller.Rom
+    ) -> tuple[int, typing.Sequence[int]]:
+        status_mask = rom.status_mask
+        table = [0] * (byte.Byte.max() * (status_mask + 1))
+        for instruction in instructions.Instructions:
+            for opcode in instruction.value.opcodes:
+                for status in range(status_mask + 1):
+                    if status & status_mask == status:
+                        table[opcode * (status_mask + 1) + status] = rom.ticks(
+                            opcode, status
+                        )
+        return status_mask, tuple(table)
+
+    @property
+    def a(self) -> int:
+        return self._a
+
+    @a.setter
+    def a(self, a: int) -> None:
+        self._a = a % byte.Byte.max()
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, x: int) -> None:
+        self._x = x % byte.Byte.max()
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, y: int) -> None:
+        self._y = y % byte.Byte.max()
+
+    @property
+    def program_counter(self) -> int:
+        return self._program_counter
+
+    @program_counter.setter
+    def program_counter(self, program_counter: int) -> None:
+        self._program_counter = program_counter % memory.Memory.size()
+
+    @property
+    def status(self) -> int:
+        return self._status
+
+    @status.setter
+    def status(self, status: int) -> None:
+        self._status = status % byte.Byte.max()
+
+    def run_instruction(self) -> int:
+        program_counter = self._program_counter
+        opcode = self._data[program_counter]
+        handler = self._handlers[opcode]
+        if handler is None:
+            raise self.InvalidOpcodeError(
+                f"invalid opcode {byte.Byte.hex_str(opcode)} at {byte.Byte.hex_str(self._program_counter)}"
+            )
+        status = self._status
+        ticks = self._ticks[
+            opcode * (self._status_mask + 1) + (status & self._status_mask)
+        ]
+        self._program_counter = (self._program_counter + 1) % memory.Memory.size()
+        handler(self)
+        self.ticks += ticks
+        if self.profiler is not None:
+            self.profiler.record(program_counter, opcode, ticks, status)
+        return ticks
+
+    def run_instructions(self, num: int) -> int:
+        return sum(self.run_instruction() for _ in range(num))
+
+    def run(self) -> int:
+        ticks = 0
+        self.halted = False
+        while not self.halted:
+            ticks += self.run_instruction()
+        return ticks
+
+    @classmethod
+    def build(cls, *entries: program.Entry) -> "Interpreter":
+        return cls.for_program(program.Program.build(*entries))
+
+    @classmethod
+    def for_program(cls, program: program.Program) -> "Interpreter":
+        return cls(data=program.output().data)
+
+    def _fetch(self) -> int:
+        value = self._data[self._program_counter]
+        self._program_counter = (self._program_counter + 1) % memory.Memory.size()
+        return value
+
+    def _fetch_address(self) -> int:
+        high_byte = self._fetch()
+        return byte.Byte.unpartition(high_byte, self._fetch())
+
+    def _alu(self, result: int) -> int:
+        status = self._status & ~(alu.ALU.CARRY | alu.ALU.ZERO)
+        if result >= byte.Byte.max() or result < 0:
+            status |= alu.ALU.CARRY
+        result %= byte.Byte.max()
+        if result == 0:
+            status |= alu.ALU.ZERO
+        self._status = status
+        return result
+
+    def _add(self, value: int) -> None:
+        self._a = self._alu((self._status & alu.ALU.CARRY) + value + self._a)
+
+    def _hlt(self) -> None:
+        self.halted = True
+
+    def _nop(self) -> None: ...
+
+    def _lda_immediate(self) -> None:
+        self._a = self._fetch()
+
+    def _lda_absolute(self) -> None:
+        self._a = self._data[self._fetch_address()]
+
+    def _sta_absolute(self) -> None:
+        self._data[self._fetch_address()] = self._a
+
+    def _sec(self) -> None:
+        self._status |= alu.ALU.CARRY
+
+    def _clc(self) -> None:
+        self._status &= ~alu.ALU.CARRY
+
+    def _adc_immediate(self) -> None:
+        self._add(self._fetch())
+
+    def _adc_absolute(self) -> None:
+        self._add(self._data[self._fetch_address()])
+
+    def _jmp_absolute(self) -> None:
+        self._program_counter = self._fetch_address()
+
+    def _bne_relative(self) -> None:
+        if self._status & alu.ALU.ZERO:
+            low_byte = self._fetch()
+            self._program_counter = (
+                self._program_counter & ~(byte.Byte.max() - 1)
+            ) | low_byte
+        else:
+            self._program_counter = (self._program_counter + 1) % memory.Memory.size()
+
+    def _ldx_immediate(self) -> None:
+        self._x = self._fetch()
+
+    def _ldx_absolute(self) -> None:
+        self._x = self._data[self._fetch_address()]
+
+    def _stx_absolute(self) -> None:
+        self._data[self._fetch_address()] = self._x
+
+    def _inx(self) -> None:
+        self._x = self._alu(self._x + 1)
+
+    def _dex(self) -> None:
+        self._x = self._alu(self._x - 1)
+
+    def _ldy_immediate(self) -> None:
+        self._y = self._fetch()
+
+    def _ldy_absolute(self) -> None:
+        self._y = self._data[self._fetch_address()]
+
+    def _sty_absolute(self) -> None:
+        self._data[self._fetch_address()] = self._y
+
+    def _iny(self) -> None:
+        self._y = self._alu(self._y + 1)
+
+    def _dey(self) -> None:
+        self._y = self._alu(self._y - 1)
+
+
+instructions.Instructions.on_invalidate(Interpreter.clear_cache)
@@ -0,0 +1,112 @@
+import unittest
+import pycom
+
+
+class InterpreterTest(unittest.TestCase):
+    def test_empty(self) -> None:
+        interpreter = pycom.Interpreter()
+        self.assertEqual(interpreter.run(), pycom.Computer().run())
+        self.assertTrue(interpreter.halted)
+        self.assertEqual(interpreter.program_counter, 1)
+
+    def test_watch_unsupported(self) -> None:
+        with self.assertRaises(pycom.Memory.WatchError):
+            pycom.Interpreter().memory.watch(0)
+
+    def test_invalid_opcode(self) -> None:
+        with self.assertRaises(pycom.Interpreter.InvalidOpcodeError):
+            pycom.Interpreter.build(0xFF).run_instruction()
+
+    def test_lda_immediate(self) -> None:
+        interpreter = pycom.Interpreter.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(42)),
+        )
+        interpreter.run_instruction()
+        self.assertEqual(interpreter.a, 42)
+
+    def test_tables_read_only(self) -> None:
+        rom = pycom.Controller.Rom.for_entries(pycom.Instructions.entries())
+        _, ticks = pycom.Interpreter.ticks_table(rom)
+        for table in [ticks, pycom.Interpreter.handler_table()]:
+            self.assertIsInstance(table, tuple)
+
+    def test_bne(self) -> None:
+        for zero, program_counter in list[tuple[bool, int]](
+            [
+                (True, 0xBE42),
+                (False, 0xBEF1),
+            ]
+        ):
+            with self.subTest(zero=zero, program_counter=program_counter):
+                interpreter = pycom.Interpreter.for_program(
+                    pycom.Program()
+                    .at(0xBEEF)
+                    .with_entry(pycom.Instructions.BNE(pycom.operands.Relative(0x42)))
+                )
+                interpreter.status = pycom.ALU.ZERO if zero else 0
+                interpreter.program_counter = 0xBEEF
+                interpreter.run_instruction()
+                self.assertEqual(interpreter.program_counter, program_counter)
+
+    def test_matches_computer(self) -> None:
+        for program in list[pycom.Program](
+            [
+                pycom.Program.build(
+                    pycom.Instructions.LDA(pycom.operands.Immediate(0xFF)),
+                    pycom.Instructions.SEC(),
+                    pycom.Instructions.ADC(pycom.operands.Absolute("value")),
+                    pycom.Instructions.STA(pycom.operands.Absolute("result")),
+                    pycom.Instructions.CLC(),
+                    pycom.Instructions.NOP(),
+                    pycom.Instructions.HLT(),
+                    "value",
+                    0x01,
+                    "result",
+                ),
+                pycom.Program.build(
+                    pycom.Instructions.LDX(pycom.operands.Immediate(0)),
+                    pycom.Instructions.DEX(),
+                    pycom.Instructions.INX(),
+                    pycom.Instructions.STX(pycom.operands.Absolute("x")),
+                    pycom.Instructions.LDY(pycom.operands.Absolute("x")),
+                    pycom.Instructions.INY(),
+                    pycom.Instructions.DEY(),
+                    pycom.Instructions.STY(pycom.operands.Absolute("y")),
+                    pycom.Instructions.LDA(pycom.operands.Absolute("y")),
+                    pycom.Instructions.HLT(),
+                    "x",
+                    0,
+                    "y",
+                ),
+                pycom.Program.build(
+                    pycom.Instructions.LDA(pycom.operands.Immediate(0)),
+                    pycom.Instructions.LDX(pycom.operands.Immediate(3)),
+                    pycom.Instructions.LDY(pycom.operands.Immediate(5)),
+                    "loop",
+                    pycom.Instructions.STY(pycom.operands.Absolute("tmp")),
+                    pycom.Instructions.ADC(pycom.operands.Absolute("tmp")),
+                    pycom.Instructions.DEX(),
+                    pycom.Instructions.BNE(pycom.operands.Relative("done")),
+                    pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+                    "done",
+                    pycom.Instructions.HLT(),
+                    "tmp",
+                ),
+            ]
+        ):
+            with self.subTest(program=program):
+                computer = program.as_computer()
+                interpreter = pycom.Interpreter.for_program(program)
+                self.assertEqual(interpreter.run(), computer.run())
+                self.assertEqual(interpreter.a, computer.a)
+                self.assertEqual(interpreter.x, computer.x)
+                self.assertEqual(interpreter.y, computer.y)
+                self.assertEqual(interpreter.status, computer.status)
+                self.assertEqual(interpreter.program_counter, computer.program_counter)
+                self.assertEqual(interpreter.memory.data, computer.memory.data)
+
+    def test_engine(self) -> None:
+        for engine in list[pycom.Engine]([pycom.Computer(), pycom.Interpreter()]):
+            with self.subTest(engine=engine):
+                engine.a = 0x142
+                self.assertEqual(engine.a, 0x42)
@@ -0,0 +1,237 @@
+import dataclasses
+import typing
+from pycom import computer as computer_lib
+from pycom.components import (
+    bus,
+    byte,
+    component,
+    controller,
+    errorable,
+    memory,
+    register,
+)
+from pycom.engines import datapath
+from pycom.instructions import instructions
+from pycom.programs import program
+
+
+class Netlist(errorable.Errorable):
+    BUS = "bus"
+
+    Step: typing.TypeAlias = typing.Callable[[bytearray, memoryview, int], bool]
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Compiled:
+        rom: controller.Controller.Rom
+        slots: typing.Mapping[str, int]
+        controls: typing.Sequence[str]
+        source: str
+        step: "Netlist.Step"
+
+        @property
+        def bits(self) -> typing.Mapping[str, int]:
+            return {control: i for i, control in enumerate(self.controls)}
+
+    class Compiler:
+        def __init__(self, root: component.Component) -> None:
+            self.__datapath = datapath.Datapath(root)
+            self.__slots = {
+                name: slot
+                for slot, name in enumerate([*self.__datapath.registers, Netlist.BUS])
+            }
+
+        @property
+        def slots(self) -> typing.Mapping[str, int]:
+            return self.__slots
+
+        def controls(self, rom: controller.Controller.Rom) -> tuple[str, ...]:
+            return tuple(
+                sorted(
+                    frozenset[str]().union(*[entry.controls for entry in rom.entries]),
+                    key=lambda control: (
+                        self.__datapath.operation(control).phase,
+                        control,
+                    ),
+                )
+            )
+
+        def var(self, name: str) -> str:
+            return f"state[{self.__slots[name]}]"
+
+        def source(self, controls: typing.Sequence[str]) -> str:
+            lines = ["def step(state, data, word):", "    halted = False"]
+            for bit, control in enumerate(controls):
+                statement = self.__datapath.operation(control).statement(
+                    self.var, bus=self.var(Netlist.BUS), halt="halted = True"
+                )
+                lines.append(f"    if word & {1 << bit}:")
+                lines += [f"        {line}" for line in statement.code.split("\n")]
+            lines.append("    return halted")
+            return "\n".join(lines) + "\n"
+
+        def compile(self, rom: controller.Controller.Rom) -> "Netlist.Compiled":
+            controls = self.controls(rom)
+            source = self.source(controls)
+            namespace: dict[str, typing.Any] = {}
+            exec(compile(source, "<netlist>", "exec"), namespace)
+            return Netlist.Compiled(
+                rom=rom,
+                slots=self.slots,
+                controls=controls,
+                source=source,
+                step=namespace["step"],
+            )
+
+    _compiled: typing.ClassVar[typing.Optional["Netlist.Compiled"]] = None
+
+    def __init__(
+        self,
+        *,
+        data: typing.Optional[typing.Mapping[int, int]] = None,
+        compiled: typing.Optional["Netlist.Compiled"] = None,
+    ) -> None:
+        self.compiled = compiled or self.default_compiled()
+        self._rom = self.compiled.rom
+        self._words = self._rom.control_words(tuple(self.compiled.controls))
+        self._step = self.compiled.step
+        self.state = bytearray(len(self.compiled.slots))
+        self.word = 0
+        self.memory = memory.Memory(bus.Bus(), data=data, watchable=False)
+        self._data = self.memory.view()
+        self._instruction_buffer = self.slot("controller.instruction_buffer")
+        self._instruction_counter = self.slot("controller.instruction_counter")
+        self._status = self.slot("alu.status")
+        self.halted = False
+        self.ticks = 0
+
+    @classmethod
+    def default_compiled(cls) -> "Netlist.Compiled":
+        if cls._compiled is None:
+            cls._compiled = cls.Compiler(computer_lib.Computer()).compile(
+                controller.Controller.Rom.for_entries(
+                    instructions.Instructions.entries()
+                )
+            )
+        return cls._compiled
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        cls._compiled = None
+
+    @classmethod
+    def for_computer(cls, computer: computer_lib.Computer) -> "Netlist":
+        netlist = cls(
+            compiled=cls.Compiler(computer).compile(computer.controller.rom),
+        )
+        for name, slot in netlist.compiled.slots.items():
+            if name == cls.BUS:
+                netlist.state[slot] = computer.bus.value
+            else:
+                child = computer.child(name)
+                assert isinstance(child, register.Register)
+                netlist.state[slot] = child.peek()
+        netlist._data[:] = computer.memory.view()
+        netlist.halted = computer.halted
+        return netlist
+
+    def slot(self, name: str) -> int:
+        if name not in self.compiled.slots:
+            raise self.Error(f"unknown slot {name}")
+        return self.compiled.slots[name]
+
+    def __getitem__(self, name: str) -> int:
+        return self.state[self.slot(name)]
+
+    def __setitem__(self, name: str, value: int) -> None:
+        self.state[self.slot(name)] = value % byte.Byte.max()
+
+    @property
+    def bus(self) -> int:
+        return self[self.BUS]
+
+    @property
+    def a(self) -> int:
+        return self["a"]
+
+    @a.setter
+    def a(self, a: int) -> None:
+        self["a"] = a
+
+    @property
+    def x(self) -> int:
+        return self["x"]
+
+    @x.setter
+    def x(self, x: int) -> None:
+        self["x"] = x
+
+    @property
+    def y(self) -> int:
+        return self["y"]
+
+    @y.setter
+    def y(self, y: int) -> None:
+        self["y"] = y
+
+    @property
+    def program_counter(self) -> int:
+        return byte.Byte.unpartition(
+            self["program_counter.high_byte"], self["program_counter.low_byte"]
+        )
+
+    @program_counter.setter
+    def program_counter(self, program_counter: int) -> None:
+        high, low, *_ = byte.Byte.partition(program_counter % memory.Memory.size())
+        self["program_counter.high_byte"] = high
+        self["program_counter.low_byte"] = low
+
+    @property
+    def status(self) -> int:
+        return self.state[self._status]
+
+    @status.setter
+    def status(self, status: int) -> None:
+        self.state[self._status] = status % byte.Byte.max()
+
+    def tick(self) -> None:
+        state = self.state
+        self.word = self._words[
+            self._rom.entry_index(
+                state[self._instruction_buffer],
+                state[self._instruction_counter],
+                state[self._status],
+            )
+        ]
+        if self._step(state, self._data, self.word):
+            self.halted = True
+        self.ticks += 1
+
+    def run_instruction(self) -> int:
+        self.tick()
+        ticks = 1
+        while self.state[self._instruction_counter]:
+            self.tick()
+            ticks += 1
+        return ticks
+
+    def run_instructions(self, num: int) -> int:
+        return sum(self.run_instruction() for _ in range(num))
+
+    def run(self) -> int:
+        ticks = 0
+        self.halted = False
+        while not self.halted:
+            self.tick()
+            ticks += 1
+        return ticks
+
+    @classmethod
+    def build(cls, *entries: program.Entry) -> "Netlist":
+        return cls.for_program(program.Program.build(*entries))
+
+    @classmethod
+    def for_program(cls, program: program.Program) -> "Netlist":
+        return cls(data=program.output().data)
+
+
+instructions.Instructions.on_invalidate(Netlist.clear_cache)
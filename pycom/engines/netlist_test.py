@@ -0,0 +1,79 @@
+import unittest
+import pycom
+
+
+class NetlistTest(unittest.TestCase):
+    def test_empty(self) -> None:
+        netlist = pycom.Netlist.for_program(pycom.Program())
+        self.assertEqual(netlist.run(), pycom.Computer().run())
+        self.assertTrue(netlist.halted)
+
+    def test_watch_unsupported(self) -> None:
+        with self.assertRaises(pycom.Memory.WatchError):
+            pycom.Netlist().memory.watch(0)
+
+    def test_invalid_opcode(self) -> None:
+        with self.assertRaises(pycom.Controller.EntryError):
+            pycom.Netlist.build(0xFF).run_instruction()
+
+    def test_unknown_slot(self) -> None:
+        with self.assertRaises(pycom.Netlist.Error):
+            pycom.Netlist()["invalid"]
+
+    def test_layout(self) -> None:
+        compiled = pycom.Netlist.default_compiled()
+        self.assertEqual(
+            len(pycom.Netlist().state),
+            len(pycom.engines.Datapath(pycom.Computer()).registers) + 1,
+        )
+        self.assertEqual(compiled.slots[pycom.Netlist.BUS], len(compiled.slots) - 1)
+        self.assertSetEqual(
+            set(compiled.bits.values()), set(range(len(compiled.controls)))
+        )
+
+    def test_properties(self) -> None:
+        netlist = pycom.Netlist()
+        netlist.a = 0x101
+        netlist.x = 2
+        netlist.y = 3
+        netlist.program_counter = 0x1234
+        netlist.status = pycom.ALU.CARRY
+        self.assertEqual(netlist["a"], 1)
+        self.assertEqual(
+            (netlist.x, netlist.y, netlist.status), (2, 3, pycom.ALU.CARRY)
+        )
+        self.assertEqual(netlist["program_counter.high_byte"], 0x12)
+        self.assertEqual(netlist.program_counter, 0x1234)
+
+    def test_matches_computer(self) -> None:
+        for workload in [
+            pycom.workloads.multiply(),
+            pycom.workloads.count(5),
+            pycom.workloads.add(2, 3),
+        ]:
+            with self.subTest(workload=workload.name):
+                computer = pycom.Computer.for_program(workload.program)
+                netlist = pycom.Netlist.for_program(workload.program)
+                while not computer.halted:
+                    computer.tick()
+                    netlist.tick()
+                    self.assertEqual(
+                        (netlist.a, netlist.x, netlist.y, netlist.status),
+                        (computer.a, computer.x, computer.y, computer.status),
+                    )
+                self.assertTrue(netlist.halted)
+                self.assertEqual(netlist.program_counter, computer.program_counter)
+                self.assertEqual(netlist.memory.view(), computer.memory.view())
+                workload.check(netlist, netlist.ticks)
+
+    def test_for_computer(self) -> None:
+        computer = pycom.Computer.for_program(pycom.workloads.multiply().program)
+        computer.run_instructions(10)
+        netlist = pycom.Netlist.for_computer(computer)
+        self.assertEqual(netlist.program_counter, computer.program_counter)
+        self.assertEqual(netlist.run(), computer.run())
+        self.assertEqual(
+            (netlist.a, netlist.x, netlist.y, netlist.status),
+            (computer.a, computer.x, computer.y, computer.status),
+        )
+        self.assertEqual(netlist.memory.view(), computer.memory.view())
@@ -0,0 +1,170 @@
+import array
+import bisect
+import dataclasses
+import typing
+from pycom.components import alu, byte, errorable, memory
+from pycom.instructions import instructions
+from pycom.programs import operands
+
+
+class Profiler(errorable.Errorable):
+    Key: typing.TypeAlias = tuple[
+        instructions.Instructions, typing.Type[operands.Operand]
+    ]
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Branch:
+        taken: int
+        not_taken: int
+
+        @property
+        def ratio(self) -> typing.Optional[float]:
+            total = self.taken + self.not_taken
+            return self.taken / total if total else None
+
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Symbol:
+        name: str
+        address: typing.Optional[int]
+        instructions: int
+        cycles: int
+
+    BRANCHES: typing.Mapping[instructions.Instructions, tuple[int, int]] = {
+        instructions.Instructions.BNE: (alu.ALU.ZERO, alu.ALU.ZERO),
+    }
+    UNLABELED = "[unlabeled]"
+
+    def __init__(self) -> None:
+        self.counts = array.array("Q", bytes(8 * byte.Byte.max()))
+        self.cycles = array.array("Q", bytes(8 * byte.Byte.max()))
+        self.addresses = array.array("Q", bytes(8 * memory.Memory.size()))
+        self.address_cycles = array.array("Q", bytes(8 * memory.Memory.size()))
+        self.taken = array.array("Q", bytes(8 * byte.Byte.max()))
+        self.not_taken = array.array("Q", bytes(8 * byte.Byte.max()))
+        self.__branches = {
+            opcode: condition
+            for instruction, condition in self.BRANCHES.items()
+            for opcode in instruction.value.opcodes
+        }
+
+    def reset(self) -> None:
+        for counters in [
+            self.counts,
+            self.cycles,
+            self.addresses,
+            self.address_cycles,
+            self.taken,
+            self.not_taken,
+        ]:
+            counters[:] = array.array("Q", bytes(8 * len(counters)))
+
+    def record(
+        self,
+        program_counter: int,
+        opcode: int,
+        ticks: int,
+        status: int,
+    ) -> None:
+        self.counts[opcode] += 1
+        self.cycles[opcode] += ticks
+        self.addresses[program_counter] += 1
+        self.address_cycles[program_counter] += ticks
+        if opcode in self.__branches:
+            mask, value = self.__branches[opcode]
+            if status & mask == value:
+                self.taken[opcode] += 1
+            else:
+                self.not_taken[opcode] += 1
+
+    @staticmethod
+    def keys() -> typing.Mapping[int, "Profiler.Key"]:
+        return {
+            operand_instance.opcode: (instruction, operand_type)
+            for instruction in instructions.Instructions
+            for operand_type, operand_instance in instruction.value.operand_instances.items()
+        }
+
+    def by_instruction(self) -> typing.Mapping["Profiler.Key", tuple[int, int]]:
+        return {
+            key: (self.counts[opcode], self.cycles[opcode])
+            for opcode, key in self.keys().items()
+            if self.counts[opcode]
+        }
+
+    def hot_addresses(
+        self, num: typing.Optional[int] = None
+    ) -> typing.Sequence[tuple[int, int]]:
+        return sorted(
+            ((address, count) for address, count in enumerate(self.addresses) if count),
+            key=lambda item: (-item[1], item[0]),
+        )[:num]
+
+    def branch(
+        self, instruction: instructions.Instructions = instructions.Instructions.BNE
+    ) -> "Profiler.Branch":
+        return self.Branch(
+            taken=sum(self.taken[opcode] for opcode in instruction.value.opcodes),
+            not_taken=sum(
+                self.not_taken[opcode] for opcode in instruction.value.opcodes
+            ),
+        )
+
+    def symbols(
+        self, labels: typing.Mapping[str, int]
+    ) -> typing.Sequence["Profiler.Symbol"]:
+        sorted_labels = sorted((address, name) for name, address in labels.items())
+        addresses = [address for address, _ in sorted_labels]
+        totals: dict[typing.Optional[tuple[int, str]], tuple[int, int]] = {}
+        for address, count in enumerate(self.addresses):
+            if not count:
+                continue
+            index = bisect.bisect_right(addresses, address) - 1
+            label = sorted_labels[index] if index >= 0 else None
+            instructions, cycles = totals.get(label, (0, 0))
+            totals[label] = (
+                instructions + count,
+                cycles + self.address_cycles[address],
+            )
+        return sorted(
+            (
+                self.Symbol(
+                    name=label[1] if label is not None else self.UNLABELED,
+                    address=label[0] if label is not None else None,
+                    instructions=instructions,
+                    cycles=cycles,
+                )
+                for label, (instructions, cycles) in totals.items()
+            ),
+            key=lambda symbol: (-symbol.cycles, symbol.name),
+        )
+
+    def table(self, labels: typing.Mapping[str, int]) -> str:
+        symbols = self.symbols(labels)
+        total = sum(symbol.cycles for symbol in symbols) or 1
+        rows = [("symbol", "address", "instructions", "cycles", "%")] + [
+            (
+                symbol.name,
+                (
+                    byte.Byte.hex_str(symbol.address)
+                    if symbol.address is not None
+                    else ""
+                ),
+                str(symbol.instructions),
+                str(symbol.cycles),
+                f"{100 * symbol.cycles / total:.1f}",
+            )
+            for symbol in symbols
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                [row[0].ljust(widths[0])]
+                + [cell.rjust(width) for cell, width in zip(row[1:], widths[1:])]
+            )
+            for row in rows
+        )
+
+    def collapsed(self, labels: typing.Mapping[str, int], root: str = "program") -> str:
+        return "".join(
+            f"{root};{symbol.name} {symbol.cycles}\n" for symbol in self.symbols(labels)
+        )
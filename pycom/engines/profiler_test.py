@@ -0,0 +1,132 @@
+import pathlib
+import tempfile
+import unittest
+import pycom
+
+
+class ProfilerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.addCleanup(pycom.Codegen.clear_cache)
+        self.program = pycom.Program.build(
+            pycom.Instructions.LDX(pycom.operands.Immediate(3)),
+            "loop",
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("done")),
+            pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+            "done",
+            pycom.Instructions.HLT(),
+        )
+
+    def engines(self) -> list[pycom.Interpreter | pycom.Codegen]:
+        return [
+            pycom.Interpreter.for_program(self.program),
+            pycom.Codegen(data=self.program.output().data, cache_dir=self.cache_dir),
+        ]
+
+    def test_disabled(self) -> None:
+        for engine in self.engines():
+            with self.subTest(engine=engine):
+                self.assertIsNone(engine.profiler)
+                engine.run()
+
+    def test_profile(self) -> None:
+        for engine in self.engines():
+            with self.subTest(engine=engine):
+                profiler = pycom.Profiler()
+                engine.profiler = profiler
+                ticks = engine.run()
+                self.assertEqual(sum(profiler.cycles), ticks)
+                self.assertDictEqual(
+                    dict(profiler.by_instruction()),
+                    {
+                        (pycom.Instructions.LDX, pycom.operands.Immediate): (1, 6),
+                        (pycom.Instructions.DEX, pycom.operands.None_): (3, 18),
+                        (pycom.Instructions.BNE, pycom.operands.Relative): (
+                            3,
+                            4 + 4 + 6,
+                        ),
+                        (pycom.Instructions.JMP, pycom.operands.Absolute): (2, 20),
+                        (pycom.Instructions.HLT, pycom.operands.None_): (1, 4),
+                    },
+                )
+                self.assertEqual(
+                    profiler.hot_addresses(3),
+                    [
+                        (self.program.label("loop"), 3),
+                        (self.program.label("loop") + 1, 3),
+                        (self.program.label("loop") + 3, 2),
+                    ],
+                )
+                branch = profiler.branch()
+                self.assertEqual(branch, pycom.Profiler.Branch(taken=1, not_taken=2))
+                self.assertAlmostEqual(branch.ratio or 0, 1 / 3)
+
+    def test_branch_to_next(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.LDX(pycom.operands.Immediate(2)),
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("next")),
+            "next",
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("done")),
+            "done",
+            pycom.Instructions.HLT(),
+        )
+        for engine in list[pycom.Interpreter | pycom.Codegen](
+            [
+                pycom.Interpreter.for_program(program),
+                pycom.Codegen(data=program.output().data, cache_dir=self.cache_dir),
+            ]
+        ):
+            with self.subTest(engine=engine):
+                profiler = pycom.Profiler()
+                engine.profiler = profiler
+                engine.run()
+                self.assertEqual(
+                    profiler.branch(), pycom.Profiler.Branch(taken=1, not_taken=1)
+                )
+
+    def test_reset(self) -> None:
+        profiler = pycom.Profiler()
+        profiler.record(0xBEEF, 0xEA, 4, 0)
+        self.assertEqual(profiler.hot_addresses(), [(0xBEEF, 1)])
+        profiler.reset()
+        self.assertEqual(profiler.hot_addresses(), [])
+        self.assertDictEqual(dict(profiler.by_instruction()), {})
+        self.assertIsNone(profiler.branch().ratio)
+
+    def test_symbols(self) -> None:
+        profiler = pycom.Profiler()
+        engine = pycom.Interpreter.for_program(self.program)
+        engine.profiler = profiler
+        engine.run()
+        loop = self.program.label("loop")
+        done = self.program.label("done")
+        self.assertEqual(
+            list(profiler.symbols(self.program.labels)),
+            [
+                pycom.Profiler.Symbol(
+                    name="loop", address=loop, instructions=8, cycles=52
+                ),
+                pycom.Profiler.Symbol(
+                    name=pycom.Profiler.UNLABELED,
+                    address=None,
+                    instructions=1,
+                    cycles=6,
+                ),
+                pycom.Profiler.Symbol(
+                    name="done", address=done, instructions=1, cycles=4
+                ),
+            ],
+        )
+        self.assertEqual(
+            profiler.collapsed(self.program.labels),
+            "program;loop 52\nprogram;[unlabeled] 6\nprogram;done 4\n",
+        )
+        table = profiler.table(self.program.labels).splitlines()
+        self.assertEqual(len(table), 4)
+        self.assertEqual(
+            table[0].split(), ["symbol", "address", "instructions", "cycles", "%"]
+        )
+        self.assertEqual(table[1].split(), ["loop", "0x2", "8", "52", "83.9"])
@@ -0,0 +1,140 @@
+import concurrent.futures
+import dataclasses
+import os
+import typing
+from pycom.components import bus, errorable, memory
+from pycom.engines import engine as engine_lib, interpreter
+from pycom.programs import program
+
+Image: typing.TypeAlias = typing.Mapping[int, int]
+
+Factory: typing.TypeAlias = typing.Callable[..., engine_lib.Engine]
+
+
+class Runner(errorable.Errorable):
+    @dataclasses.dataclass(frozen=True, kw_only=True)
+    class Result:
+        index: int
+        ticks: int
+        halted: bool
+        a: int = 0
+        x: int = 0
+        y: int = 0
+        status: int = 0
+        program_counter: int = 0
+        memory: typing.Mapping[int, int] = dataclasses.field(default_factory=dict)
+        error: typing.Optional[str] = None
+
+    def __init__(
+        self,
+        *,
+        engine: Factory = interpreter.Interpreter,
+        max_cycles: typing.Optional[int] = None,
+        workers: typing.Optional[int] = None,
+        chunk_size: typing.Optional[int] = None,
+    ) -> None:
+        if workers is not None and workers <= 0:
+            raise self.Error(f"invalid number of workers {workers}")
+        if chunk_size is not None and chunk_size <= 0:
+            raise self.Error(f"invalid chunk size {chunk_size}")
+        self.engine = engine
+        self.max_cycles = max_cycles
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    @staticmethod
+    def image(program_or_image: program.Program | Image) -> Image:
+        match program_or_image:
+            case program.Program():
+                return program_or_image.output().data
+            case _:
+                return dict(program_or_image)
+
+    @classmethod
+    def run_one(
+        cls,
+        index: int,
+        image: Image,
+        engine: Factory,
+        max_cycles: typing.Optional[int] = None,
+    ) -> "Runner.Result":
+        machine = engine(data=image)
+        ticks = 0
+        try:
+            while not machine.halted and (max_cycles is None or ticks < max_cycles):
+                ticks += machine.run_instruction()
+        except errorable.Errorable.Error as error:
+            return cls.Result(index=index, ticks=ticks, halted=False, error=str(error))
+        initial = memory.Memory(bus.Bus(), data=image)
+        return cls.Result(
+            index=index,
+            ticks=ticks,
+            halted=machine.halted,
+            a=machine.a,
+            x=machine.x,
+            y=machine.y,
+            status=machine.status,
+            program_counter=machine.program_counter,
+            memory={
+                address: machine.memory[address]
+                for address in sorted(frozenset(initial) | frozenset(machine.memory))
+                if machine.memory[address] != initial[address]
+            },
+        )
+
+    @classmethod
+    def _run_chunk(
+        cls,
+        chunk: typing.Sequence[tuple[int, Image]],
+        engine: Factory,
+        max_cycles: typing.Optional[int],
+    ) -> list["Runner.Result"]:
+        return [cls.run_one(index, image, engine, max_cycles) for index, image in chunk]
+
+    @staticmethod
+    def _warm(engine: Factory) -> None:
+        engine()
+
+    def run(
+        self, programs: typing.Iterable[program.Program | Image]
+    ) -> typing.Iterator["Runner.Result"]:
+        images = [
+            (index, self.image(program_or_image))
+            for index, program_or_image in enumerate(programs)
+        ]
+        if not images:
+            return
+        workers = self.workers or os.cpu_count() or 1
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=self._warm,
+            initargs=(self.engine,),
+        ) as executor:
+            chunk_size = self.chunk_size or max(1, -(-len(images) // (workers * 4)))
+            futures = [
+                executor.submit(
+                    self._run_chunk,
+                    images[start : start + chunk_size],
+                    self.engine,
+                    self.max_cycles,
+                )
+                for start in range(0, len(images), chunk_size)
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                yield from future.result()
+
+
+def run_many(
+    programs: typing.Iterable[program.Program | Image],
+    *,
+    engine: Factory = interpreter.Interpreter,
+    max_cycles: typing.Optional[int] = None,
+    workers: typing.Optional[int] = None,
+    chunk_size: typing.Optional[int] = None,
+) -> typing.Iterator[Runner.Result]:
+    return Runner(
+        engine=engine,
+        max_cycles=max_cycles,
+        workers=workers,
+        chunk_size=chunk_size,
+    ).run(programs)
@@ -0,0 +1,78 @@
+import unittest
+import pycom
+
+
+class RunnerTest(unittest.TestCase):
+    def test_invalid_workers(self) -> None:
+        with self.assertRaises(pycom.Runner.Error):
+            pycom.Runner(workers=0)
+
+    def test_invalid_chunk_size(self) -> None:
+        with self.assertRaises(pycom.Runner.Error):
+            pycom.Runner(chunk_size=0)
+
+    def test_empty(self) -> None:
+        self.assertEqual(list(pycom.run_many([])), [])
+
+    def test_image(self) -> None:
+        program = pycom.Program.build(pycom.Instructions.NOP())
+        self.assertDictEqual(pycom.Runner.image(program), program.output().data)
+        self.assertDictEqual(pycom.Runner.image({1: 2}), {1: 2})
+
+    def test_run_one(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(0x42)),
+            pycom.Instructions.STA(pycom.operands.Absolute("result")),
+            pycom.Instructions.HLT(),
+            "result",
+            0x01,
+        )
+        for engine in list[pycom.engines.runner.Factory](
+            [pycom.Computer, pycom.Interpreter]
+        ):
+            with self.subTest(engine=engine):
+                result = pycom.Runner.run_one(0, program.output().data, engine=engine)
+                self.assertTrue(result.halted)
+                self.assertIsNone(result.error)
+                self.assertEqual(result.a, 0x42)
+                self.assertEqual(result.ticks, 6 + 11 + 4)
+                self.assertDictEqual(
+                    dict(result.memory), {program.label("result"): 0x42}
+                )
+
+    def test_max_cycles(self) -> None:
+        result = pycom.Runner.run_one(
+            0,
+            pycom.Program.build(
+                "loop",
+                pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+            )
+            .output()
+            .data,
+            engine=pycom.Interpreter,
+            max_cycles=100,
+        )
+        self.assertFalse(result.halted)
+        self.assertEqual(result.ticks, 100)
+
+    def test_error(self) -> None:
+        result = pycom.Runner.run_one(
+            0, pycom.Program.build(0xFF).output().data, engine=pycom.Interpreter
+        )
+        self.assertFalse(result.halted)
+        self.assertIsNotNone(result.error)
+
+    def test_run_many(self) -> None:
+        programs = [
+            pycom.Program.build(
+                pycom.Instructions.LDX(pycom.operands.Immediate(i)),
+                pycom.Instructions.HLT(),
+            )
+            for i in range(10)
+        ]
+        results = sorted(
+            pycom.run_many(programs, workers=2, chunk_size=3),
+            key=lambda result: result.index,
+        )
+        self.assertEqual([result.x for result in results], list(range(10)))
+        self.assertTrue(all(result.halted for result in results))
@@ -0,0 +1,140 @@
+import pathlib
+import struct
+import types
+import typing
+import numpy
+import numpy.typing
+from pycom.components import errorable, memory
+from pycom.engines import engine as engine_lib
+
+
+class Trace(errorable.Errorable):
+    class FormatError(errorable.Errorable.Error, ValueError): ...
+
+    MAGIC = b"PYCOMTRC"
+    VERSION = 1
+
+    HEADER = struct.Struct("<8sII")
+    RECORD = struct.Struct("<HB2sBBBBQ")
+    DTYPE = numpy.dtype(
+        [
+            ("program_counter", "<u2"),
+            ("opcode", "u1"),
+            ("operand", "u1", (2,)),
+            ("a", "u1"),
+            ("x", "u1"),
+            ("y", "u1"),
+            ("status", "u1"),
+            ("cycle", "<u8"),
+        ]
+    )
+
+    class Recorder:
+        def __init__(
+            self,
+            path: pathlib.Path,
+            *,
+            chunk_size: int = 1 << 16,
+        ) -> None:
+            if chunk_size <= 0:
+                raise Trace.Error(f"invalid chunk size {chunk_size}")
+            self.path = path
+            self.chunk_size = chunk_size
+            self.__buffer = bytearray(chunk_size * Trace.RECORD.size)
+            self.__offset = 0
+            self.__file = path.open("wb")
+            self.__file.write(
+                Trace.HEADER.pack(Trace.MAGIC, Trace.VERSION, Trace.RECORD.size)
+            )
+            self.count = 0
+            self.cycle = 0
+
+        def __enter__(self) -> "Trace.Recorder":
+            return self
+
+        def __exit__(
+            self,
+            exc_type: typing.Optional[type[BaseException]],
+            exc_value: typing.Optional[BaseException],
+            traceback: typing.Optional[types.TracebackType],
+        ) -> None:
+            self.close()
+
+        def record(self, engine: engine_lib.Engine) -> None:
+            program_counter = engine.program_counter
+            data = engine.memory
+            Trace.RECORD.pack_into(
+                self.__buffer,
+                self.__offset,
+                program_counter,
+                data[program_counter],
+                bytes(
+                    [
+                        data[(program_counter + 1) % memory.Memory.size()],
+                        data[(program_counter + 2) % memory.Memory.size()],
+                    ]
+                ),
+                engine.a,
+                engine.x,
+                engine.y,
+                engine.status,
+                self.cycle,
+            )
+            self.__offset += Trace.RECORD.size
+            self.count += 1
+            if self.__offset == len(self.__buffer):
+                self.flush()
+
+        def run_instruction(self, engine: engine_lib.Engine) -> int:
+            self.record(engine)
+            ticks = engine.run_instruction()
+            self.cycle += ticks
+            return ticks
+
+        def run(
+            self,
+            engine: engine_lib.Engine,
+            max_instructions: typing.Optional[int] = None,
+        ) -> int:
+            ticks = 0
+            instructions = 0
+            while not engine.halted and (
+                max_instructions is None or instructions < max_instructions
+            ):
+                ticks += self.run_instruction(engine)
+                instructions += 1
+            return ticks
+
+        def flush(self) -> None:
+            self.__file.write(memoryview(self.__buffer)[: self.__offset])
+            self.__file.flush()
+            self.__offset = 0
+
+        def close(self) -> None:
+            if not self.__file.closed:
+                self.flush()
+                self.__file.close()
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> numpy.typing.NDArray[typing.Any]:
+        with path.open("rb") as file:
+            header = file.read(cls.HEADER.size)
+        if len(header) != cls.HEADER.size:
+            raise cls.FormatError(f"truncated trace header in {path}")
+        magic, version, record_size = cls.HEADER.unpack(header)
+        if magic != cls.MAGIC:
+            raise cls.FormatError(f"not a trace file: {path}")
+        if version != cls.VERSION or record_size != cls.DTYPE.itemsize:
+            raise cls.FormatError(
+                f"unsupported trace version {version} with record size {record_size} in {path}"
+            )
+        count = (path.stat().st_size - cls.HEADER.size) // record_size
+        if not count:
+            return numpy.zeros(0, dtype=cls.DTYPE)
+        return numpy.memmap(
+            path,
+            dtype=cls.DTYPE,
+            mode="r",
+            offset=cls.HEADER.size,
+            shape=(count,),
+        )
@@ -0,0 +1,69 @@
+import pathlib
+import tempfile
+import unittest
+import numpy
+import pycom
+
+
+class TraceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.path = (
+            pathlib.Path(self.enterContext(tempfile.TemporaryDirectory())) / "trace.bin"
+        )
+
+    def test_dtype(self) -> None:
+        self.assertEqual(pycom.Trace.DTYPE.itemsize, pycom.Trace.RECORD.size)
+
+    def test_invalid_chunk_size(self) -> None:
+        with self.assertRaises(pycom.Trace.Error):
+            pycom.Trace.Recorder(self.path, chunk_size=0)
+
+    def test_empty(self) -> None:
+        with pycom.Trace.Recorder(self.path):
+            pass
+        self.assertEqual(len(pycom.Trace.load(self.path)), 0)
+
+    def test_invalid_file(self) -> None:
+        for data in [b"", b"x" * pycom.Trace.HEADER.size]:
+            with self.subTest(data=data):
+                self.path.write_bytes(data)
+                with self.assertRaises(pycom.Trace.FormatError):
+                    pycom.Trace.load(self.path)
+
+    def test_record(self) -> None:
+        program = pycom.Program.build(
+            pycom.Instructions.LDX(pycom.operands.Immediate(3)),
+            "loop",
+            pycom.Instructions.DEX(),
+            pycom.Instructions.BNE(pycom.operands.Relative("done")),
+            pycom.Instructions.JMP(pycom.operands.Absolute("loop")),
+            "done",
+            pycom.Instructions.HLT(),
+        )
+        for engine in list[pycom.Engine](
+            [program.as_computer(), pycom.Interpreter.for_program(program)]
+        ):
+            with self.subTest(engine=engine):
+                with pycom.Trace.Recorder(self.path, chunk_size=4) as recorder:
+                    ticks = recorder.run(engine)
+                trace = pycom.Trace.load(self.path)
+                self.assertEqual(len(trace), 10)
+                self.assertEqual(recorder.count, 10)
+                self.assertEqual(recorder.cycle, ticks)
+                numpy.testing.assert_array_equal(
+                    trace["program_counter"],
+                    [0, 2, 3, 5, 2, 3, 5, 2, 3, 8],
+                )
+                numpy.testing.assert_array_equal(
+                    trace["x"], [0, 3, 2, 2, 2, 1, 1, 1, 0, 0]
+                )
+                numpy.testing.assert_array_equal(trace["operand"][0], [3, 0xCA])
+                self.assertEqual(trace["cycle"][-1], ticks - 4)
+                self.assertEqual(
+                    trace["opcode"][-1], pycom.Instructions.HLT.value.opcodes[0]
+                )
+
+    def test_max_instructions(self) -> None:
+        with pycom.Trace.Recorder(self.path) as recorder:
+            recorder.run(pycom.Interpreter(), max_instructions=0)
+        self.assertEqual(len(pycom.Trace.load(self.path)), 0)
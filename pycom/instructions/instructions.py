@@ -1,3 +1,4 @@
+import collections
 import enum
 import typing
 from pycom.components import alu, byte, controller, errorable
@@ -8,6 +9,10 @@ from pycom.instructions import instruction
 class DuplicateOpcodeError(errorable.Errorable.Error): ...
 
 
+_entries: dict[type["Instructions"], frozenset[controller.Controller.Entry]] = {}
+_invalidation_hooks: list[typing.Callable[[], None]] = []
+
+
 class Instructions(errorable.Errorable, enum.Enum):
     HLT = instruction.Instruction.build(
         opcode=0x00,
@@ -231,11 +236,11 @@ class Instructions(errorable.Errorable, enum.Enum):
 
     @classmethod
     def validate(cls) -> None:
-        opcodes: list[int] = sum(
-            [list(instruction.value.opcodes) for instruction in cls], []
+        opcodes = collections.Counter(
+            opcode for instruction in cls for opcode in instruction.value.opcodes
         )
         duplicate_opcodes: frozenset[int] = frozenset(
-            opcode for opcode in opcodes if opcodes.count(opcode) > 1
+            opcode for opcode, count in opcodes.items() if count > 1
         )
         if duplicate_opcodes:
             raise DuplicateOpcodeError(
@@ -244,8 +249,24 @@ class Instructions(errorable.Errorable, enum.Enum):
 
     @classmethod
     def entries(cls) -> frozenset[controller.Controller.Entry]:
-        cls.validate()
-        return frozenset().union(*[instruction.value.entries() for instruction in cls])
+        if cls not in _entries:
+            cls.validate()
+            _entries[cls] = frozenset().union(
+                *[instruction.value.entries() for instruction in cls]
+            )
+        return _entries[cls]
+
+    @classmethod
+    def invalidate(cls) -> None:
+        _entries.pop(cls, None)
+        controller.Controller.Rom.clear_cache()
+        for hook in _invalidation_hooks:
+            hook()
+
+    @staticmethod
+    def on_invalidate(hook: typing.Callable[[], None]) -> None:
+        if hook not in _invalidation_hooks:
+            _invalidation_hooks.append(hook)
 
     @typing.overload
     def __call__(self) -> "statement.Statement": ...
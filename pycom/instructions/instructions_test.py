@@ -1,3 +1,5 @@
+import pathlib
+import tempfile
 import typing
 import unittest
 import pycom
@@ -48,3 +50,62 @@ class InstructionsTest(unittest.TestCase):
                         instructions(),
                         expected,
                     )
+
+    def test_entries_cached(self) -> None:
+        self.assertIs(pycom.Instructions.entries(), pycom.Instructions.entries())
+
+    def test_invalidate(self) -> None:
+        entries = pycom.Instructions.entries()
+        rom = pycom.Controller.Rom.for_entries(entries)
+        pycom.Instructions.invalidate()
+        self.assertIsNot(pycom.Instructions.entries(), entries)
+        self.assertEqual(pycom.Instructions.entries(), entries)
+        self.assertIsNot(pycom.Controller.Rom.for_entries(entries), rom)
+
+    def test_invalidate_engines(self) -> None:
+        cache_dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        steps = (
+            pycom.Instructions.NOP.value.operand_instance(pycom.operands.None_)
+            .status_instances[pycom.Instruction.OperandInstance.StatusInstanceKey()]
+            .steps
+        )
+        program = pycom.Program.build(
+            pycom.Instructions.LDA(pycom.operands.Immediate(0x42)),
+            pycom.Instructions.NOP(),
+            pycom.Instructions.HLT(),
+        )
+        for warm in list[pycom.Engine](
+            [
+                pycom.Interpreter.for_program(program),
+                pycom.Codegen(data=program.output().data, cache_dir=cache_dir),
+                pycom.Netlist.for_program(program),
+            ]
+        ):
+            warm.run()
+        steps += [
+            pycom.Instruction.step("a.out", "x.in"),
+            pycom.Instruction.step("x.out", "y.in"),
+        ]
+        self.addCleanup(pycom.Instructions.invalidate)
+        self.addCleanup(steps.clear)
+        pycom.Instructions.invalidate()
+        engines: list[pycom.Engine] = [
+            pycom.Computer.for_program(program),
+            pycom.Interpreter.for_program(program),
+            pycom.Codegen(data=program.output().data, cache_dir=cache_dir),
+            pycom.Netlist.for_program(program),
+        ]
+        for engine in engines:
+            with self.subTest(engine=type(engine).__name__):
+                engine.run_instruction()
+                self.assertEqual(engine.run_instruction(), 5)
+        for engine in [engines[0], *engines[2:]]:
+            with self.subTest(engine=type(engine).__name__):
+                self.assertEqual((engine.x, engine.y), (0x42, 0x42))
+        batch = pycom.Batch.for_program(program, 1)
+        batch.run()
+        self.assertEqual((batch.x[0], batch.y[0]), (0x42, 0x42))
+        self.assertEqual(batch.ticks[0], 6 + 5 + 4)
+
+    def test_computers_share_rom(self) -> None:
+        self.assertIs(pycom.Computer().controller.rom, pycom.Computer().controller.rom)
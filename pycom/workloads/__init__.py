@@ -0,0 +1,11 @@
+from .workload import Workload
+from .workloads import (
+    count,
+    memcpy,
+    multiply,
+    nested_countdown,
+    fill,
+    add,
+    jump_table,
+    corpus,
+)
@@ -0,0 +1,54 @@
+import dataclasses
+import typing
+from pycom.components import byte, errorable
+from pycom.engines import engine as engine_lib
+from pycom.programs import program
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Workload(errorable.Errorable):
+    class MismatchError(errorable.Errorable.Error, AssertionError): ...
+
+    name: str
+    program: program.Program
+    a: typing.Optional[int] = None
+    x: typing.Optional[int] = None
+    y: typing.Optional[int] = None
+    status: typing.Optional[int] = None
+    ticks: typing.Optional[int] = None
+    memory: typing.Mapping[int, int] = dataclasses.field(default_factory=dict)
+
+    def mismatches(
+        self, engine: engine_lib.Engine, ticks: typing.Optional[int] = None
+    ) -> typing.Sequence[str]:
+        mismatches = [
+            f"{name}: expected {byte.Byte.hex_str(expected)} got {byte.Byte.hex_str(actual)}"
+            for name, expected, actual in [
+                ("a", self.a, engine.a),
+                ("x", self.x, engine.x),
+                ("y", self.y, engine.y),
+                ("status", self.status, engine.status),
+            ]
+            if expected is not None and expected != actual
+        ]
+        if self.ticks is not None and ticks is not None and self.ticks != ticks:
+            mismatches.append(f"ticks: expected {self.ticks} got {ticks}")
+        mismatches += [
+            f"memory[{byte.Byte.hex_str(address)}]: expected {byte.Byte.hex_str(expected)} got {byte.Byte.hex_str(engine.memory[address])}"
+            for address, expected in sorted(self.memory.items())
+            if engine.memory[address] != expected
+        ]
+        return mismatches
+
+    def check(
+        self, engine: engine_lib.Engine, ticks: typing.Optional[int] = None
+    ) -> None:
+        if mismatches := self.mismatches(engine, ticks):
+            raise self.MismatchError(
+                f"workload {self.name} failed: {'; '.join(mismatches)}"
+            )
+
+    def run(self, engine: engine_lib.Engine) -> int:
+        ticks = engine.run()
+        self.check(engine, ticks)
+        return ticks
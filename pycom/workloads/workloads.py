@@ -0,0 +1,271 @@
+import typing
+from pycom.instructions import instructions
+from pycom.programs import operands, program
+from pycom.workloads import workload
+
+
+def count(num: int = 0xFF) -> workload.Workload:
+    return workload.Workload(
+        name=f"count_{num}",
+        program=program.Program.build(
+            instructions.Instructions.LDX(operands.Immediate(num)),
+            "loop",
+            instructions.Instructions.DEX(),
+            instructions.Instructions.BNE(operands.Relative("done")),
+            instructions.Instructions.JMP(operands.Absolute("loop")),
+            "done",
+            instructions.Instructions.HLT(),
+        ),
+        x=0,
+        ticks=6 + num * (6 + 4) + (num - 1) * 10 + 2 + 4,
+    )
+
+
+def memcpy(
+    size: int = 0x100,
+    *,
+    source: int = 0x4000,
+    destination: int = 0x8000,
+) -> workload.Workload:
+    data = [(i * 7 + 1) % 0x100 for i in range(size)]
+    return workload.Workload(
+        name=f"memcpy_{size}",
+        program=program.Program.build(
+            *[
+                statement
+                for i in range(size)
+                for statement in (
+                    instructions.Instructions.LDA(operands.Absolute(source + i)),
+                    instructions.Instructions.STA(operands.Absolute(destination + i)),
+                )
+            ],
+            instructions.Instructions.HLT(),
+        )
+        .at(source)
+        .with_values(*data),
+        memory={destination + i: value for i, value in enumerate(data)},
+        ticks=size * 22 + 4,
+    )
+
+
+def multiply(lhs: int = 0x0F, rhs: int = 0x11) -> workload.Workload:
+    return workload.Workload(
+        name=f"multiply_{lhs}_{rhs}",
+        program=program.Program.build(
+            instructions.Instructions.CLC(),
+            instructions.Instructions.LDA(operands.Immediate(0)),
+            instructions.Instructions.LDX(operands.Immediate(rhs)),
+            "loop",
+            instructions.Instructions.ADC(operands.Absolute("lhs")),
+            instructions.Instructions.DEX(),
+            instructions.Instructions.BNE(operands.Relative("done")),
+            instructions.Instructions.JMP(operands.Absolute("loop")),
+            "done",
+            instructions.Instructions.STA(operands.Absolute("result")),
+            instructions.Instructions.HLT(),
+            "lhs",
+            lhs,
+            "result",
+        ),
+        a=lhs * rhs % 0x100,
+        x=0,
+    )
+
+
+def nested_countdown(outer: int = 0x10, inner: int = 0xFF) -> workload.Workload:
+    return workload.Workload(
+        name=f"nested_countdown_{outer}_{inner}",
+        program=program.Program.build(
+            instructions.Instructions.LDY(operands.Immediate(outer)),
+            "outer",
+            instructions.Instructions.LDX(operands.Immediate(inner)),
+            "inner",
+            instructions.Instructions.DEX(),
+            instructions.Instructions.BNE(operands.Relative("inner_done")),
+            instructions.Instructions.JMP(operands.Absolute("inner")),
+            "inner_done",
+            instructions.Instructions.DEY(),
+            instructions.Instructions.BNE(operands.Relative("done")),
+            instructions.Instructions.JMP(operands.Absolute("outer")),
+            "done",
+            instructions.Instructions.HLT(),
+        ),
+        x=0,
+        y=0,
+    )
+
+
+def _patched(
+    build: typing.Callable[[int], program.Program], label: str
+) -> program.Program:
+    return build(build(0).label(label))
+
+
+def fill(
+    size: int = 0xFF,
+    *,
+    value: int = 0xA5,
+    start: int = 0x6000,
+) -> workload.Workload:
+    def build(address: int) -> program.Program:
+        return program.Program.build(
+            instructions.Instructions.LDX(operands.Immediate(size)),
+            "loop",
+            instructions.Instructions.LDA(operands.Immediate(value)),
+            "store",
+            instructions.Instructions.STA(operands.Absolute(start)),
+            instructions.Instructions.LDA(operands.Absolute(address + 2)),
+            instructions.Instructions.CLC(),
+            instructions.Instructions.ADC(operands.Immediate(1)),
+            instructions.Instructions.STA(operands.Absolute(address + 2)),
+            instructions.Instructions.LDA(operands.Absolute(address + 1)),
+            instructions.Instructions.ADC(operands.Immediate(0)),
+            instructions.Instructions.STA(operands.Absolute(address + 1)),
+            instructions.Instructions.DEX(),
+            instructions.Instructions.BNE(operands.Relative("done")),
+            instructions.Instructions.JMP(operands.Absolute("loop")),
+            "done",
+            instructions.Instructions.HLT(),
+        )
+
+    return workload.Workload(
+        name=f"fill_{size}",
+        program=_patched(build, "store"),
+        x=0,
+        memory={start + i: value for i in range(size)},
+    )
+
+
+def add(
+    size: int = 8,
+    times: int = 100,
+    *,
+    lhs: int = 0x0123456789ABCDEF,
+    rhs: int = 0x1111111111111111,
+    address: int = 0x7000,
+) -> workload.Workload:
+    modulus = 0x100**size
+    result = (lhs + rhs * times) % modulus
+    return workload.Workload(
+        name=f"add_{size}_{times}",
+        program=program.Program.build(
+            instructions.Instructions.LDX(operands.Immediate(times)),
+            "loop",
+            instructions.Instructions.CLC(),
+            *[
+                statement
+                for i in range(size)
+                for statement in (
+                    instructions.Instructions.LDA(operands.Absolute(address + i)),
+                    instructions.Instructions.ADC(
+                        operands.Absolute(address + size + i)
+                    ),
+                    instructions.Instructions.STA(operands.Absolute(address + i)),
+                )
+            ],
+            instructions.Instructions.DEX(),
+            instructions.Instructions.BNE(operands.Relative("done")),
+            instructions.Instructions.JMP(operands.Absolute("loop")),
+            "done",
+            instructions.Instructions.HLT(),
+        )
+        .at(address)
+        .with_values(*(lhs % modulus).to_bytes(size, "little"))
+        .with_values(*(rhs % modulus).to_bytes(size, "little")),
+        x=0,
+        memory=dict(enumerate(result.to_bytes(size, "little"), start=address)),
+    )
+
+
+def jump_table(
+    entries: int = 0x10,
+    passes: int = 0x20,
+    *,
+    table: int = 0x0400,
+) -> workload.Workload:
+    def build(address: int) -> program.Program:
+        return (
+            program.Program.build(
+                instructions.Instructions.LDY(operands.Immediate(passes)),
+                "pass",
+                instructions.Instructions.LDA(operands.Immediate(table % 0x100)),
+                instructions.Instructions.STA(operands.Absolute("slot")),
+                instructions.Instructions.LDA(operands.Immediate(table >> 8)),
+                instructions.Instructions.STA(operands.Absolute("slot_high")),
+                instructions.Instructions.LDX(operands.Immediate(entries)),
+                "loop",
+                instructions.Instructions.LDA(operands.Absolute("slot")),
+                instructions.Instructions.STA(operands.Absolute(address + 2)),
+                instructions.Instructions.LDA(operands.Absolute("slot_high")),
+                instructions.Instructions.STA(operands.Absolute(address + 1)),
+                "dispatch",
+                instructions.Instructions.JMP(operands.Absolute(table)),
+                "next",
+                instructions.Instructions.LDA(operands.Absolute("slot")),
+                instructions.Instructions.CLC(),
+                instructions.Instructions.ADC(operands.Immediate(3)),
+                instructions.Instructions.STA(operands.Absolute("slot")),
+                instructions.Instructions.LDA(operands.Absolute("slot_high")),
+                instructions.Instructions.ADC(operands.Immediate(0)),
+                instructions.Instructions.STA(operands.Absolute("slot_high")),
+                instructions.Instructions.DEX(),
+                instructions.Instructions.BNE(operands.Relative("pass_done")),
+                instructions.Instructions.JMP(operands.Absolute("loop")),
+                "pass_done",
+                instructions.Instructions.DEY(),
+                instructions.Instructions.BNE(operands.Relative("done")),
+                instructions.Instructions.JMP(operands.Absolute("pass")),
+                "done",
+                instructions.Instructions.HLT(),
+                "slot",
+                0,
+                "slot_high",
+                0,
+                "total",
+                0,
+            )
+            .at(table)
+            .with_entries(
+                *[
+                    instructions.Instructions.JMP(operands.Absolute(f"handler_{i}"))
+                    for i in range(entries)
+                ]
+            )
+            .with_entries(
+                *[
+                    statement
+                    for i in range(entries)
+                    for statement in (
+                        f"handler_{i}",
+                        instructions.Instructions.LDA(operands.Absolute("total")),
+                        instructions.Instructions.CLC(),
+                        instructions.Instructions.ADC(operands.Immediate(i + 1)),
+                        instructions.Instructions.STA(operands.Absolute("total")),
+                        instructions.Instructions.JMP(operands.Absolute("next")),
+                    )
+                ]
+            )
+        )
+
+    built = _patched(build, "dispatch")
+    return workload.Workload(
+        name=f"jump_table_{entries}_{passes}",
+        program=built,
+        x=0,
+        y=0,
+        memory={
+            built.label("total"): passes * entries * (entries + 1) // 2 % 0x100,
+        },
+    )
+
+
+def corpus() -> typing.Sequence[workload.Workload]:
+    return [
+        count(),
+        memcpy(),
+        multiply(),
+        nested_countdown(),
+        fill(),
+        add(),
+        jump_table(),
+    ]
@@ -0,0 +1,72 @@
+import os
+import pathlib
+import tempfile
+import unittest
+import pycom
+
+
+class WorkloadsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cache_dir = pathlib.Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.addCleanup(pycom.Codegen.clear_cache)
+
+    def engines(self, workload: pycom.workloads.Workload) -> list[pycom.Engine]:
+        return [
+            workload.program.as_computer(),
+            pycom.Interpreter.for_program(workload.program),
+            pycom.Codegen(
+                data=workload.program.output().data, cache_dir=self.cache_dir
+            ),
+        ]
+
+    def check(self, *workloads: pycom.workloads.Workload) -> None:
+        for workload in workloads:
+            for engine in self.engines(workload):
+                with self.subTest(workload=workload.name, engine=engine):
+                    workload.run(engine)
+
+    def test_workloads(self) -> None:
+        self.check(
+            pycom.workloads.count(5),
+            pycom.workloads.memcpy(8),
+            pycom.workloads.multiply(3, 5),
+            pycom.workloads.nested_countdown(2, 3),
+            pycom.workloads.fill(8),
+            pycom.workloads.add(2, 3),
+            pycom.workloads.jump_table(3, 2),
+        )
+
+    def test_fill_crosses_page(self) -> None:
+        self.check(pycom.workloads.fill(0x20, start=0x60F0))
+
+    def test_jump_table_crosses_page(self) -> None:
+        self.check(pycom.workloads.jump_table(4, 1, table=0x04FA))
+
+    @unittest.skipUnless(
+        os.environ.get("PYCOM_SLOW_TESTS"), "set PYCOM_SLOW_TESTS to run"
+    )
+    def test_corpus(self) -> None:
+        self.check(*pycom.workloads.corpus())
+
+    def test_mismatch(self) -> None:
+        workload = pycom.workloads.Workload(
+            name="mismatch",
+            program=pycom.Program.build(
+                pycom.Instructions.LDA(pycom.operands.Immediate(1)),
+            ),
+            a=2,
+            memory={0xBEEF: 1},
+            ticks=0,
+        )
+        with self.assertRaisesRegex(
+            pycom.workloads.Workload.MismatchError, "a: expected 0x2 got 0x1"
+        ):
+            workload.run(pycom.Interpreter.for_program(workload.program))
+        self.assertEqual(
+            len(
+                workload.mismatches(
+                    pycom.Interpreter.for_program(workload.program), ticks=1
+                )
+            ),
+            3,
+        )